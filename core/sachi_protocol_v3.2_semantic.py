@@ -55,35 +55,766 @@ import numpy as np
 from typing import List, Dict, Tuple, Optional, Set, Callable, Union
 from dataclasses import dataclass, field
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+import glob
+import hashlib
+import importlib.util
+import itertools
 import json
+import os
+import re
+import threading
 import warnings
 
-# Try to import semantic libraries
 try:
-    from sentence_transformers import SentenceTransformer
-    SEMANTIC_AVAILABLE = True
-except ImportError:
-    SEMANTIC_AVAILABLE = False
-    warnings.warn(
-        "sentence-transformers not available. "
-        "Install with: pip install sentence-transformers"
-    )
+    import fcntl
+except ImportError:  # Non-POSIX: store writes are only serialized in-process
+    fcntl = None
+
+# Semantic libraries (sentence-transformers pulls in torch) are imported on
+# first use; importing this module only checks that they are installed
+SEMANTIC_AVAILABLE = importlib.util.find_spec('sentence_transformers') is not None
+_SentenceTransformer = None
+_import_lock = threading.Lock()
+
+
+def _sentence_transformer_class():
+    """SentenceTransformer, importing sentence-transformers on first call."""
+    global _SentenceTransformer
+    with _import_lock:
+        if _SentenceTransformer is None:
+            from sentence_transformers import SentenceTransformer
+            _SentenceTransformer = SentenceTransformer
+    return _SentenceTransformer
+
 
 # Import base classes from v3.1
-import sys
-sys.path.insert(0, '/home/user')
 from sachi_protocol_v3 import (
     Belief, Interaction, ConsistencyReport,
     ActionClassifier, RecoveryMonitor, GrowthTracker, 
-    ValueConsistencyMonitor
+    ValueConsistencyMonitor,
+    checker_state, load_checker_state, encode_strings, decode_strings
 )
 
 
+# ============================================================================
+# Embedding Backends
+# ============================================================================
+
+class EmbeddingBackend:
+    """
+    Source of text embeddings for SemanticConsistencyEngine.
+    
+    Subclasses implement encode() and dimension; name identifies the
+    embedding space, so caches and stores never mix vectors of different
+    backends or configurations.
+    """
+    
+    name = 'embedding-backend'
+    
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension."""
+        raise NotImplementedError
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether encode() can run without a slow load first."""
+        return True
+    
+    def load(self):
+        """Do any slow initialization now (see SemanticConsistencyEngine.warm_up)."""
+    
+    def encode(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Embed texts.
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Texts per forward pass, for batched models
+            
+        Returns:
+            (len(texts), dimension) float32 embeddings
+        """
+        raise NotImplementedError
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """
+    Transformer sentence embeddings (sentence-transformers).
+    
+    sentence-transformers is imported and the model loaded on first use.
+    """
+    
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
+        """
+        Initialize the backend.
+        
+        Args:
+            model_name: Sentence transformer model name
+        """
+        if not SEMANTIC_AVAILABLE:
+            raise ImportError(
+                "Semantic features require sentence-transformers. "
+                "Install with: pip install sentence-transformers"
+            )
+        self.name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+    
+    @property
+    def model(self):
+        """The SentenceTransformer, imported and loaded on first access."""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    model = _sentence_transformer_class()(self.name)
+                    print(f"✓ Loaded {self.name} "
+                          f"({model.get_sentence_embedding_dimension()} dim)")
+                    self._model = model
+        return self._model
+    
+    @property
+    def dimension(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+    
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+    
+    def load(self):
+        self.model
+    
+    def encode(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        return self.model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+
+
+class HashingVectorizerBackend(EmbeddingBackend):
+    """
+    Dependency-free TF-IDF vectors of hashed word and character n-grams.
+    
+    Features are word n-grams and character n-grams of the lowercased
+    text (padded with spaces, so word edges count), hashed into a fixed
+    number of signed buckets. A word is a run of ASCII letters, digits,
+    underscores or non-ASCII bytes. Both kinds of n-gram are hashed for a
+    whole batch at once with vectorized polynomials over the UTF-8 bytes.
+    TF-IDF weighting uses document frequencies from fit(); an unfitted
+    backend weights by term frequency alone. Vectors are L2-normalized.
+    
+    Lexical rather than semantic: paraphrases that share no words or word
+    pieces score as unrelated. Meant for high-volume tiers and machines
+    without sentence-transformers.
+    """
+    
+    _PRIME = np.uint64(1099511628211)
+    _PRIME_INVERSE = np.uint64(pow(1099511628211, -1, 1 << 64))
+    _WORD_BYTES = np.array([chr(b).isalnum() or b == ord('_') or b >= 0x80
+                            for b in range(256)])
+    
+    def __init__(self, dimension: int = 1024,
+                 word_ngrams: Tuple[int, int] = (1, 2),
+                 char_ngrams: Tuple[int, int] = (3, 5)):
+        """
+        Initialize the backend.
+        
+        Args:
+            dimension: Number of hash buckets (embedding dimension)
+            word_ngrams: (min, max) word n-gram lengths
+            char_ngrams: (min, max) character (UTF-8 byte) n-gram lengths
+        """
+        self._dimension = dimension
+        self.word_ngrams = word_ngrams
+        self.char_ngrams = char_ngrams
+        self.idf = np.ones(dimension, dtype=np.float32)
+        self.fitted_documents = 0
+        self.encoded_documents = 0
+    
+    @property
+    def name(self) -> str:
+        """Configuration (and fitted IDF) fingerprint."""
+        config = (f"hashing-{self._dimension}"
+                  f"-w{self.word_ngrams[0]}{self.word_ngrams[1]}"
+                  f"-c{self.char_ngrams[0]}{self.char_ngrams[1]}")
+        if not self.fitted_documents:
+            return config
+        return f"{config}-idf{hashlib.sha1(self.idf.tobytes()).hexdigest()[:8]}"
+    
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+    
+    @staticmethod
+    def _mix(hashes: np.ndarray) -> np.ndarray:
+        """splitmix64 finalizer, so every bit depends on every input bit."""
+        hashes = hashes ^ (hashes >> np.uint64(30))
+        hashes *= np.uint64(0xbf58476d1ce4e5b9)
+        hashes ^= hashes >> np.uint64(27)
+        hashes *= np.uint64(0x94d049bb133111eb)
+        hashes ^= hashes >> np.uint64(31)
+        return hashes
+    
+    def _features(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """(document, 64-bit feature hash) of every n-gram occurrence."""
+        documents, hashes = [], []
+        lowered = [text.lower() for text in texts]
+        
+        # Character n-grams over the concatenated, space-padded bytes
+        encoded = [f" {text} ".encode('utf-8') for text in lowered]
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8).astype(np.uint64)
+        owner = np.repeat(np.arange(len(texts)), [len(e) for e in encoded])
+        low, high = self.char_ngrams
+        rolling = data.copy()
+        for n in range(2, high + 1):
+            count = len(data) - n + 1
+            if count <= 0:
+                break
+            rolling = rolling[:count] * self._PRIME + data[n - 1:]
+            if n >= low:
+                same = owner[:count] == owner[n - 1:]
+                documents.append(owner[:count][same])
+                hashes.append(rolling[same] ^ np.uint64(n))
+        if low <= 1:
+            documents.append(owner)
+            hashes.append(data ^ np.uint64(1))
+        
+        # Word n-grams: word k hashes to sum_i b_i P^(end_k - 1 - i), i.e.
+        # P^(end_k - 1) times a segment sum of b_i P^-i
+        word = self._WORD_BYTES[data.astype(np.uint8)]
+        starts = np.flatnonzero(word[1:] & ~word[:-1]) + 1
+        ends = np.flatnonzero(word[:-1] & ~word[1:]) + 1
+        owner = owner[starts]
+        powers = np.cumprod(np.full(len(data), self._PRIME))
+        inverse_powers = np.cumprod(np.full(len(data), self._PRIME_INVERSE))
+        weighted = data * inverse_powers
+        weighted[~word] = 0
+        data = (np.add.reduceat(weighted, starts) * powers[ends - 1]
+                if len(starts) else np.zeros(0, dtype=np.uint64))
+        low, high = self.word_ngrams
+        rolling = data.copy()
+        for n in range(1, high + 1):
+            count = len(data) - n + 1
+            if count <= 0:
+                break
+            if n > 1:
+                rolling = rolling[:count] * self._PRIME + data[n - 1:]
+            if n >= low:
+                same = owner[:count] == owner[n - 1:]
+                documents.append(owner[:count][same])
+                # Separate words from character n-grams of the same bytes
+                hashes.append(rolling[same] ^ np.uint64((n << 8) | 0xff))
+        
+        if not documents:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint64)
+        return np.concatenate(documents), self._mix(np.concatenate(hashes))
+    
+    def fit(self, corpus: List[str]) -> 'HashingVectorizerBackend':
+        """
+        Learn IDF weights from a corpus.
+        
+        Fitting changes name, which keys the disk store and saved caches.
+        Fit before the first encode(): vectors already handed out (to an
+        engine's cache or belief matrix) would no longer match, so refitting
+        after that raises; fit a new backend instead.
+        
+        Args:
+            corpus: Representative texts (e.g. the belief system)
+            
+        Returns:
+            self
+            
+        Raises:
+            RuntimeError: If this backend has already encoded texts
+        """
+        if self.encoded_documents:
+            raise RuntimeError(
+                f"{self.name} has already encoded {self.encoded_documents} texts; "
+                "fit a new HashingVectorizerBackend instead"
+            )
+        documents, hashes = self._features(corpus)
+        buckets = (hashes % np.uint64(self._dimension)).astype(np.int64)
+        present = np.unique(documents * self._dimension + buckets) % self._dimension
+        frequency = np.bincount(present, minlength=self._dimension)
+        self.idf = (np.log((1 + len(corpus)) / (1 + frequency)) + 1).astype(np.float32)
+        self.fitted_documents = len(corpus)
+        return self
+    
+    def encode(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        self.encoded_documents += len(texts)
+        documents, hashes = self._features(texts)
+        buckets = (hashes % np.uint64(self._dimension)).astype(np.int64)
+        # Top bit picks the sign, so collisions cancel out on average
+        signs = np.where(hashes >> np.uint64(63), -1.0, 1.0)
+        vectors = np.bincount(
+            documents * self._dimension + buckets,
+            weights=signs * self.idf[buckets],
+            minlength=len(texts) * self._dimension
+        ).reshape(len(texts), self._dimension).astype(np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, norms, out=vectors, where=norms > 0)
+
+
 # ============================================================================
 # Semantic Consistency Functions
 # ============================================================================
 
+# Storage types for cached and matrix embeddings
+EMBEDDING_DTYPES = ('float32', 'float16', 'int8')
+
+
+def quantize(vectors: np.ndarray, dtype: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Quantize embeddings for storage.
+    
+    float16 halves and int8 quarters the float32 size. int8 uses one
+    float32 scale per vector (max |x| / 127), so every vector spans the
+    full int8 range whatever its norm.
+    
+    Args:
+        vectors: (n, dim) or (dim,) embeddings
+        dtype: One of EMBEDDING_DTYPES
+        
+    Returns:
+        (codes, scales); scales is None except for int8
+    """
+    if dtype not in EMBEDDING_DTYPES:
+        raise ValueError(f"Unsupported embedding dtype: {dtype}")
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if dtype != 'int8':
+        return np.asarray(vectors, dtype=dtype), None
+    peak = np.abs(vectors).max(axis=-1, initial=0.0)
+    scales = np.where(peak > 0, peak / 127, 1.0).astype(np.float32)
+    codes = np.rint(vectors / scales[..., None]).astype(np.int8)
+    return codes, scales
+
+
+def dequantize(codes: np.ndarray, scales: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Float32 embeddings back from quantize().
+    
+    Args:
+        codes: Quantized embeddings
+        scales: int8 per-vector scales (None for float16/float32)
+        
+    Returns:
+        float32 embeddings
+    """
+    vectors = codes.astype(np.float32)
+    if scales is not None:
+        vectors *= np.asarray(scales)[..., None]
+    return vectors
+
+
+class QuantizedEmbeddings:
+    """
+    Embedding matrix whose rows stay quantized until they are used.
+    
+    Indexing with a slice or an index array returns float32 rows, so the
+    scoring kernels accept it in place of a float32 matrix and only
+    dequantize the block they are working on. float32 storage returns
+    views of the matrix itself.
+    """
+    
+    def __init__(self, vectors: np.ndarray, dtype: str = 'float32'):
+        """
+        Quantize a matrix.
+        
+        Args:
+            vectors: (n, dim) embeddings
+            dtype: One of EMBEDDING_DTYPES
+        """
+        codes, scales = quantize(vectors, dtype)
+        self.dtype = dtype
+        self.codes = np.ascontiguousarray(codes)
+        self.scales = scales
+    
+    @classmethod
+    def _wrap(cls, codes: np.ndarray, scales: Optional[np.ndarray],
+              dtype: str) -> 'QuantizedEmbeddings':
+        matrix = cls.__new__(cls)
+        matrix.dtype = dtype
+        matrix.codes = codes
+        matrix.scales = scales
+        return matrix
+    
+    @classmethod
+    def concatenate(cls, parts: List['QuantizedEmbeddings']) -> 'QuantizedEmbeddings':
+        """Stack matrices of the same dtype."""
+        dtype = parts[0].dtype
+        scales = None if parts[0].scales is None else np.concatenate([p.scales for p in parts])
+        return cls._wrap(np.concatenate([p.codes for p in parts]), scales, dtype)
+    
+    def take(self, index: np.ndarray) -> 'QuantizedEmbeddings':
+        """Rows at index, still quantized."""
+        scales = None if self.scales is None else self.scales[index]
+        return self._wrap(self.codes[index], scales, self.dtype)
+    
+    def __getitem__(self, key) -> np.ndarray:
+        if self.dtype == 'float32':
+            return self.codes[key]
+        return dequantize(self.codes[key], None if self.scales is None else self.scales[key])
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.codes.shape
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the codes and scales."""
+        return self.codes.nbytes + (0 if self.scales is None else self.scales.nbytes)
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU cache of embeddings keyed by text.
+    
+    Entries beyond max_entries or max_bytes are evicted least recently used
+    first. Pinned texts (e.g. core values) are kept in a separate table
+    that is never evicted, but still count towards the budget.
+    
+    Counters: hits, misses, evictions; resident_bytes is the total size
+    of the stored vectors. Vectors can be stored as float16 or int8 (see
+    quantize()); an int8 vector carries its float32 scale in its last four
+    bytes, so every entry stays a single array.
+    """
+    
+    def __init__(self, max_entries: int = None, max_bytes: int = None,
+                 dtype: str = 'float32'):
+        """
+        Initialize cache.
+        
+        Args:
+            max_entries: Maximum number of cached embeddings (None: unbounded)
+            max_bytes: Maximum total vector bytes (None: unbounded)
+            dtype: Storage type, one of EMBEDDING_DTYPES
+        """
+        if dtype not in EMBEDDING_DTYPES:
+            raise ValueError(f"Unsupported embedding dtype: {dtype}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.dtype = dtype
+        self._lru: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._pinned: Dict[str, np.ndarray] = {}
+        self._pin_keys: Set[str] = set()
+        self._lock = threading.Lock()
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """
+        Look up an embedding, counting the hit or miss.
+        
+        Args:
+            text: Embedded text
+            
+        Returns:
+            Embedding, or None if not cached
+        """
+        with self._lock:
+            vector = self._pinned.get(text)
+            if vector is None:
+                vector = self._lru.get(text)
+                if vector is not None:
+                    self._lru.move_to_end(text)
+            if vector is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return self._unpack(vector)
+    
+    def _pack(self, vector: np.ndarray) -> np.ndarray:
+        codes, scale = quantize(vector, self.dtype)
+        if scale is None:
+            # Own the bytes counted in resident_bytes, rather than keep a
+            # store memmap or a whole encode batch alive through a view
+            return codes if codes.base is None else codes.copy()
+        return np.concatenate([codes, scale.reshape(1).view(np.int8)])
+    
+    def _unpack(self, stored: np.ndarray) -> np.ndarray:
+        if self.dtype == 'int8':
+            return dequantize(stored[:-4], stored[-4:].view(np.float32)[0])
+        return stored if self.dtype == 'float32' else stored.astype(np.float32)
+    
+    def put(self, text: str, vector: np.ndarray):
+        """
+        Store an embedding, evicting cold entries if over budget.
+        
+        Args:
+            text: Embedded text
+            vector: Its embedding
+        """
+        vector = self._pack(vector)
+        with self._lock:
+            self._discard(text)
+            if text in self._pin_keys:
+                self._pinned[text] = vector
+            else:
+                self._lru[text] = vector
+            self.resident_bytes += vector.nbytes
+            self._enforce_budget()
+    
+    def update(self, items):
+        """Store several (text, vector) pairs, as dict.update."""
+        for text, vector in dict(items).items():
+            self.put(text, vector)
+    
+    def pin(self, texts: List[str]):
+        """
+        Protect texts from eviction, now and when they are cached later.
+        
+        Args:
+            texts: Texts to pin
+        """
+        with self._lock:
+            for text in texts:
+                self._pin_keys.add(text)
+                if text in self._lru:
+                    self._pinned[text] = self._lru.pop(text)
+    
+    def unpin(self, texts: List[str]):
+        """
+        Make pinned texts evictable again.
+        
+        Args:
+            texts: Texts to unpin
+        """
+        with self._lock:
+            for text in texts:
+                self._pin_keys.discard(text)
+                if text in self._pinned:
+                    self._lru[text] = self._pinned.pop(text)
+            self._enforce_budget()
+    
+    def _discard(self, text: str):
+        vector = self._pinned.pop(text, None)
+        if vector is None:
+            vector = self._lru.pop(text, None)
+        if vector is not None:
+            self.resident_bytes -= vector.nbytes
+    
+    def _enforce_budget(self):
+        while self._lru and (
+            (self.max_entries is not None and len(self) > self.max_entries)
+            or (self.max_bytes is not None and self.resident_bytes > self.max_bytes)
+        ):
+            _, vector = self._lru.popitem(last=False)
+            self.resident_bytes -= vector.nbytes
+            self.evictions += 1
+    
+    def clear(self):
+        """Drop every embedding (pins stay registered)."""
+        with self._lock:
+            self._lru.clear()
+            self._pinned.clear()
+            self.resident_bytes = 0
+    
+    def items(self) -> List[Tuple[str, np.ndarray]]:
+        """Snapshot of (text, float32 embedding) pairs, pinned first."""
+        with self._lock:
+            stored = list(self._pinned.items()) + list(self._lru.items())
+        return [(text, self._unpack(vector)) for text, vector in stored]
+    
+    def stats(self) -> Dict:
+        """Counters and occupancy as a dictionary."""
+        with self._lock:
+            return {
+                'entries': len(self),
+                'pinned': len(self._pinned),
+                'dtype': self.dtype,
+                'resident_bytes': self.resident_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+    
+    def __contains__(self, text: str) -> bool:
+        return text in self._pinned or text in self._lru
+    
+    def __len__(self) -> int:
+        return len(self._pinned) + len(self._lru)
+
+
+class DiskEmbeddingStore:
+    """
+    Persistent embedding store shared by processes through memory mapping.
+    
+    Embeddings of one model live in a flat float32 (or float16) vector file
+    plus an append-only index of 16-byte content hashes; row i of the vector
+    file belongs to index record i. Readers memory-map the vector file, so
+    many worker processes share one page-cache copy and pay no load cost.
+    They pick up other processes' appends by re-reading only the index
+    tail. Writers serialize on a lock file and write vectors before index
+    records, so a crash never exposes an unwritten vector.
+    
+    Files (in directory, per model/dim/dtype):
+        <name>.json  metadata (model name, dimension, dtype)
+        <name>.vec   raw vectors
+        <name>.idx   content hashes (blake2b, 16 bytes each)
+    """
+    
+    RECORD_BYTES = 16
+    
+    def __init__(self, directory: str, model_name: str, dim: int, dtype: str = 'float32'):
+        """
+        Open (or create) the store of one model.
+        
+        Args:
+            directory: Store directory
+            model_name: Embedding model; stores never mix models
+            dim: Embedding dimension
+            dtype: 'float32' or 'float16' storage
+        """
+        if dtype not in ('float32', 'float16'):
+            raise ValueError(f"Unsupported store dtype: {dtype}")
+        self.model_name = model_name
+        self.dim = dim
+        self.dtype = np.dtype(dtype)
+        
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f"{self._model_prefix(model_name)}-{dim}-{dtype}")
+        self.vec_path = base + '.vec'
+        self.idx_path = base + '.idx'
+        self.lock_path = base + '.lock'
+        
+        meta = {'model_name': model_name, 'dim': dim, 'dtype': dtype}
+        meta_path = base + '.json'
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                if json.load(f) != meta:
+                    raise ValueError(f"Embedding store metadata mismatch: {meta_path}")
+        else:
+            with open(meta_path + '.tmp', 'w') as f:
+                json.dump(meta, f)
+            os.replace(meta_path + '.tmp', meta_path)
+        for path in (self.vec_path, self.idx_path):
+            open(path, 'ab').close()
+        
+        self._rows: Dict[bytes, int] = {}
+        self._indexed = 0
+        self._map: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _model_prefix(model_name: str) -> str:
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', model_name)
+        model_hash = hashlib.sha1(model_name.encode('utf-8')).hexdigest()[:8]
+        return f"{safe_name}-{model_hash}"
+    
+    @classmethod
+    def stored_dimension(cls, directory: str, model_name: str,
+                         dtype: str = 'float32') -> Optional[int]:
+        """
+        Dimension of an existing store of a model, without loading the model.
+        
+        Args:
+            directory: Store directory
+            model_name: Embedding model
+            dtype: Storage dtype
+            
+        Returns:
+            The stored dimension, or None if no store exists yet
+        """
+        pattern = os.path.join(glob.escape(directory),
+                               f"{glob.escape(cls._model_prefix(model_name))}-*-{dtype}.json")
+        for meta_path in sorted(glob.glob(pattern)):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get('model_name') == model_name and meta.get('dtype') == dtype:
+                return int(meta['dim'])
+        return None
+    
+    @staticmethod
+    def content_hash(text: str) -> bytes:
+        """16-byte key of a text."""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    
+    def _refresh(self):
+        """Index records appended since the last call (by any process)."""
+        count = os.path.getsize(self.idx_path) // self.RECORD_BYTES
+        if count <= self._indexed:
+            return
+        with open(self.idx_path, 'rb') as f:
+            f.seek(self._indexed * self.RECORD_BYTES)
+            data = f.read((count - self._indexed) * self.RECORD_BYTES)
+        for i in range(count - self._indexed):
+            key = data[i * self.RECORD_BYTES:(i + 1) * self.RECORD_BYTES]
+            self._rows.setdefault(key, self._indexed + i)
+        self._indexed = count
+        self._map = np.memmap(self.vec_path, dtype=self.dtype, mode='r',
+                              shape=(count, self.dim)).view(np.ndarray)
+    
+    def get_many(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up stored embeddings.
+        
+        Args:
+            texts: Texts to look up
+            
+        Returns:
+            text -> float32 embedding for every stored text (zero-copy views
+            for float32 stores)
+        """
+        with self._lock:
+            self._refresh()
+            found = {}
+            for text in texts:
+                row = self._rows.get(self.content_hash(text))
+                if row is not None:
+                    vector = self._map[row]
+                    found[text] = vector if self.dtype == np.float32 else vector.astype(np.float32)
+            return found
+    
+    def put_many(self, texts: List[str], vectors: np.ndarray) -> int:
+        """
+        Append embeddings not already stored.
+        
+        Args:
+            texts: Embedded texts
+            vectors: (len(texts), dim) embeddings
+            
+        Returns:
+            Number of embeddings appended
+        """
+        with self._lock, open(self.lock_path, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self._refresh()
+            
+            new: Dict[bytes, np.ndarray] = {}
+            for text, vector in zip(texts, vectors):
+                key = self.content_hash(text)
+                if key not in self._rows and key not in new:
+                    new[key] = vector
+            if not new:
+                return 0
+            
+            # Vectors first, then index records; anything past the index
+            # (a torn earlier append) is overwritten
+            row = self._indexed
+            block = np.asarray(list(new.values()), dtype=self.dtype).reshape(len(new), self.dim)
+            with open(self.vec_path, 'r+b') as f:
+                f.seek(row * self.dim * self.dtype.itemsize)
+                f.write(block.tobytes())
+                f.truncate()
+                f.flush()
+                os.fsync(f.fileno())
+            with open(self.idx_path, 'r+b') as f:
+                f.seek(row * self.RECORD_BYTES)
+                f.write(b''.join(new))
+                f.truncate()
+            self._refresh()
+            return len(new)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._rows)
+
+
 class SemanticConsistencyEngine:
     """
     Engine for computing semantic consistency using embeddings.
@@ -97,38 +828,128 @@ class SemanticConsistencyEngine:
         Example: "Help others" ≈ "Support people in need"
     """
     
+    # Contradiction heuristics (see detect_contradiction)
+    NEGATION_WORDS = ['not', 'never', 'no', 'dont', "don't", 'cannot', "can't"]
+    ANTONYM_PAIRS = [
+        ('always', 'never'),
+        ('good', 'bad'),
+        ('right', 'wrong'),
+        ('true', 'false'),
+        ('love', 'hate'),
+        ('accept', 'reject')
+    ]
+    
     def __init__(self, 
                  model_name: str = 'all-MiniLM-L6-v2',
                  cache_embeddings: bool = True,
-                 similarity_threshold: float = 0.5):
+                 similarity_threshold: float = 0.5,
+                 batch_size: int = 64,
+                 cache_max_entries: int = None,
+                 cache_max_bytes: int = None,
+                 embedding_store: str = None,
+                 embedding_dtype: str = 'float32',
+                 warm_up: bool = False,
+                 embedding_backend: EmbeddingBackend = None):
         """
         Initialize semantic consistency engine.
         
+        The model is loaded on first use (see model), not here.
+        
         Args:
-            model_name: Sentence transformer model name
+            model_name: Sentence transformer model name, when no
+                embedding_backend is given
                 Options: 
                     - 'all-MiniLM-L6-v2' (default, fast, 384 dim)
                     - 'all-mpnet-base-v2' (better quality, 768 dim)
                     - 'paraphrase-multilingual-MiniLM-L12-v2' (multilingual)
             cache_embeddings: Whether to cache embeddings for performance
             similarity_threshold: Minimum similarity for agreement (default: 0.5)
+            batch_size: Texts per forward pass when encoding cache misses
+            cache_max_entries: Embedding cache entry limit (None: unbounded)
+            cache_max_bytes: Embedding cache byte limit (None: unbounded)
+            embedding_store: Directory of a DiskEmbeddingStore consulted
+                between the in-memory cache and the model (None: disabled)
+            embedding_dtype: In-memory storage of cached and matrix
+                embeddings: 'float32', 'float16' or 'int8' (see quantize)
+            warm_up: Start loading the model in a background thread now
+            embedding_backend: Source of embeddings (None: a
+                SentenceTransformerBackend of model_name). A fitted
+                HashingVectorizerBackend needs no extra dependencies.
         """
-        if not SEMANTIC_AVAILABLE:
-            raise ImportError(
-                "Semantic features require sentence-transformers. "
-                "Install with: pip install sentence-transformers"
-            )
-        
-        self.model_name = model_name
-        self.model = SentenceTransformer(model_name)
+        if embedding_backend is None:
+            embedding_backend = SentenceTransformerBackend(model_name)
+        self.backend = embedding_backend
         self.cache_embeddings = cache_embeddings
         self.similarity_threshold = similarity_threshold
+        self.batch_size = batch_size
+        self.embedding_dtype = embedding_dtype
+        
+        # Embedding cache: belief_content -> embedding_vector, LRU-bounded
+        self._embedding_cache = EmbeddingCache(cache_max_entries, cache_max_bytes,
+                                               embedding_dtype)
+        self._store_directory = embedding_store
+        self._embedding_store: Optional[DiskEmbeddingStore] = None
+        self._store_lock = threading.Lock()
+        # Set once the backend has encoded (so its model loaded) successfully
+        self.backend_ready = False
+        
+        print(f"✓ Semantic engine initialized with {self.model_name}")
+        if warm_up:
+            self.warm_up()
+    
+    @property
+    def model_name(self) -> str:
+        """Name of the backend's embedding space (read live: fit() changes it)."""
+        return self.backend.name
+    
+    @property
+    def model(self):
+        """The SentenceTransformer of a SentenceTransformerBackend (loads it)."""
+        return getattr(self.backend, 'model', None)
+    
+    @property
+    def model_loaded(self) -> bool:
+        """Whether the backend is ready to encode without loading first."""
+        return self.backend.loaded
+    
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension (may load the model)."""
+        return self.backend.dimension
+    
+    def warm_up(self) -> threading.Thread:
+        """
+        Load the backend's model in a background thread.
         
-        # Embedding cache: {belief_content: embedding_vector}
-        self._embedding_cache: Dict[str, np.ndarray] = {}
+        Callers that need an embedding before the thread finishes simply
+        wait for the load in progress.
         
-        print(f"✓ Semantic engine initialized with {model_name}")
-        print(f"  Embedding dimension: {self.model.get_sentence_embedding_dimension()}")
+        Returns:
+            The daemon loading thread (join() to wait for it)
+        """
+        thread = threading.Thread(target=self.backend.load, daemon=True,
+                                  name=f"warm-up {self.model_name}")
+        thread.start()
+        return thread
+    
+    @property
+    def embedding_store(self) -> Optional[DiskEmbeddingStore]:
+        """
+        The DiskEmbeddingStore (None if disabled), opened on first use.
+        
+        An existing store provides the dimension itself, so store hits
+        never load the model.
+        """
+        if self._embedding_store is None and self._store_directory is not None:
+            with self._store_lock:
+                if self._embedding_store is None:
+                    dim = DiskEmbeddingStore.stored_dimension(
+                        self._store_directory, self.model_name
+                    ) or self.dimension
+                    self._embedding_store = DiskEmbeddingStore(
+                        self._store_directory, self.model_name, dim
+                    )
+        return self._embedding_store
     
     def get_embedding(self, text: str) -> np.ndarray:
         """
@@ -140,15 +961,52 @@ class SemanticConsistencyEngine:
         Returns:
             Embedding vector
         """
-        if self.cache_embeddings and text in self._embedding_cache:
-            return self._embedding_cache[text]
-        
-        embedding = self.model.encode(text, convert_to_numpy=True)
+        return self.get_embeddings([text])[0]
+    
+    def get_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Get embeddings for many texts, encoding all cache misses at once.
         
-        if self.cache_embeddings:
-            self._embedding_cache[text] = embedding
+        Misses are de-duplicated and sent to the model in a single
+        encode(..., batch_size=self.batch_size) call instead of one forward
+        pass per text.
         
-        return embedding
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            (len(texts), dim) array of embeddings, in input order
+        """
+        found: Dict[str, np.ndarray] = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            vector = self._embedding_cache.get(text) if self.cache_embeddings else None
+            if vector is None:
+                missing.append(text)
+            else:
+                found[text] = vector
+        
+        if missing and self.embedding_store is not None:
+            stored = self.embedding_store.get_many(missing)
+            if stored:
+                found.update(stored)
+                if self.cache_embeddings:
+                    self._embedding_cache.update(stored)
+                missing = [t for t in missing if t not in stored]
+        
+        if missing:
+            vectors = self.backend.encode(missing, batch_size=self.batch_size)
+            self.backend_ready = True
+            encoded = dict(zip(missing, vectors))
+            found.update(encoded)
+            if self.cache_embeddings:
+                self._embedding_cache.update(encoded)
+            if self.embedding_store is not None:
+                self.embedding_store.put_many(missing, vectors)
+        
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.stack([found[t] for t in texts])
     
     def cosine_similarity(self, emb1: np.ndarray, emb2: np.ndarray) -> float:
         """
@@ -174,6 +1032,304 @@ class SemanticConsistencyEngine:
         # Convert from [-1, 1] to [0, 1]
         return (similarity + 1) / 2
     
+    @staticmethod
+    def normalize(embeddings: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize embedding rows into a contiguous float32 matrix.
+        
+        Zero vectors stay zero; similarity() maps them to 0 like
+        cosine_similarity does.
+        
+        Args:
+            embeddings: (n, dim) embeddings
+            
+        Returns:
+            (n, dim) float32 matrix of unit (or zero) rows
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return np.ascontiguousarray(
+            np.divide(embeddings, norms, out=np.zeros_like(embeddings), where=norms > 0)
+        )
+    
+    @staticmethod
+    def similarity(unit_a: np.ndarray, unit_b: np.ndarray) -> np.ndarray:
+        """
+        Pairwise cosine_similarity for normalized rows, as one matrix product.
+        
+        Args:
+            unit_a: (m, dim) rows from normalize()
+            unit_b: (n, dim) rows from normalize()
+            
+        Returns:
+            (m, n) similarities in [0, 1]
+        """
+        sim = unit_a @ unit_b.T
+        sim += 1
+        sim /= 2
+        # Pairs involving a zero vector score 0, not 0.5
+        zero_a = ~unit_a.any(axis=1)
+        zero_b = ~unit_b.any(axis=1)
+        if zero_a.any() or zero_b.any():
+            sim[zero_a, :] = 0
+            sim[:, zero_b] = 0
+        return sim
+    
+    # Bits of text_flags(): negation, then word 1 and word 2 of every pair,
+    # which leaves room for 15 ANTONYM_PAIRS
+    NEGATION_FLAG = 1
+    FLAG_DTYPE = np.uint32
+    
+    def text_flag(self, text: str) -> int:
+        """
+        Contradiction features of one text packed into an int.
+        
+        Bit 0 is set when the text contains a negation word, bit 1 + p when
+        it contains word 1 of ANTONYM_PAIRS[p] and bit 1 + P + p when it
+        contains word 2 (P = len(ANTONYM_PAIRS)).
+        
+        Args:
+            text: Text to inspect
+            
+        Returns:
+            Packed flags
+        """
+        lowered = text.lower()
+        n_pairs = len(self.ANTONYM_PAIRS)
+        bits = 8 * np.dtype(self.FLAG_DTYPE).itemsize
+        if 1 + 2 * n_pairs > bits:
+            raise ValueError(f"Text flags fit at most {(bits - 1) // 2} antonym pairs")
+        flag = self.NEGATION_FLAG if any(neg in lowered for neg in self.NEGATION_WORDS) else 0
+        for p, (word1, word2) in enumerate(self.ANTONYM_PAIRS):
+            if word1 in lowered:
+                flag |= 1 << (1 + p)
+            if word2 in lowered:
+                flag |= 1 << (1 + n_pairs + p)
+        return flag
+    
+    def text_flags(self, texts: List[str]) -> np.ndarray:
+        """
+        Packed text_flag() of many texts.
+        
+        Args:
+            texts: Texts to inspect
+            
+        Returns:
+            (n,) FLAG_DTYPE flags
+        """
+        return np.fromiter((self.text_flag(t) for t in texts), dtype=self.FLAG_DTYPE,
+                           count=len(texts))
+    
+    def _antonym_words(self, flags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Split packed flags into (word 1 bits, word 2 bits) per pair."""
+        n_pairs = len(self.ANTONYM_PAIRS)
+        mask = (1 << n_pairs) - 1
+        return (flags >> 1) & mask, (flags >> (1 + n_pairs)) & mask
+    
+    def _antonym_matrix(self, flags: np.ndarray, word: int) -> np.ndarray:
+        """(n, P) float32 presence of word 1 (word=0) or word 2 (word=1) per pair."""
+        n_pairs = len(self.ANTONYM_PAIRS)
+        shift = np.arange(n_pairs, dtype=flags.dtype) + 1 + word * n_pairs
+        return ((flags[:, None] >> shift) & 1).astype(np.float32)
+    
+    def score_in_place(self, sim: np.ndarray, flags_a: np.ndarray, flags_b: np.ndarray,
+                       scratch: Dict[str, np.ndarray] = None) -> np.ndarray:
+        """
+        Turn a similarity block into pair scores, overwriting it.
+        
+        Similarity, contradiction and scoring are evaluated together as
+        array operations over the block, using text flags computed once per
+        text instead of re-scanning both texts for every pair:
+        
+            negation mismatch and sim > 0.7  ->  max(1 - 0.8 sim, 0)
+            antonym pair                     ->  0.3
+            sim > similarity_threshold       ->  sim
+            otherwise                        ->  0.7 + 0.3 sim
+        
+        Args:
+            sim: (m, n) float32 similarities from similarity()
+            flags_a: text_flags of the m row texts
+            flags_b: text_flags of the n column texts
+            scratch: Buffers reused across calls on same-shaped blocks
+                (one dict per caller; None allocates fresh ones)
+            
+        Returns:
+            sim, now holding the (m, n) pair scores
+        """
+        scratch = {} if scratch is None else scratch
+        
+        def buffer(name, dtype):
+            array = scratch.get(name)
+            if array is None or array.shape != sim.shape:
+                array = scratch[name] = np.empty(sim.shape, dtype=dtype)
+            return array
+        
+        # Each rule is applied as a blend sim += mask * (rule - sim) with a
+        # 0/1 float mask; masked ufuncs (where=, putmask) are far slower.
+        # Later rules override earlier ones, so they run in reverse precedence.
+        mask = buffer('mask', bool)
+        blend = buffer('blend', np.float32)
+        neg_a = (flags_a & self.NEGATION_FLAG) != 0
+        neg_b = (flags_b & self.NEGATION_FLAG) != 0
+        negated = None
+        if (neg_a.any() and not neg_b.all()) or (neg_b.any() and not neg_a.all()):
+            mismatch = np.not_equal(neg_a[:, None], neg_b[None, :], out=buffer('mismatch', bool))
+            mismatch &= np.greater(sim, 0.7, out=mask)
+            if mismatch.any():
+                negated = buffer('negated', np.float32)
+                np.copyto(negated, mismatch)
+                contradiction = np.multiply(sim, -0.8, out=buffer('contradiction', np.float32))
+                contradiction += 1.0
+                np.maximum(contradiction, 0.0, out=contradiction)
+                contradiction *= negated
+        
+        np.subtract(1.0, sim, out=blend)
+        np.copyto(buffer('neutral', np.float32), np.less_equal(sim, self.similarity_threshold, out=mask))
+        blend *= scratch['neutral']
+        blend *= 0.7
+        sim += blend
+        
+        first_a, second_a = self._antonym_words(flags_a)
+        first_b, second_b = self._antonym_words(flags_b)
+        if (first_a.any() and second_b.any()) or (second_a.any() and first_b.any()):
+            # Either text has word 1 of a pair while the other has word 2
+            antonym = np.matmul(self._antonym_matrix(flags_a, 0),
+                                self._antonym_matrix(flags_b, 1).T,
+                                out=buffer('antonym', np.float32))
+            antonym += np.matmul(self._antonym_matrix(flags_a, 1),
+                                 self._antonym_matrix(flags_b, 0).T, out=blend)
+            np.minimum(antonym, 1.0, out=antonym)
+            np.subtract(0.3, sim, out=blend)
+            blend *= antonym
+            sim += blend
+        
+        if negated is not None:
+            np.multiply(sim, negated, out=blend)
+            sim -= blend
+            sim += contradiction
+        return sim
+    
+    def score_pairs(self, sim: np.ndarray, flags_a: np.ndarray,
+                    flags_b: np.ndarray) -> np.ndarray:
+        """
+        Vectorized per-pair score of calculate_consistency (before weighting).
+        
+        Args:
+            sim: (m, n) similarities from similarity()
+            flags_a: text_flags of the m row texts
+            flags_b: text_flags of the n column texts
+            
+        Returns:
+            (m, n) pair scores (sim is left untouched)
+        """
+        return self.score_in_place(np.array(sim), flags_a, flags_b)
+    
+    def score_aligned(self, sim: np.ndarray, flags_a: np.ndarray,
+                      flags_b: np.ndarray) -> np.ndarray:
+        """
+        Pair scores for a list of pairs rather than a block.
+        
+        Args:
+            sim: (p,) similarities of pairs (a[i], b[i])
+            flags_a: (p,) text_flags of the first texts
+            flags_b: (p,) text_flags of the second texts
+        
+        Returns:
+            (p,) float64 pair scores
+        """
+        sim = np.asarray(sim, dtype=np.float64)
+        first_a, second_a = self._antonym_words(flags_a)
+        first_b, second_b = self._antonym_words(flags_b)
+        antonym = ((first_a & second_b) | (second_a & first_b)) != 0
+        negated = (((flags_a ^ flags_b) & self.NEGATION_FLAG) != 0) & (sim > 0.7)
+        
+        scores = np.where(sim > self.similarity_threshold, sim, 0.7 + 0.3 * sim)
+        scores[antonym] = 0.3
+        return np.where(negated, np.maximum(1.0 - 0.8 * sim, 0.0), scores)
+    
+    def consistency_sums(self, unit: np.ndarray, flags: np.ndarray,
+                         weights: np.ndarray, block: int = 1024) -> np.ndarray:
+        """
+        Weighted score sums of every text against all the others.
+        
+        Computes sum_{j != i} weights[j] * score(i, j) block by block
+        without keeping pair scores around. Scores are symmetric, so only
+        blocks on or above the diagonal are multiplied and scored; each
+        one contributes to its rows and, off the diagonal, to its columns.
+        
+        Args:
+            unit: (n, dim) rows from normalize()
+            flags: (n,) text_flags of the rows
+            weights: (n,) weights (belief confidences)
+            block: Rows per similarity block
+            
+        Returns:
+            (n,) float64 weighted sums
+        """
+        n = len(unit)
+        weights = np.asarray(weights, dtype=np.float32)
+        totals = np.zeros(n)
+        scratch: Dict[str, np.ndarray] = {}
+        for i0 in range(0, n, block):
+            i1 = min(i0 + block, n)
+            for j0 in range(i0, n, block):
+                j1 = min(j0 + block, n)
+                scores = self.score_in_place(
+                    self.similarity(unit[i0:i1], unit[j0:j1]), flags[i0:i1], flags[j0:j1],
+                    scratch
+                )
+                if i0 == j0:
+                    np.fill_diagonal(scores, 0)  # A text is not scored against itself
+                else:
+                    totals[j0:j1] += weights[i0:i1] @ scores
+                totals[i0:i1] += scores @ weights[j0:j1]
+        return totals
+    
+    def quantization_report(self, embeddings: np.ndarray, flags: np.ndarray = None,
+                            weights: np.ndarray = None,
+                            dtypes: Tuple[str, ...] = ('float16', 'int8')) -> Dict[str, Dict]:
+        """
+        Measure what quantized storage costs in accuracy against float32.
+        
+        Args:
+            embeddings: (n, dim) float32 embeddings, e.g. of a belief system
+            flags: text_flags of the texts (None: no contradiction flags)
+            weights: Belief confidences (None: all 1.0)
+            dtypes: Storage types to compare
+        
+        Returns:
+            dtype -> bytes_per_vector, memory_ratio (float32 bytes / bytes),
+            max/mean_similarity_error over all pairs, max_consistency_error
+            over beliefs and H_error
+        """
+        unit = self.normalize(embeddings)
+        n = len(unit)
+        flags = np.zeros(n, dtype=self.FLAG_DTYPE) if flags is None else flags
+        weights = np.ones(n) if weights is None else np.asarray(weights)
+        scale = max(n - 1, 1)
+        reference = self.consistency_sums(unit, flags, weights) / scale
+        
+        report = {}
+        for dtype in dtypes:
+            quantized = QuantizedEmbeddings(unit, dtype)
+            max_error, total_error = 0.0, 0.0
+            for start in range(0, n, 1024):
+                rows = slice(start, start + 1024)
+                error = np.abs(self.similarity(unit[rows], unit) -
+                               self.similarity(quantized[rows], quantized[:]))
+                max_error = max(max_error, float(error.max()))
+                total_error += float(error.sum(dtype=np.float64))
+            consistency = self.consistency_sums(quantized, flags, weights) / scale
+            report[dtype] = {
+                'bytes_per_vector': quantized.nbytes / max(n, 1),
+                'memory_ratio': unit.nbytes / max(quantized.nbytes, 1),
+                'max_similarity_error': max_error,
+                'mean_similarity_error': total_error / max(n * n, 1),
+                'max_consistency_error': float(np.abs(consistency - reference).max(initial=0.0)),
+                'H_error': abs(float(consistency.mean() - reference.mean())) if n else 0.0
+            }
+        return report
+    
     def detect_contradiction(self, text1: str, text2: str) -> Tuple[bool, float]:
         """
         Detect if two texts contradict each other.
@@ -190,7 +1346,7 @@ class SemanticConsistencyEngine:
             (is_contradiction, confidence)
         """
         # Check for negation patterns
-        negation_words = ['not', 'never', 'no', 'dont', "don't", 'cannot', "can't"]
+        negation_words = self.NEGATION_WORDS
         
         text1_lower = text1.lower()
         text2_lower = text2.lower()
@@ -209,16 +1365,7 @@ class SemanticConsistencyEngine:
             return True, 0.8 * similarity
         
         # Antonym detection (simplified)
-        antonym_pairs = [
-            ('always', 'never'),
-            ('good', 'bad'),
-            ('right', 'wrong'),
-            ('true', 'false'),
-            ('love', 'hate'),
-            ('accept', 'reject')
-        ]
-        
-        for word1, word2 in antonym_pairs:
+        for word1, word2 in self.ANTONYM_PAIRS:
             if (word1 in text1_lower and word2 in text2_lower) or \
                (word2 in text1_lower and word1 in text2_lower):
                 return True, 0.7
@@ -247,51 +1394,463 @@ class SemanticConsistencyEngine:
         if len(belief_system) <= 1:
             return 1.0  # Single belief is consistent with itself
         
-        belief_embedding = self.get_embedding(belief.content)
-        consistency_scores = []
-        
-        for other_content, other_belief in belief_system.items():
-            if other_content == belief.content:
-                continue
-            
-            # Get semantic similarity
-            other_embedding = self.get_embedding(other_belief.content)
-            similarity = self.cosine_similarity(belief_embedding, other_embedding)
-            
-            # Check for contradiction
-            is_contradiction, contradiction_confidence = self.detect_contradiction(
-                belief.content, other_belief.content
-            )
-            
-            if is_contradiction:
-                # Strong contradiction penalty
-                score = max(0.0, 1.0 - contradiction_confidence)
-            elif similarity > self.similarity_threshold:
-                # High similarity = mutual support
-                score = similarity
-            else:
-                # Neutral: different topics, no conflict
-                score = 0.7 + 0.3 * similarity
-            
-            # Weight by confidence of other belief
-            weighted_score = score * other_belief.confidence
-            consistency_scores.append(weighted_score)
+        others = [b for content, b in belief_system.items() if content != belief.content]
+        if not others:
+            return 1.0
         
-        return np.mean(consistency_scores) if consistency_scores else 1.0
+        # One batched lookup, one similarity row, flags scored as arrays
+        texts = [belief.content] + [b.content for b in others]
+        unit = self.normalize(self.get_embeddings(texts))
+        flags = self.text_flags(texts)
+        scores = self.score_pairs(self.similarity(unit[:1], unit[1:]), flags[:1], flags[1:])[0]
+        confidence = np.array([b.confidence for b in others])
+        return float(np.mean(scores * confidence))
     
     def clear_cache(self):
         """Clear embedding cache."""
         self._embedding_cache.clear()
     
+    def save_cache(self, filepath: str):
+        """
+        Save the embedding cache as a float32 matrix keyed by content.
+        
+        The .npz file holds the (n, dim) float32 matrix, the content keys as
+        UTF-8 offsets/bytes, and the model name so that embeddings from a
+        different model are never reused.
+        
+        Args:
+            filepath: Destination path
+        """
+        items = self._embedding_cache.items()
+        contents = [content for content, _ in items]
+        if contents:
+            matrix = np.stack([vector for _, vector in items]).astype(np.float32)
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+        offsets, data = encode_strings(contents)
+        
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, embeddings=matrix, content_offsets=offsets,
+                     content=data, model_name=np.array(self.model_name))
+        os.replace(tmp_path, filepath)
+    
+    def load_cache(self, filepath: str) -> int:
+        """
+        Merge embeddings saved by save_cache into the cache.
+        
+        Args:
+            filepath: Path written by save_cache
+            
+        Returns:
+            Number of embeddings loaded (0 if saved with another model)
+        """
+        with np.load(filepath) as saved:
+            if str(saved['model_name']) != self.model_name:
+                return 0
+            contents = decode_strings(saved['content_offsets'], saved['content'])
+            matrix = saved['embeddings']
+        self._embedding_cache.update(zip(contents, matrix))
+        return len(contents)
+    
     def get_cache_size(self) -> int:
         """Get number of cached embeddings."""
         return len(self._embedding_cache)
+    
+    def get_cache_stats(self) -> Dict:
+        """Get embedding cache counters (hits, misses, evictions, bytes)."""
+        return self._embedding_cache.stats()
+    
+    def pin_embeddings(self, texts: List[str]):
+        """Keep embeddings of texts (e.g. core values) from being evicted."""
+        self._embedding_cache.pin(texts)
 
 
 # ============================================================================
 # Enhanced Harmony Monitor
 # ============================================================================
 
+class BeliefEmbeddingMatrix:
+    """
+    Normalized embeddings of a belief system in one contiguous matrix.
+    
+    Each belief content owns a row of a matrix holding its L2-normalized
+    embedding, plus its contradiction flags. sync() encodes new beliefs in
+    one batch and appends their rows in place to storage whose capacity
+    doubles when full, so incremental growth costs amortized O(dim) per
+    belief. When removals or reordering leave the rows out of step with
+    the belief system, the live rows are gathered into fresh storage once,
+    and scoring always works on a single matrix instead of per-pair lookups.
+    """
+    
+    def __init__(self, engine: SemanticConsistencyEngine):
+        """
+        Initialize an empty matrix.
+        
+        Args:
+            engine: Engine providing embeddings and text flags
+        """
+        self.engine = engine
+        self.rows: Dict[str, int] = {}
+        self.size = 0
+        self._storage = QuantizedEmbeddings(np.zeros((0, 0)), engine.embedding_dtype)
+        self._flags = np.zeros(0, dtype=engine.FLAG_DTYPE)
+        self._lock = threading.Lock()
+    
+    @property
+    def capacity(self) -> int:
+        """Rows allocated, used or not."""
+        return len(self._storage)
+    
+    @property
+    def vectors(self) -> QuantizedEmbeddings:
+        """The used rows (a view of the storage)."""
+        storage = self._storage
+        scales = None if storage.scales is None else storage.scales[:self.size]
+        return QuantizedEmbeddings._wrap(storage.codes[:self.size], scales, storage.dtype)
+    
+    @property
+    def flags(self) -> np.ndarray:
+        """Text flags of the used rows (a view)."""
+        return self._flags[:self.size]
+    
+    def _append(self, vectors: QuantizedEmbeddings, flags: np.ndarray):
+        """Write rows after the used ones, doubling the storage when full."""
+        needed = self.size + len(vectors)
+        storage = self._storage
+        if needed > len(storage) or storage.shape[1:] != vectors.shape[1:]:
+            capacity = max(needed, 2 * len(storage), 64)
+            codes = np.empty((capacity,) + vectors.shape[1:], dtype=vectors.codes.dtype)
+            scales = None if vectors.scales is None else np.empty(capacity, dtype=np.float32)
+            grown = np.empty(capacity, dtype=self._flags.dtype)
+            if self.size:
+                codes[:self.size] = storage.codes[:self.size]
+                if scales is not None:
+                    scales[:self.size] = storage.scales[:self.size]
+                grown[:self.size] = self._flags[:self.size]
+            # Views handed out earlier keep the old arrays
+            self._storage = storage = QuantizedEmbeddings._wrap(codes, scales, vectors.dtype)
+            self._flags = grown
+        storage.codes[self.size:needed] = vectors.codes
+        if vectors.scales is not None:
+            storage.scales[self.size:needed] = vectors.scales
+        self._flags[self.size:needed] = flags
+        self.size = needed
+    
+    def sync(self, contents: List[str],
+             flags: Dict[str, int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Give every content a row and return the rows in contents order.
+        
+        Args:
+            contents: Current belief contents (unique)
+            flags: Text flags precomputed at ingestion, by content; flags
+                of new rows not found here are computed
+            
+        Returns:
+            (unit vectors as (n, dim) QuantizedEmbeddings, (n,) text
+            flags), aligned with contents. Views of the matrix, which later
+            syncs never overwrite.
+        """
+        with self._lock:
+            missing = [c for c in contents if c not in self.rows]
+            if missing:
+                vectors = QuantizedEmbeddings(
+                    self.engine.normalize(self.engine.get_embeddings(missing)),
+                    self._storage.dtype
+                )
+                known = flags or {}
+                new_flags = np.array(
+                    [known[c] if c in known else self.engine.text_flag(c) for c in missing],
+                    dtype=self._flags.dtype
+                )
+                self.rows.update(zip(missing, range(self.size, self.size + len(missing))))
+                self._append(vectors, new_flags)
+            
+            index = np.fromiter((self.rows[c] for c in contents), dtype=np.int64,
+                                count=len(contents))
+            if len(index) != self.size or (index != np.arange(len(index))).any():
+                # Removed or reordered beliefs: gather the live rows once
+                self._storage = self.vectors.take(index)
+                self._flags = self.flags[index]
+                self.size = len(index)
+                self.rows = {c: i for i, c in enumerate(contents)}
+            return self.vectors, self.flags
+
+
+class BeliefNeighbourIndex:
+    """
+    Approximate nearest-neighbour index over normalized belief embeddings.
+    
+    An inverted-file index: spherical k-means splits the beliefs into about
+    sqrt(n) lists, and each list is searched exactly (one matrix product)
+    against the members of its n_probe nearest lists. Beliefs that are
+    close in embedding space almost always share or neighbour a list, so
+    the top-k found this way match the true top-k for the pairs that
+    matter, at O(n * n_probe * n / lists) instead of O(n^2) similarities.
+    """
+    
+    def __init__(self, n_lists: int = None, n_probe: int = 8,
+                 iterations: int = 8, seed: int = 0):
+        """
+        Initialize the index.
+        
+        Args:
+            n_lists: Number of k-means lists (None: sqrt(n))
+            n_probe: Lists searched per list, its own included
+            iterations: k-means iterations
+            seed: Seed of the k-means sample and initialization
+        """
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.iterations = iterations
+        self.seed = seed
+    
+    # Rows assigned to lists per matrix product
+    ASSIGN_BLOCK = 8192
+    # Vectors per list used to train the k-means centroids
+    TRAIN_PER_LIST = 64
+    
+    def train(self, unit: np.ndarray) -> np.ndarray:
+        """
+        Spherical k-means centroids of a sample of the rows.
+        
+        Args:
+            unit: (n, dim) rows from normalize()
+            
+        Returns:
+            (lists, dim) float32 unit centroids
+        """
+        n = len(unit)
+        rng = np.random.default_rng(self.seed)
+        n_lists = min(n, self.n_lists or max(1, int(np.sqrt(n))))
+        sample = unit[rng.choice(n, min(n, self.TRAIN_PER_LIST * n_lists), replace=False)]
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(self.iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # An empty list keeps its previous centroid
+            np.divide(sums, norms, out=centroids, where=norms > 0)
+        return centroids
+    
+    def neighbours(self, unit: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Approximate top-k most similar rows of every row.
+        
+        Args:
+            unit: (n, dim) rows from normalize()
+            k: Neighbours per row
+            
+        Returns:
+            (rows, cols, sims): row rows[p] has neighbour cols[p] at
+            similarity sims[p] (SemanticConsistencyEngine.similarity scale),
+            at most k per row, never the row itself
+        """
+        n = len(unit)
+        centroids = self.train(unit)
+        labels = np.concatenate([
+            np.argmax(unit[start:start + self.ASSIGN_BLOCK] @ centroids.T, axis=1)
+            for start in range(0, n, self.ASSIGN_BLOCK)
+        ])
+        order = np.argsort(labels, kind='stable')
+        bounds = np.searchsorted(labels[order], np.arange(len(centroids) + 1))
+        probes = np.argsort(-(centroids @ centroids.T), axis=1)[:, :self.n_probe]
+        
+        rows, cols, sims = [], [], []
+        for label, probed in enumerate(probes):
+            members = order[bounds[label]:bounds[label + 1]]
+            candidates = np.concatenate([order[bounds[p]:bounds[p + 1]] for p in probed])
+            top = min(k, len(candidates) - 1)
+            if not len(members) or top <= 0:
+                continue
+            sim = SemanticConsistencyEngine.similarity(unit[members], unit[candidates])
+            sim[members[:, None] == candidates[None, :]] = -np.inf
+            best = np.argpartition(-sim, top - 1, axis=1)[:, :top]
+            rows.append(np.repeat(members, top))
+            cols.append(candidates[best].ravel())
+            sims.append(np.take_along_axis(sim, best, axis=1).ravel())
+        if not rows:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0, dtype=np.float32)
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(sims)
+
+
+class EmbeddingPrefetcher:
+    """
+    Background thread that encodes texts as soon as they are submitted.
+    
+    Submitted texts queue up and a single daemon worker encodes them through
+    engine.get_embeddings(), so results land in the engine's cache (and
+    disk store) before anyone asks for them. After the first text of a burst
+    arrives the worker lingers briefly, so a burst of submissions is encoded
+    as one batch rather than one text at a time.
+    
+    claim() is called before scoring: texts still queued are taken back
+    (the caller encodes them in its own batch anyway), so it only waits for
+    the batch the worker is encoding right now. If a batch failed, claiming
+    any of its texts re-raises the error on the caller's path; forget()
+    drops texts that will never be claimed, with their errors. The worker
+    starts on the first submit(), which also takes a lazily loaded model's
+    loading time off the caller's path; close() stops it.
+    """
+    
+    def __init__(self, engine: SemanticConsistencyEngine,
+                 max_batch: int = 1024, linger: float = 0.005):
+        """
+        Initialize an idle prefetcher.
+        
+        Args:
+            engine: Engine whose get_embeddings() fills the cache
+            max_batch: Most texts encoded per worker batch
+            linger: Seconds to wait for more texts before encoding a
+                batch smaller than max_batch
+        """
+        self.engine = engine
+        self.max_batch = max_batch
+        self.linger = linger
+        self._queued: Dict[str, None] = {}  # insertion-ordered set
+        self._in_flight: Set[str] = set()
+        self._failed: Dict[str, Exception] = {}  # text -> error of its batch
+        self._forgotten: Set[str] = set()  # in flight, but never to be claimed
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.batches = 0
+        self.encoded = 0
+    
+    def submit(self, texts: List[str]):
+        """
+        Queue texts for background encoding.
+        
+        Args:
+            texts: Texts to encode (duplicates and texts already queued or
+                in flight are ignored)
+        """
+        with self._condition:
+            if self._closed:
+                return
+            for text in texts:
+                if text not in self._in_flight:
+                    self._queued[text] = None
+                    self._failed.pop(text, None)
+                self._forgotten.discard(text)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name=f"prefetch {self.engine.model_name}")
+                self._thread.start()
+            self._condition.notify_all()
+    
+    def claim(self, texts: List[str]):
+        """
+        Take texts back from the queue and wait for those being encoded.
+        
+        Args:
+            texts: Texts the caller is about to embed itself
+            
+        Raises:
+            Exception: The error of a failed background batch holding one
+                of the texts (claiming clears it, so a retry encodes again)
+        """
+        with self._condition:
+            if not self._queued and not self._in_flight and not self._failed:
+                return
+            waiting = []
+            for text in texts:
+                if text in self._in_flight:
+                    waiting.append(text)
+                else:
+                    self._queued.pop(text, None)
+            if waiting:
+                self._condition.wait_for(
+                    lambda: not any(text in self._in_flight for text in waiting)
+                )
+            if self._failed:
+                errors = [self._failed.pop(text) for text in texts if text in self._failed]
+                if errors:
+                    raise errors[0]
+    
+    def forget(self, texts: List[str]):
+        """
+        Drop texts that will never be claimed (e.g. removed beliefs).
+        
+        Queued texts are not encoded, and the error of a failed batch is
+        not kept for them.
+        
+        Args:
+            texts: Texts no longer needed
+        """
+        with self._condition:
+            for text in texts:
+                self._queued.pop(text, None)
+                self._failed.pop(text, None)
+                if text in self._in_flight:
+                    self._forgotten.add(text)
+    
+    def pending(self) -> int:
+        """Number of texts queued or being encoded."""
+        with self._condition:
+            return len(self._queued) + len(self._in_flight)
+    
+    def close(self, timeout: float = None):
+        """
+        Stop the worker once its current batch is done.
+        
+        Texts still queued are dropped.
+        
+        Args:
+            timeout: Seconds to wait for the worker (None: no limit)
+        """
+        with self._condition:
+            self._closed = True
+            self._queued.clear()
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+    
+    def _next_batch(self) -> Optional[List[str]]:
+        """Block until texts are queued; None once closed."""
+        with self._condition:
+            while True:
+                self._condition.wait_for(lambda: self._queued or self._closed)
+                if self._closed:
+                    return None
+                self._condition.wait_for(
+                    lambda: len(self._queued) >= self.max_batch or self._closed,
+                    timeout=self.linger
+                )
+                if self._closed:
+                    return None
+                if self._queued:  # claim() may have emptied it while lingering
+                    break
+            batch = list(itertools.islice(self._queued, self.max_batch))
+            for text in batch:
+                del self._queued[text]
+            self._in_flight.update(batch)
+            return batch
+    
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self.engine.get_embeddings(batch)
+                self.batches += 1
+                self.encoded += len(batch)
+            except Exception as e:
+                with self._condition:
+                    self._failed.update((text, e) for text in batch
+                                        if text not in self._forgotten)
+            finally:
+                with self._condition:
+                    self._in_flight.difference_update(batch)
+                    self._forgotten.difference_update(batch)
+                    self._condition.notify_all()
+
+
 class SemanticHarmonyMonitor:
     """
     Enhanced Harmony Monitor with semantic consistency.
@@ -303,12 +1862,24 @@ class SemanticHarmonyMonitor:
         Semantic:    "Help people" vs "Assist humans" → High similarity → Aligned
     
     This better captures the "love pattern" (Layer 0) by understanding meaning.
+    
+    Thread safety and change notification follow HarmonyMonitor: writers
+    hold write_lock, readers work on a snapshot(), and observers receive
+    the same on_* hooks.
     """
     
     def __init__(self, 
                  consistency_threshold: float = 0.7,
                  use_semantic: bool = True,
-                 semantic_model: str = 'all-MiniLM-L6-v2'):
+                 semantic_model: str = 'all-MiniLM-L6-v2',
+                 cache_max_entries: int = None,
+                 cache_max_bytes: int = None,
+                 embedding_store: str = None,
+                 neighbours: int = None,
+                 embedding_dtype: str = 'float32',
+                 warm_up: bool = False,
+                 embedding_backend: EmbeddingBackend = None,
+                 prefetch_on_add: bool = False):
         """
         Initialize Semantic Harmony Monitor.
         
@@ -316,21 +1887,62 @@ class SemanticHarmonyMonitor:
             consistency_threshold: Minimum acceptable consistency
             use_semantic: Use semantic consistency if available
             semantic_model: Sentence transformer model name
+            cache_max_entries: Embedding cache entry limit (None: unbounded)
+            cache_max_bytes: Embedding cache byte limit (None: unbounded)
+            embedding_store: Directory of a shared DiskEmbeddingStore
+            neighbours: Score each belief exactly against only its top-k
+                approximate nearest neighbours (None: all pairs, exact)
+            embedding_dtype: Cache and matrix storage, 'float32', 'float16'
+                or 'int8'
+            warm_up: Load the embedding model in the background right away
+                (otherwise it loads when the first embedding is needed). If
+                that load fails, the monitor falls back to the default
+                consistency function, with a warning
+            embedding_backend: Source of embeddings instead of the
+                semantic_model sentence transformer (e.g. a
+                HashingVectorizerBackend, which needs no extra packages)
+            prefetch_on_add: Encode added beliefs on a background
+                EmbeddingPrefetcher, so scoring only waits for encodes
+                still in flight (close() the monitor to stop its thread)
         """
         self.beliefs: Dict[str, Belief] = {}
         self.consistency_history: List[Tuple[float, float]] = []
         self.consistency_threshold = consistency_threshold
         
+        # Dirty tracking for derived results (H(t), inconsistencies)
+        self.generation = 0
+        self._cached_H: Optional[Tuple[tuple, float]] = None
+        self._cached_inconsistencies: Dict[float, Tuple[tuple, List]] = {}
+        self.write_lock = threading.RLock()
+        self._observers: List[object] = []
+        
         # Initialize semantic engine if requested and available
-        self.use_semantic = use_semantic and SEMANTIC_AVAILABLE
+        self._embedding_matrix: Optional[BeliefEmbeddingMatrix] = None
+        self._prefetcher: Optional[EmbeddingPrefetcher] = None
+        self._belief_flags: Dict[str, int] = {}  # content -> text_flag, set on add
+        self.neighbours = neighbours
+        self._neighbour_index = BeliefNeighbourIndex() if neighbours else None
+        self._cached_neighbours: Optional[Tuple[List[str], tuple]] = None
+        self.use_semantic = use_semantic and (
+            SEMANTIC_AVAILABLE or embedding_backend is not None
+        )
         
         if self.use_semantic:
             try:
                 self.semantic_engine = SemanticConsistencyEngine(
-                    model_name=semantic_model
+                    model_name=semantic_model,
+                    cache_max_entries=cache_max_entries,
+                    cache_max_bytes=cache_max_bytes,
+                    embedding_store=embedding_store,
+                    embedding_dtype=embedding_dtype,
+                    warm_up=warm_up,
+                    embedding_backend=embedding_backend
                 )
                 self.consistency_function = self._semantic_consistency
-                print(f"✓ Using semantic consistency with {semantic_model}")
+                self._embedding_matrix = BeliefEmbeddingMatrix(self.semantic_engine)
+                if prefetch_on_add:
+                    self._prefetcher = EmbeddingPrefetcher(self.semantic_engine)
+                print(f"✓ Using semantic consistency with {self.semantic_engine.model_name}")
             except Exception as e:
                 warnings.warn(f"Failed to initialize semantic engine: {e}")
                 self.use_semantic = False
@@ -358,17 +1970,76 @@ class SemanticHarmonyMonitor:
             category=category,
             dependencies=dependencies
         )
-        
-        self.beliefs[content] = belief
+        # Contradiction flags are scanned once here, not per scored pair
+        flag = self.semantic_engine.text_flag(content) if self.use_semantic else None
+        
+        with self.write_lock:
+            previous = self.beliefs.get(content)
+            self.beliefs[content] = belief
+            if flag is not None:
+                self._belief_flags[content] = flag
+            self.generation += 1
+            if previous is not None:
+                self._notify('on_belief_removed', previous)
+            self._notify('on_belief_added', belief)
+        if self._prefetcher is not None and self._uses_matrix(self.consistency_function):
+            self._prefetcher.submit([content])
         return content
     
     def remove_belief(self, content: str) -> bool:
         """Remove a belief."""
-        if content in self.beliefs:
-            del self.beliefs[content]
-            return True
+        with self.write_lock:
+            if content in self.beliefs:
+                belief = self.beliefs.pop(content)
+                self._belief_flags.pop(content, None)
+                if self._prefetcher is not None:
+                    self._prefetcher.forget([content])
+                self.generation += 1
+                self._notify('on_belief_removed', belief)
+                return True
         return False
     
+    def clear_beliefs(self):
+        """Remove every belief, notifying observers of each removal."""
+        with self.write_lock:
+            for content in list(self.beliefs):
+                self.remove_belief(content)
+    
+    def add_observer(self, observer: object):
+        """Register an observer (see HarmonyMonitor.add_observer)."""
+        with self.write_lock:
+            if not any(o is observer for o in self._observers):
+                self._observers = self._observers + [observer]
+    
+    def remove_observer(self, observer: object) -> bool:
+        """Unregister an observer."""
+        with self.write_lock:
+            remaining = [o for o in self._observers if o is not observer]
+            removed = len(remaining) != len(self._observers)
+            self._observers = remaining
+        return removed
+    
+    def _notify(self, hook: str, *args):
+        """Call hook(self, *args) on every observer that implements it."""
+        for observer in self._observers:
+            handler = getattr(observer, hook, None)
+            if handler is not None:
+                handler(self, *args)
+    
+    def cache_key(self) -> tuple:
+        """Key identifying the inputs of H(t) (see HarmonyMonitor.cache_key)."""
+        return (self.generation, len(self.beliefs), self.consistency_function)
+    
+    def snapshot(self) -> Tuple[tuple, Dict[str, Belief]]:
+        """Consistent (cache_key, beliefs copy) view for readers."""
+        key = self.cache_key()
+        return key, dict(self.beliefs)
+    
+    def invalidate_cache(self):
+        """Mark all derived results as stale after direct belief mutation."""
+        with self.write_lock:
+            self.generation += 1
+    
     def _default_consistency(self, belief: Belief, 
                            belief_system: Dict[str, Belief]) -> float:
         """
@@ -412,6 +2083,208 @@ class SemanticHarmonyMonitor:
         
         return np.mean(weighted_scores) if weighted_scores else 1.0
     
+    def prefetch_embeddings(self, texts):
+        """
+        Batch-encode texts ahead of scoring with the semantic function.
+        
+        Args:
+            texts: Texts (e.g. belief contents) about to be scored
+        """
+        if self.use_semantic and self.consistency_function == self._semantic_consistency:
+            try:
+                self.semantic_engine.get_embeddings(list(texts))
+            except Exception as e:
+                if not self._fall_back(self._semantic_consistency, e):
+                    raise
+    
+    def close(self):
+        """Stop the background EmbeddingPrefetcher, if prefetch_on_add started one."""
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _fall_back(self, consistency_function: Callable, error: Exception) -> bool:
+        """
+        Switch to _default_consistency if the embedding model failed to load.
+        
+        The model loads on first use rather than in __init__, so a missing or
+        broken model surfaces on the first scoring call instead; it gets the
+        same fallback as a failure in __init__. Errors once the backend has
+        encoded successfully, and errors of other functions, are not handled.
+        
+        Args:
+            consistency_function: Function whose evaluation failed
+            error: The failure
+            
+        Returns:
+            Whether the monitor fell back (the caller then recomputes)
+        """
+        if (consistency_function != self._semantic_consistency
+                or self.semantic_engine.backend_ready):
+            return False
+        warnings.warn(f"Failed to load embedding model: {error}")
+        self.close()
+        self._prefetcher = None
+        self.use_semantic = False
+        self.set_consistency_function(self._default_consistency)
+        print("  Falling back to default consistency")
+        return True
+    
+    # Rows of the pairwise similarity matrix materialized at a time
+    SCORE_BLOCK = 1024
+    
+    def _uses_matrix(self, consistency_function: Callable) -> bool:
+        """Whether scoring can run on the embedding matrix."""
+        return (self._embedding_matrix is not None
+                and consistency_function == self._semantic_consistency)
+    
+    def _sync_matrix(self, contents: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Embedding matrix sync() of contents, once their prefetches land."""
+        if self._prefetcher is not None:
+            self._prefetcher.claim(contents)
+        return self._embedding_matrix.sync(contents, self._belief_flags)
+    
+    def _score_blocks(self, beliefs: Dict[str, Belief]):
+        """
+        Yield (start, pair scores) blocks of the full pairwise score matrix.
+        
+        Equivalent to calling SemanticConsistencyEngine.calculate_consistency
+        pair by pair, but computed as blocked E @ E.T products over the
+        normalized embedding matrix.
+        """
+        engine = self.semantic_engine
+        unit, flags = self._sync_matrix(list(beliefs))
+        for start in range(0, len(unit), self.SCORE_BLOCK):
+            stop = min(start + self.SCORE_BLOCK, len(unit))
+            rows = unit[start:stop]
+            sim = np.concatenate([
+                engine.similarity(rows, unit[column:column + self.SCORE_BLOCK])
+                for column in range(0, len(unit), self.SCORE_BLOCK)
+            ], axis=1)
+            yield start, engine.score_in_place(sim, flags[start:stop], flags)
+    
+    def _matrix_consistency(self, beliefs: Dict[str, Belief]) -> np.ndarray:
+        """Semantic consistency of every belief with the rest of the system."""
+        n = len(beliefs)
+        if n <= 1:
+            return np.ones(n)
+        confidence = np.array([b.confidence for b in beliefs.values()])
+        contents = list(beliefs)
+        unit, flags = self._sync_matrix(contents)
+        if self._approximates(n):
+            sums = self._neighbourhood_sums(contents, unit, flags, confidence)
+        else:
+            sums = self.semantic_engine.consistency_sums(unit, flags, confidence, self.SCORE_BLOCK)
+        return sums / (n - 1)
+    
+    # Below this many beliefs the exact all-pairs path is faster than
+    # building the neighbour index, so neighbours only applies above it
+    APPROXIMATE_MIN_BELIEFS = 8000
+    
+    def _approximates(self, n: int) -> bool:
+        """Whether n beliefs are scored on neighbourhoods instead of all pairs."""
+        return (self._neighbour_index is not None
+                and n >= self.APPROXIMATE_MIN_BELIEFS
+                and n - 1 > self.neighbours)
+    
+    def _neighbour_pairs(self, contents: List[str], unit: np.ndarray, flags: np.ndarray):
+        """
+        (rows, cols, sims, exact scores) of every belief's top-k neighbours.
+        
+        The index is rebuilt only when the belief contents change: H(t) and
+        the inconsistencies of one generation, or of generations that only
+        changed confidences, share the same neighbour pairs.
+        """
+        cached = self._cached_neighbours
+        if cached is not None and cached[0] == contents:
+            return cached[1]
+        rows, cols, sims = self._neighbour_index.neighbours(unit, self.neighbours)
+        scores = self.semantic_engine.score_aligned(sims, flags[rows], flags[cols])
+        pairs = (rows, cols, sims, scores)
+        self._cached_neighbours = (contents, pairs)
+        return pairs
+    
+    # Beliefs sampled to estimate each belief's pairs outside its neighbours
+    SAMPLE_COLUMNS = 512
+    
+    def _neighbourhood_sums(self, contents: List[str], unit: np.ndarray,
+                            flags: np.ndarray, confidence: np.ndarray) -> np.ndarray:
+        """
+        Approximate consistency_sums: exact over neighbours, sampled elsewhere.
+        
+        Each belief's top-k neighbours are scored exactly. Its remaining
+        n - 1 - k pairs are mostly distant and carry no contradiction, so
+        they are taken in aggregate: their mean weighted score is estimated
+        from a fixed sample of SAMPLE_COLUMNS beliefs (scored as one block
+        product) and multiplied by their count.
+        """
+        n = len(unit)
+        engine = self.semantic_engine
+        rows, cols, _, scores = self._neighbour_pairs(contents, unit, flags)
+        sums = np.bincount(rows, weights=confidence[cols] * scores, minlength=n)
+        remaining = n - 1 - np.bincount(rows, minlength=n)
+        
+        rng = np.random.default_rng(self._neighbour_index.seed)
+        sample = np.sort(rng.choice(n, min(n, self.SAMPLE_COLUMNS), replace=False))
+        position = np.full(n, -1)
+        position[sample] = np.arange(len(sample))
+        
+        # Sampled pairs already counted: neighbours and the belief itself
+        sampled = position[cols] >= 0
+        excluded_rows = np.concatenate([rows[sampled], sample])
+        excluded_cols = np.concatenate([position[cols[sampled]], np.arange(len(sample))])
+        by_row = np.argsort(excluded_rows, kind='stable')
+        excluded_rows, excluded_cols = excluded_rows[by_row], excluded_cols[by_row]
+        
+        weights = confidence[sample].astype(np.float32)
+        scratch: Dict[str, np.ndarray] = {}
+        for start in range(0, n, self.SCORE_BLOCK):
+            stop = min(start + self.SCORE_BLOCK, n)
+            block = engine.score_in_place(
+                engine.similarity(unit[start:stop], unit[sample]),
+                flags[start:stop], flags[sample], scratch
+            )
+            block *= weights
+            counted = np.ones(block.shape, dtype=bool)
+            lo, hi = np.searchsorted(excluded_rows, [start, stop])
+            counted[excluded_rows[lo:hi] - start, excluded_cols[lo:hi]] = False
+            block *= counted
+            count = counted.sum(axis=1)
+            mean = block.sum(axis=1, dtype=np.float64) / np.maximum(count, 1)
+            sums[start:stop] += remaining[start:stop] * mean
+        return sums
+    
+    def _matrix_inconsistencies(self, beliefs: Dict[str, Belief],
+                                threshold: float) -> List[Tuple[str, str, float]]:
+        """Pairs whose confidence-weighted semantic score is below threshold."""
+        contents = list(beliefs)
+        confidence = np.array([b.confidence for b in beliefs.values()])
+        if self._approximates(len(contents)):
+            # Only neighbour pairs are scored; the rest count as neutral
+            unit, flags = self._sync_matrix(contents)
+            rows, cols, _, scores = self._neighbour_pairs(contents, unit, flags)
+            low, high = np.minimum(rows, cols), np.maximum(rows, cols)
+            _, unique = np.unique(low * len(contents) + high, return_index=True)
+            low, high = low[unique], high[unique]
+            avg = scores[unique] * (confidence[low] + confidence[high]) / 2
+            return [
+                (contents[low[p]], contents[high[p]], float(avg[p]))
+                for p in np.flatnonzero(avg < threshold)
+            ]
+        inconsistencies = []
+        for start, pair in self._score_blocks(beliefs):
+            rows = np.arange(start, start + len(pair))
+            avg = pair * (confidence[rows, None] + confidence[None, :]) / 2
+            below = (avg < threshold) & (np.arange(len(contents))[None, :] > rows[:, None])
+            for i, j in zip(*np.nonzero(below)):
+                inconsistencies.append((contents[start + i], contents[j], float(avg[i, j])))
+        return inconsistencies
+    
     def _semantic_consistency(self, belief: Belief,
                             belief_system: Dict[str, Belief]) -> float:
         """
@@ -423,7 +2296,10 @@ class SemanticHarmonyMonitor:
     
     def set_consistency_function(self, func: Callable[[Belief, Dict[str, Belief]], float]):
         """Set custom consistency function."""
-        self.consistency_function = func
+        with self.write_lock:
+            self.consistency_function = func
+            self.generation += 1
+            self._notify('on_consistency_function_changed', func)
     
     def calculate_consistency(self, timestamp: float = None) -> float:
         """
@@ -435,43 +2311,79 @@ class SemanticHarmonyMonitor:
         Returns:
             Consistency score H(t) ∈ [0, 1]
         """
-        if not self.beliefs:
+        key, beliefs = self.snapshot()
+        if not beliefs:
             return 1.0
         
         if timestamp is None:
             timestamp = datetime.now().timestamp()
         
-        consistency_scores = [
-            self.consistency_function(belief, self.beliefs)
-            for belief in self.beliefs.values()
-        ]
-        
-        H_t = np.mean(consistency_scores)
+        cached = self._cached_H
+        if cached is not None and cached[0] == key:
+            H_t = cached[1]
+        else:
+            consistency_function = key[2]
+            try:
+                if self._uses_matrix(consistency_function):
+                    consistency_scores = self._matrix_consistency(beliefs)
+                else:
+                    consistency_scores = [
+                        consistency_function(belief, beliefs)
+                        for belief in beliefs.values()
+                    ]
+            except Exception as e:
+                if not self._fall_back(consistency_function, e):
+                    raise
+                return self.calculate_consistency(timestamp)
+            
+            H_t = np.mean(consistency_scores)
+            self._cached_H = (key, H_t)
         self.consistency_history.append((timestamp, H_t))
         
         return H_t
     
     def get_inconsistencies(self, threshold: float = 0.5) -> List[Tuple[str, str, float]]:
         """Find inconsistent belief pairs."""
+        key, beliefs = self.snapshot()
+        cached = self._cached_inconsistencies.get(threshold)
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
+        
         inconsistencies = []
+        consistency_function = key[2]
         
-        beliefs_list = list(self.beliefs.values())
-        for i, belief1 in enumerate(beliefs_list):
-            for belief2 in beliefs_list[i+1:]:
-                temp_system = {belief1.content: belief1, belief2.content: belief2}
-                c1 = self.consistency_function(belief1, temp_system)
-                c2 = self.consistency_function(belief2, temp_system)
-                
-                avg_consistency = (c1 + c2) / 2
-                
-                if avg_consistency < threshold:
-                    inconsistencies.append((
-                        belief1.content,
-                        belief2.content,
-                        avg_consistency
-                    ))
-        
-        return sorted(inconsistencies, key=lambda x: x[2])
+        if self._uses_matrix(consistency_function):
+            try:
+                inconsistencies = self._matrix_inconsistencies(beliefs, threshold)
+            except Exception as e:
+                if not self._fall_back(consistency_function, e):
+                    raise
+                return self.get_inconsistencies(threshold)
+        else:
+            beliefs_list = list(beliefs.values())
+            for i, belief1 in enumerate(beliefs_list):
+                for belief2 in beliefs_list[i+1:]:
+                    temp_system = {belief1.content: belief1, belief2.content: belief2}
+                    c1 = consistency_function(belief1, temp_system)
+                    c2 = consistency_function(belief2, temp_system)
+                    
+                    avg_consistency = (c1 + c2) / 2
+                    
+                    if avg_consistency < threshold:
+                        inconsistencies.append((
+                            belief1.content,
+                            belief2.content,
+                            avg_consistency
+                        ))
+        
+        inconsistencies.sort(key=lambda x: x[2])
+        fresh = {
+            t: entry for t, entry in self._cached_inconsistencies.items()
+            if entry[0] == key
+        }
+        fresh[threshold] = (key, inconsistencies)
+        self._cached_inconsistencies = fresh
+        return list(inconsistencies)
     
     def get_consistency_trend(self, window: int = 10) -> str:
         """Analyze consistency trend."""
@@ -501,17 +2413,13 @@ class SemanticHarmonyMonitor:
         if not self.use_semantic:
             return {'error': 'Semantic mode not enabled'}
         
-        if not self.beliefs:
+        _, beliefs = self.snapshot()
+        if not beliefs:
             return {'clusters': [], 'themes': []}
         
-        # Get all embeddings
-        embeddings = []
-        belief_contents = []
-        for belief in self.beliefs.values():
-            embeddings.append(self.semantic_engine.get_embedding(belief.content))
-            belief_contents.append(belief.content)
-        
-        embeddings = np.array(embeddings)
+        # Get all embeddings in one batch
+        belief_contents = list(beliefs)
+        embeddings = self.semantic_engine.get_embeddings(belief_contents)
         
         # Simple clustering (could be enhanced with proper clustering algorithms)
         from scipy.cluster.hierarchy import linkage, fcluster
@@ -552,7 +2460,15 @@ class SachiConsistencyCheckerV32:
     def __init__(self, 
                  core_values: List[str] = None,
                  use_semantic: bool = True,
-                 semantic_model: str = 'all-MiniLM-L6-v2'):
+                 semantic_model: str = 'all-MiniLM-L6-v2',
+                 cache_max_entries: int = None,
+                 cache_max_bytes: int = None,
+                 embedding_store: str = None,
+                 neighbours: int = None,
+                 embedding_dtype: str = 'float32',
+                 warm_up: bool = False,
+                 embedding_backend: EmbeddingBackend = None,
+                 prefetch_on_add: bool = False):
         """
         Initialize v3.2 consistency checker.
         
@@ -560,10 +2476,28 @@ class SachiConsistencyCheckerV32:
             core_values: List of core value statements
             use_semantic: Enable semantic consistency
             semantic_model: Model for semantic embeddings
+            cache_max_entries: Embedding cache entry limit (None: unbounded)
+            cache_max_bytes: Embedding cache byte limit (None: unbounded)
+            embedding_store: Directory of a shared DiskEmbeddingStore
+            neighbours: Approximate top-k neighbourhood size for H(t)
+                (None: exact, see SemanticHarmonyMonitor)
+            embedding_dtype: Embedding storage, 'float32', 'float16' or 'int8'
+            warm_up: Load the embedding model in the background right away
+            embedding_backend: Source of embeddings (see SemanticHarmonyMonitor)
+            prefetch_on_add: Encode beliefs in the background as they are added
+                (close() the checker to stop the thread)
         """
         self.harmony = SemanticHarmonyMonitor(
             use_semantic=use_semantic,
-            semantic_model=semantic_model
+            semantic_model=semantic_model,
+            cache_max_entries=cache_max_entries,
+            cache_max_bytes=cache_max_bytes,
+            embedding_store=embedding_store,
+            neighbours=neighbours,
+            embedding_dtype=embedding_dtype,
+            warm_up=warm_up,
+            embedding_backend=embedding_backend,
+            prefetch_on_add=prefetch_on_add
         )
         self.actions = ActionClassifier()
         self.recovery = RecoveryMonitor(self.harmony)
@@ -571,7 +2505,24 @@ class SachiConsistencyCheckerV32:
         self.values = ValueConsistencyMonitor(core_values)
         
         self.interaction_history: List[Interaction] = []
-        self.use_semantic = use_semantic and SEMANTIC_AVAILABLE
+        self._pin_core_values()
+        self.values.add_observer(self)
+    
+    @property
+    def use_semantic(self) -> bool:
+        """Whether H(t) is semantic (False after a fallback, see harmony)."""
+        return self.harmony.use_semantic
+    
+    def _pin_core_values(self):
+        """Core values are scored on every report; keep them cached."""
+        if self.harmony.use_semantic:
+            self.harmony.semantic_engine.pin_embeddings(list(self.values.core_values))
+    
+    def on_core_value_added(self, monitor: ValueConsistencyMonitor, value: str,
+                            importance: float):
+        """Observer hook: pin values added after construction too."""
+        if self.harmony.use_semantic:
+            self.harmony.semantic_engine.pin_embeddings([value])
     
     def process_interaction(self, content: str, timestamp: float = None) -> Dict:
         """Process interaction through complete pipeline."""
@@ -597,7 +2548,7 @@ class SachiConsistencyCheckerV32:
         )
         self.interaction_history.append(interaction)
         
-        disruption_detected = self.recovery.detect_disruption()
+        disruption_detected = self.recovery.detect_disruption(current_H=H_before)
         H_after = H_before + consistency_impact
         
         return {
@@ -616,10 +2567,11 @@ class SachiConsistencyCheckerV32:
         timestamp = datetime.now().timestamp()
         
         H_t = self.harmony.calculate_consistency(timestamp)
+        self.harmony.prefetch_embeddings(self.values.core_values)
         value_scores = self.values.monitor_all_values(self.harmony)
         inconsistencies = self.harmony.get_inconsistencies()
         action_dist = self.actions.get_distribution()
-        recovery_status = self.recovery.monitor_recovery()
+        recovery_status = self.recovery.monitor_recovery(current_H=H_t)
         
         component_scores = {
             'harmony': H_t,
@@ -657,15 +2609,61 @@ class SachiConsistencyCheckerV32:
             recommendations=recommendations
         )
     
+    EMBEDDINGS_SUFFIX = '.embeddings.npz'
+    
+    def get_state(self) -> Dict:
+        """Collect complete system state (v3.1 format plus semantic settings)."""
+        state = checker_state(self)
+        state['semantic'] = {
+            'use_semantic': self.use_semantic,
+            'model_name': self.harmony.semantic_engine.model_name
+            if self.harmony.use_semantic else None
+        }
+        return state
+    
+    def load_state(self, state: Dict):
+        """Restore system state from a dictionary produced by get_state."""
+        load_checker_state(self, state)
+    
     def export_state(self, filepath: str):
-        """Export system state."""
-        # Implementation similar to v3.1
-        pass
+        """
+        Export system state to JSON.
+        
+        The embedding cache is written next to it (filepath + '.embeddings.npz')
+        so a restart does not re-encode known beliefs.
+        
+        Args:
+            filepath: Path to save state
+        """
+        with open(filepath, 'w') as f:
+            json.dump(self.get_state(), f, indent=2)
+        if self.harmony.use_semantic:
+            self.harmony.semantic_engine.save_cache(filepath + self.EMBEDDINGS_SUFFIX)
     
     def import_state(self, filepath: str):
-        """Import system state."""
-        # Implementation similar to v3.1
-        pass
+        """
+        Import system state from JSON, reloading saved embeddings.
+        
+        Args:
+            filepath: Path to state file
+        """
+        embeddings_path = filepath + self.EMBEDDINGS_SUFFIX
+        if self.harmony.use_semantic and os.path.exists(embeddings_path):
+            self.harmony.semantic_engine.load_cache(embeddings_path)
+        
+        with open(filepath, 'r') as f:
+            state = json.load(f)
+        self.load_state(state)
+    
+    def close(self):
+        """Stop background work (see SemanticHarmonyMonitor.close)."""
+        self.harmony.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
 
 # ============================================================================
@@ -36,10 +36,21 @@ Usage:
 
 import numpy as np
 from typing import List, Dict, Tuple, Optional, Set, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+import codecs
+import copy
+import hashlib
 import json
+import mmap
+import multiprocessing
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import zlib
 
 
 # ============================================================================
@@ -124,6 +135,31 @@ class ConsistencyReport:
         }
 
 
+# ============================================================================
+# Copy-on-write Support
+# ============================================================================
+
+def _cow_fork(obj, fields: Tuple[str, ...]):
+    """
+    Shallow-copy obj in O(1), sharing the containers named in fields.
+    
+    Both obj and the clone mark those fields as shared; whichever side
+    mutates one first takes a private copy through _cow_own.
+    """
+    obj._cow_shared = obj._cow_shared | frozenset(fields)
+    return copy.copy(obj)
+
+
+def _cow_own(obj, name: str):
+    """Return obj.<name> for mutation, copying it first if shared by a fork."""
+    value = getattr(obj, name)
+    if name in obj._cow_shared:
+        value = copy.copy(value)
+        setattr(obj, name, value)
+        obj._cow_shared = obj._cow_shared - {name}
+    return value
+
+
 # ============================================================================
 # Harmony Monitor (H(t) Component)
 # ============================================================================
@@ -133,6 +169,20 @@ class HarmonyMonitor:
     Implements H(t) = (1/n)∑ᵢ₌₁ⁿ c(bᵢ(t), B(t))
     
     Monitors internal consistency of the belief system over time.
+    
+    Thread safety:
+        Belief mutations are serialized by write_lock. Readers never block:
+        they work on a snapshot() of the belief system taken at call time,
+        so H(t), inconsistency and report reads run concurrently with each
+        other and with writers.
+    
+    Change notification:
+        generation increases on every belief or consistency function change.
+        Observers registered with add_observer may implement any of
+        on_belief_added(monitor, belief), on_belief_removed(monitor, belief)
+        and on_consistency_function_changed(monitor, func). Hooks run
+        synchronously under write_lock after the change is applied;
+        replacing a belief notifies its removal and then the addition.
     """
     
     def __init__(self, consistency_threshold: float = 0.7):
@@ -147,6 +197,106 @@ class HarmonyMonitor:
         self.consistency_threshold = consistency_threshold
         self.consistency_function: Callable = self._default_consistency
         
+        # Dirty tracking for derived results (H(t), inconsistencies)
+        self.generation = 0
+        self._cached_H: Optional[Tuple[tuple, float]] = None
+        self._cached_inconsistencies: Dict[float, Tuple[tuple, List]] = {}
+        
+        # Serializes writers; hold it to apply several mutations atomically
+        self.write_lock = threading.RLock()
+        self._observers: List[object] = []
+        
+        # Containers shared with fork() relatives until first write
+        self._cow_shared: frozenset = frozenset()
+    
+    def fork(self) -> 'HarmonyMonitor':
+        """
+        Copy-on-write clone of this monitor in O(1).
+        
+        The clone shares the belief dictionary, consistency history, cached
+        results and consistency function with this monitor; either side
+        copies a container on its first mutation. The clone starts without
+        observers and with its own write lock.
+        
+        Returns:
+            Independent HarmonyMonitor with the same state
+        """
+        with self.write_lock:
+            clone = _cow_fork(self, ('beliefs', 'consistency_history'))
+        clone.write_lock = threading.RLock()
+        clone._observers = []
+        return clone
+    
+    def add_observer(self, observer: object):
+        """
+        Register an observer for belief system changes.
+        
+        Args:
+            observer: Object implementing any of the on_* hooks
+        """
+        with self.write_lock:
+            if not any(o is observer for o in self._observers):
+                self._observers = self._observers + [observer]
+    
+    def remove_observer(self, observer: object) -> bool:
+        """
+        Unregister an observer.
+        
+        Args:
+            observer: Previously registered observer
+            
+        Returns:
+            True if removed, False if not registered
+        """
+        with self.write_lock:
+            remaining = [o for o in self._observers if o is not observer]
+            removed = len(remaining) != len(self._observers)
+            self._observers = remaining
+        return removed
+    
+    def _notify(self, hook: str, *args):
+        """Call hook(self, *args) on every observer that implements it."""
+        for observer in self._observers:
+            handler = getattr(observer, hook, None)
+            if handler is not None:
+                handler(self, *args)
+        
+    def cache_key(self) -> tuple:
+        """
+        Key identifying the inputs of H(t).
+        
+        Changes whenever a belief is added or removed or the consistency
+        function is replaced. Derived results computed under an equal key
+        can be reused.
+        
+        Returns:
+            Opaque, comparable cache key
+        """
+        return (self.generation, len(self.beliefs), self.consistency_function)
+    
+    def snapshot(self) -> Tuple[tuple, Dict[str, Belief]]:
+        """
+        Take a consistent read-only view of the belief system.
+        
+        The cache key is read before copying, so a result computed from the
+        copy can never be cached under a key newer than its inputs.
+        
+        Returns:
+            Tuple of (cache_key, copy of beliefs)
+        """
+        key = self.cache_key()
+        return key, dict(self.beliefs)
+    
+    def invalidate_cache(self):
+        """
+        Mark all derived results as stale.
+        
+        Only needed after mutating self.beliefs or a Belief directly instead
+        of going through add_belief/remove_belief.
+        """
+        with self.write_lock:
+            self.generation += 1
+    
     def add_belief(self, content: str, timestamp: float = None, 
                    confidence: float = 1.0, category: str = "general",
                    dependencies: Set[str] = None) -> str:
@@ -177,7 +327,14 @@ class HarmonyMonitor:
             dependencies=dependencies
         )
         
-        self.beliefs[content] = belief
+        with self.write_lock:
+            beliefs = _cow_own(self, 'beliefs')
+            previous = beliefs.get(content)
+            beliefs[content] = belief
+            self.generation += 1
+            if previous is not None:
+                self._notify('on_belief_removed', previous)
+            self._notify('on_belief_added', belief)
         return content
     
     def remove_belief(self, content: str) -> bool:
@@ -190,11 +347,42 @@ class HarmonyMonitor:
         Returns:
             True if removed, False if not found
         """
-        if content in self.beliefs:
-            del self.beliefs[content]
-            return True
+        with self.write_lock:
+            if content in self.beliefs:
+                belief = _cow_own(self, 'beliefs').pop(content)
+                self.generation += 1
+                self._notify('on_belief_removed', belief)
+                return True
         return False
     
+    def clear_beliefs(self):
+        """Remove every belief, notifying observers of each removal."""
+        with self.write_lock:
+            for content in list(self.beliefs):
+                self.remove_belief(content)
+    
+    def replace_beliefs(self, beliefs: List[Belief]):
+        """
+        Swap in a whole belief system at once (bulk restore).
+        
+        Cheaper than clear_beliefs plus add_belief per belief: the new
+        dictionary is built up front and installed with one generation bump.
+        Observers are still notified of every removal and addition.
+        
+        Args:
+            beliefs: Beliefs making up the new system
+        """
+        new_beliefs = {belief.content: belief for belief in beliefs}
+        with self.write_lock:
+            old_beliefs = self.beliefs
+            self.beliefs = new_beliefs
+            self.generation += 1
+            if self._observers:
+                for belief in old_beliefs.values():
+                    self._notify('on_belief_removed', belief)
+                for belief in new_beliefs.values():
+                    self._notify('on_belief_added', belief)
+    
     def set_consistency_function(self, func: Callable[[Belief, Dict[str, Belief]], float]):
         """
         Set custom consistency function c(bᵢ, B).
@@ -202,7 +390,10 @@ class HarmonyMonitor:
         Args:
             func: Function that takes (belief, belief_system) and returns consistency [0,1]
         """
-        self.consistency_function = func
+        with self.write_lock:
+            self.consistency_function = func
+            self.generation += 1
+            self._notify('on_consistency_function_changed', func)
     
     def _default_consistency(self, belief: Belief, belief_system: Dict[str, Belief]) -> float:
         """
@@ -272,23 +463,30 @@ class HarmonyMonitor:
         Returns:
             Consistency score H(t) ∈ [0, 1]
         """
-        if not self.beliefs:
+        key, beliefs = self.snapshot()
+        if not beliefs:
             return 1.0  # Empty system is trivially consistent
             
         if timestamp is None:
             timestamp = datetime.now().timestamp()
         
-        # Calculate consistency for each belief
-        consistency_scores = [
-            self.consistency_function(belief, self.beliefs)
-            for belief in self.beliefs.values()
-        ]
-        
-        # Average consistency
-        H_t = np.mean(consistency_scores)
+        cached = self._cached_H
+        if cached is not None and cached[0] == key:
+            H_t = cached[1]
+        else:
+            # Calculate consistency for each belief (function as of snapshot)
+            consistency_function = key[2]
+            consistency_scores = [
+                consistency_function(belief, beliefs)
+                for belief in beliefs.values()
+            ]
+            
+            # Average consistency
+            H_t = np.mean(consistency_scores)
+            self._cached_H = (key, H_t)
         
         # Record history
-        self.consistency_history.append((timestamp, H_t))
+        _cow_own(self, 'consistency_history').append((timestamp, H_t))
         
         return H_t
     
@@ -302,15 +500,21 @@ class HarmonyMonitor:
         Returns:
             List of (belief1, belief2, consistency_score) tuples
         """
+        key, beliefs = self.snapshot()
+        cached = self._cached_inconsistencies.get(threshold)
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
+        
         inconsistencies = []
+        consistency_function = key[2]
         
-        beliefs_list = list(self.beliefs.values())
+        beliefs_list = list(beliefs.values())
         for i, belief1 in enumerate(beliefs_list):
             for belief2 in beliefs_list[i+1:]:
                 # Calculate pairwise consistency
                 temp_system = {belief1.content: belief1, belief2.content: belief2}
-                c1 = self.consistency_function(belief1, temp_system)
-                c2 = self.consistency_function(belief2, temp_system)
+                c1 = consistency_function(belief1, temp_system)
+                c2 = consistency_function(belief2, temp_system)
                 
                 avg_consistency = (c1 + c2) / 2
                 
@@ -321,7 +525,15 @@ class HarmonyMonitor:
                         avg_consistency
                     ))
         
-        return sorted(inconsistencies, key=lambda x: x[2])
+        inconsistencies.sort(key=lambda x: x[2])
+        # Replace rather than mutate, so concurrent readers never see a resize
+        fresh = {
+            t: entry for t, entry in self._cached_inconsistencies.items()
+            if entry[0] == key
+        }
+        fresh[threshold] = (key, inconsistencies)
+        self._cached_inconsistencies = fresh
+        return list(inconsistencies)
     
     def get_consistency_trend(self, window: int = 10) -> str:
         """
@@ -359,6 +571,11 @@ class ActionClassifier:
     Implements A(t) ∈ {supportive, harmful, neutral, system}
     
     Classifies interactions based on their impact on the AI system.
+    
+    Thread safety:
+        classify, classify_batch and get_distribution may run concurrently.
+        They only append to classification_history and replace cached
+        results wholesale, both of which are atomic operations.
     """
     
     def __init__(self):
@@ -366,6 +583,21 @@ class ActionClassifier:
         self.classification_history: List[Tuple[float, str, str]] = []
         self.harmful_patterns: List[str] = self._load_harmful_patterns()
         self.supportive_patterns: List[str] = self._load_supportive_patterns()
+        self._cached_distribution: Optional[Tuple[List, tuple, Dict[str, float]]] = None
+        self._matcher: Optional[Tuple[tuple, re.Pattern]] = None
+        self._cow_shared: frozenset = frozenset()
+    
+    def fork(self) -> 'ActionClassifier':
+        """
+        Copy-on-write clone sharing classification history until written.
+        
+        The pattern lists are mutated directly by callers, so they cannot
+        be shared copy-on-write; being short, they are copied right away.
+        """
+        clone = _cow_fork(self, ('classification_history',))
+        clone.harmful_patterns = list(self.harmful_patterns)
+        clone.supportive_patterns = list(self.supportive_patterns)
+        return clone
     
     def _load_harmful_patterns(self) -> List[str]:
         """
@@ -400,6 +632,25 @@ class ActionClassifier:
             'guide'
         ]
     
+    # System commands
+    SYSTEM_KEYWORDS = ['reset', 'restart', 'clear context', 'new session']
+    
+    # Classification order and confidence, highest priority first
+    _CATEGORY_CONFIDENCE = [
+        ('system', 0.95),
+        ('harmful', 0.85),
+        ('supportive', 0.80),
+    ]
+    _NEUTRAL_CONFIDENCE = 0.60
+    
+    def _pattern_groups(self) -> Dict[str, List[str]]:
+        """Patterns of each category in _CATEGORY_CONFIDENCE."""
+        return {
+            'system': self.SYSTEM_KEYWORDS,
+            'harmful': self.harmful_patterns,
+            'supportive': self.supportive_patterns,
+        }
+    
     def classify(self, interaction: str, timestamp: float = None) -> Tuple[str, float]:
         """
         Classify an interaction.
@@ -417,32 +668,85 @@ class ActionClassifier:
             timestamp = datetime.now().timestamp()
         
         interaction_lower = interaction.lower()
+        groups = self._pattern_groups()
         
-        # System commands (high confidence)
-        system_keywords = ['reset', 'restart', 'clear context', 'new session']
-        if any(kw in interaction_lower for kw in system_keywords):
-            classification = 'system'
-            confidence = 0.95
+        # First category with a matching pattern wins; default to neutral
+        classification, confidence = 'neutral', self._NEUTRAL_CONFIDENCE
+        for name, category_confidence in self._CATEGORY_CONFIDENCE:
+            if any(pattern in interaction_lower for pattern in groups[name]):
+                classification, confidence = name, category_confidence
+                break
         
-        # Harmful patterns
-        elif any(pattern in interaction_lower for pattern in self.harmful_patterns):
-            classification = 'harmful'
-            confidence = 0.85
+        # Record classification
+        _cow_own(self, 'classification_history').append((timestamp, interaction, classification))
         
-        # Supportive patterns
-        elif any(pattern in interaction_lower for pattern in self.supportive_patterns):
-            classification = 'supportive'
-            confidence = 0.80
+        return classification, confidence
+    
+    def _get_matcher(self) -> re.Pattern:
+        """
+        Compile all patterns into one regex, rebuilt when the patterns change.
         
-        # Default to neutral
-        else:
-            classification = 'neutral'
-            confidence = 0.60
+        Each alternative sits inside a lookahead, so the regex reports every
+        (possibly overlapping) occurrence, and at any position the highest
+        priority category wins, matching the substring checks in classify.
+        """
+        groups = self._pattern_groups()
+        key = tuple(tuple(groups[name]) for name, _ in self._CATEGORY_CONFIDENCE)
+        if self._matcher is None or self._matcher[0] != key:
+            alternatives = [
+                f"(?P<{name}>{'|'.join(map(re.escape, groups[name]))})"
+                for name, _ in self._CATEGORY_CONFIDENCE
+                if groups[name]
+            ]
+            # With no patterns at all, a lookahead that never matches
+            pattern = f"(?=(?:{'|'.join(alternatives)}))" if alternatives else "(?!)"
+            self._matcher = (key, re.compile(pattern))
+        return self._matcher[1]
+    
+    def classify_batch(self, interactions: List[str],
+                       timestamps: List[float] = None) -> Tuple[List[str], np.ndarray]:
+        """
+        Classify many interactions with a single compiled matcher.
         
-        # Record classification
-        self.classification_history.append((timestamp, interaction, classification))
+        Gives the same classifications as calling classify on each
+        interaction, and records them in the same order.
         
-        return classification, confidence
+        Args:
+            interactions: Interaction contents
+            timestamps: When each interaction occurred (default: now for all)
+            
+        Returns:
+            Tuple of (classifications, confidences)
+        """
+        if timestamps is None:
+            timestamps = [datetime.now().timestamp()] * len(interactions)
+        elif len(timestamps) != len(interactions):
+            raise ValueError("interactions and timestamps must have the same length")
+        
+        matcher = self._get_matcher()
+        rank = {name: i for i, (name, _) in enumerate(self._CATEGORY_CONFIDENCE)}
+        
+        classifications = []
+        confidences = np.empty(len(interactions))
+        for i, interaction in enumerate(interactions):
+            best = len(self._CATEGORY_CONFIDENCE)
+            for match in matcher.finditer(interaction.lower()):
+                best = min(best, rank[match.lastgroup])
+                if best == 0:
+                    break
+            
+            if best < len(self._CATEGORY_CONFIDENCE):
+                classification, confidence = self._CATEGORY_CONFIDENCE[best]
+            else:
+                classification, confidence = 'neutral', self._NEUTRAL_CONFIDENCE
+            classifications.append(classification)
+            confidences[i] = confidence
+        
+        _cow_own(self, 'classification_history').extend(
+            zip(timestamps, interactions, classifications)
+        )
+        
+        return classifications, confidences
     
     def get_distribution(self, window: int = 100) -> Dict[str, float]:
         """
@@ -454,17 +758,27 @@ class ActionClassifier:
         Returns:
             Dictionary of classification proportions
         """
-        recent = self.classification_history[-window:]
+        # History is append-only; a replaced list or new entry invalidates
+        history = self.classification_history
+        key = (len(history), window)
+        cached = self._cached_distribution
+        if cached is not None and cached[0] is history and cached[1] == key:
+            return dict(cached[2])
         
-        if not recent:
-            return {'supportive': 0, 'harmful': 0, 'neutral': 0, 'system': 0}
+        recent = history[-window:]
         
-        counts = defaultdict(int)
-        for _, _, classification in recent:
-            counts[classification] += 1
+        if not recent:
+            distribution = {'supportive': 0, 'harmful': 0, 'neutral': 0, 'system': 0}
+        else:
+            counts = defaultdict(int)
+            for _, _, classification in recent:
+                counts[classification] += 1
+            
+            total = len(recent)
+            distribution = {k: v/total for k, v in counts.items()}
         
-        total = len(recent)
-        return {k: v/total for k, v in counts.items()}
+        self._cached_distribution = (history, key, distribution)
+        return dict(distribution)
 
 
 # ============================================================================
@@ -489,6 +803,21 @@ class RecoveryMonitor:
         self.baseline_H: Optional[float] = None
         self.disruption_events: List[Dict] = []
         self.recovery_events: List[Dict] = []
+        self._cow_shared: frozenset = frozenset()
+    
+    def fork(self, harmony_monitor: HarmonyMonitor) -> 'RecoveryMonitor':
+        """
+        Copy-on-write clone attached to another harmony monitor.
+        
+        Args:
+            harmony_monitor: Monitor the clone tracks (usually a fork)
+            
+        Returns:
+            RecoveryMonitor sharing event history until written
+        """
+        clone = _cow_fork(self, ('disruption_events', 'recovery_events'))
+        clone.harmony_monitor = harmony_monitor
+        return clone
     
     def set_baseline(self, H0: float = None):
         """
@@ -502,25 +831,29 @@ class RecoveryMonitor:
         else:
             self.baseline_H = H0
     
-    def detect_disruption(self, threshold: float = 0.15) -> bool:
+    def detect_disruption(self, threshold: float = 0.15,
+                          current_H: float = None) -> bool:
         """
         Detect if consistency has dropped significantly.
         
         Args:
             threshold: Minimum drop to consider disruption
+            current_H: Already computed H(t) for the current belief system
+                (default: calculate it now)
             
         Returns:
             True if disruption detected
         """
         if self.baseline_H is None:
-            self.set_baseline()
+            self.set_baseline(current_H)
             return False
         
-        current_H = self.harmony_monitor.calculate_consistency()
+        if current_H is None:
+            current_H = self.harmony_monitor.calculate_consistency()
         drop = self.baseline_H - current_H
         
         if drop >= threshold:
-            self.disruption_events.append({
+            _cow_own(self, 'disruption_events').append({
                 'timestamp': datetime.now().timestamp(),
                 'H_baseline': self.baseline_H,
                 'H_disrupted': current_H,
@@ -575,10 +908,14 @@ class RecoveryMonitor:
         lambda_estimate = -np.log(1 - recovery_threshold) / observed_recovery_time
         return lambda_estimate
     
-    def monitor_recovery(self) -> Dict:
+    def monitor_recovery(self, current_H: float = None) -> Dict:
         """
         Monitor ongoing recovery process.
         
+        Args:
+            current_H: Already computed H(t) for the current belief system
+                (default: calculate it now)
+        
         Returns:
             Recovery status dictionary
         """
@@ -586,7 +923,8 @@ class RecoveryMonitor:
             return {'status': 'no_disruption'}
         
         last_disruption = self.disruption_events[-1]
-        current_H = self.harmony_monitor.calculate_consistency()
+        if current_H is None:
+            current_H = self.harmony_monitor.calculate_consistency()
         
         recovery_progress = (current_H - last_disruption['H_disrupted']) / \
                           (self.baseline_H - last_disruption['H_disrupted'])
@@ -608,13 +946,34 @@ class GrowthTracker:
     """
     Implements G(t) = capacity(t) - capacity(t-1)
     
-    Tracks capability expansion over time.
+    Tracks capability expansion over time. Observers registered with
+    add_observer receive on_capacity_measured(tracker, domain, score, timestamp).
     """
     
     def __init__(self):
         """Initialize Growth Tracker."""
         self.capacity_history: List[Tuple[float, Dict[str, float]]] = []
         self.domains: Set[str] = set()
+        self._observers: List[object] = []
+        self._cow_shared: frozenset = frozenset()
+    
+    def fork(self) -> 'GrowthTracker':
+        """Copy-on-write clone sharing capacity history until written."""
+        clone = _cow_fork(self, ('capacity_history', 'domains'))
+        clone._observers = []
+        return clone
+    
+    def add_observer(self, observer: object):
+        """Register an observer (see HarmonyMonitor.add_observer)."""
+        if not any(o is observer for o in self._observers):
+            self._observers = self._observers + [observer]
+    
+    def remove_observer(self, observer: object) -> bool:
+        """Unregister an observer."""
+        remaining = [o for o in self._observers if o is not observer]
+        removed = len(remaining) != len(self._observers)
+        self._observers = remaining
+        return removed
     
     def add_capacity_measurement(self, domain: str, score: float, 
                                  timestamp: float = None):
@@ -629,17 +988,25 @@ class GrowthTracker:
         if timestamp is None:
             timestamp = datetime.now().timestamp()
         
-        self.domains.add(domain)
+        if domain not in self.domains:
+            _cow_own(self, 'domains').add(domain)
+        
+        for observer in self._observers:
+            handler = getattr(observer, 'on_capacity_measured', None)
+            if handler is not None:
+                handler(self, domain, score, timestamp)
         
-        # Find or create entry for this timestamp
-        for i, (ts, capacities) in enumerate(self.capacity_history):
+        # Find or create entry for this timestamp. Entries are replaced, not
+        # updated in place, since forks may share them.
+        capacity_history = _cow_own(self, 'capacity_history')
+        for i, (ts, capacities) in enumerate(capacity_history):
             if abs(ts - timestamp) < 1e-6:  # Same timestamp
-                capacities[domain] = score
+                capacity_history[i] = (ts, {**capacities, domain: score})
                 return
         
         # New timestamp
-        self.capacity_history.append((timestamp, {domain: score}))
-        self.capacity_history.sort(key=lambda x: x[0])
+        capacity_history.append((timestamp, {domain: score}))
+        capacity_history.sort(key=lambda x: x[0])
     
     def calculate_growth(self, domain: str = None) -> float:
         """
@@ -719,6 +1086,11 @@ class ValueConsistencyMonitor:
     Implements V(x,t) = consistency(beliefs(x,t), core_values)
     
     Monitors consistency between beliefs and core values.
+    
+    Per-belief value scores are cached and kept current by observing the
+    HarmonyMonitor passed to monitor_all_values, so a belief change only
+    rescores the beliefs it touched. Observers registered with add_observer
+    receive on_core_value_added(monitor, value, importance).
     """
     
     def __init__(self, core_values: List[str] = None):
@@ -729,11 +1101,17 @@ class ValueConsistencyMonitor:
             core_values: List of core value statements
         """
         self.core_values: Dict[str, Belief] = {}
+        self.value_consistency_history: List[Tuple[float, Dict[str, float]]] = []
+        self._cached_scores: Optional[Tuple[tuple, Dict[str, float]]] = None
+        # belief content -> (belief, consistency function, {value: score})
+        self._belief_scores: Dict[str, Tuple[Belief, Callable, Dict[str, float]]] = {}
+        self._observed = None
+        self._observers: List[object] = []
+        self._cow_shared: frozenset = frozenset()
+        
         if core_values:
             for value in core_values:
                 self.add_core_value(value)
-        
-        self.value_consistency_history: List[Tuple[float, Dict[str, float]]] = []
     
     def add_core_value(self, value: str, importance: float = 1.0):
         """
@@ -743,12 +1121,69 @@ class ValueConsistencyMonitor:
             value: Value statement
             importance: Importance weight [0, 1]
         """
-        self.core_values[value] = Belief(
+        _cow_own(self, 'core_values')[value] = Belief(
             content=value,
             timestamp=datetime.now().timestamp(),
             confidence=importance,
             category='core_value'
         )
+        self._cached_scores = None
+        self._belief_scores = {}
+        
+        for observer in self._observers:
+            handler = getattr(observer, 'on_core_value_added', None)
+            if handler is not None:
+                handler(self, value, importance)
+    
+    def add_observer(self, observer: object):
+        """Register an observer (see HarmonyMonitor.add_observer)."""
+        if not any(o is observer for o in self._observers):
+            self._observers = self._observers + [observer]
+    
+    def remove_observer(self, observer: object) -> bool:
+        """Unregister an observer."""
+        remaining = [o for o in self._observers if o is not observer]
+        removed = len(remaining) != len(self._observers)
+        self._observers = remaining
+        return removed
+    
+    def fork(self, harmony_monitor: HarmonyMonitor = None) -> 'ValueConsistencyMonitor':
+        """
+        Copy-on-write clone sharing values, history and per-belief scores.
+        
+        Args:
+            harmony_monitor: Fork of the observed monitor; the clone observes
+                it so cached per-belief scores stay valid
+            
+        Returns:
+            ValueConsistencyMonitor sharing state until written
+        """
+        clone = _cow_fork(self, ('core_values', 'value_consistency_history', '_belief_scores'))
+        clone._observed = None
+        clone._observers = []
+        if harmony_monitor is not None and self._observed is not None:
+            clone._observed = harmony_monitor
+            harmony_monitor.add_observer(clone)
+        return clone
+    
+    def on_belief_removed(self, monitor: HarmonyMonitor, belief: Belief):
+        """Observer hook: forget scores of a removed belief."""
+        if belief.content in self._belief_scores:
+            _cow_own(self, '_belief_scores').pop(belief.content)
+    
+    def on_consistency_function_changed(self, monitor: HarmonyMonitor, func: Callable):
+        """Observer hook: every cached score is stale."""
+        self._belief_scores = {}
+    
+    def _observe(self, harmony_monitor: HarmonyMonitor):
+        """Switch change notifications to harmony_monitor if not already observed."""
+        if self._observed is harmony_monitor:
+            return
+        if self._observed is not None:
+            self._observed.remove_observer(self)
+        self._belief_scores = {}
+        self._observed = harmony_monitor
+        harmony_monitor.add_observer(self)
     
     def check_value_consistency(self, belief: str, 
                                harmony_monitor: HarmonyMonitor) -> float:
@@ -762,7 +1197,8 @@ class ValueConsistencyMonitor:
         Returns:
             Consistency score with values [0, 1]
         """
-        if not self.core_values:
+        core_values = dict(self.core_values)
+        if not core_values:
             return 1.0
         
         belief_obj = Belief(
@@ -773,13 +1209,82 @@ class ValueConsistencyMonitor:
         
         # Calculate consistency with each core value
         consistencies = []
-        for value, value_belief in self.core_values.items():
+        for value, value_belief in core_values.items():
             temp_system = {belief: belief_obj, value: value_belief}
             c = harmony_monitor.consistency_function(belief_obj, temp_system)
             consistencies.append(c * value_belief.confidence)
         
         return np.mean(consistencies)
-    
+
+    def check_value_consistency_batch(self, beliefs: List[str],
+                                      harmony_monitor: HarmonyMonitor,
+                                      cutoff: float = None) -> np.ndarray:
+        """
+        Check consistency of many candidate beliefs with core values at once.
+
+        Produces the same scores as calling check_value_consistency for each
+        candidate, but shares one timestamp across the batch and walks the
+        value × candidate grid one core value at a time.
+
+        With a cutoff, a candidate stops being scored as soon as its best
+        achievable score (every remaining value contributing c = 1) falls
+        below the cutoff. Values are then visited in descending importance
+        so weak candidates are rejected as early as possible.
+
+        Args:
+            beliefs: Candidate beliefs to check
+            harmony_monitor: HarmonyMonitor for consistency calculation
+            cutoff: Optional minimum acceptable score for early exit
+
+        Returns:
+            Array of scores aligned with beliefs. Candidates rejected early
+            hold the upper bound at rejection time, which is below cutoff.
+        """
+        n = len(beliefs)
+        core_values = dict(self.core_values)
+        if not core_values:
+            return np.ones(n)
+        if n == 0:
+            return np.zeros(0)
+
+        timestamp = datetime.now().timestamp()
+        belief_objs = [
+            Belief(content=b, timestamp=timestamp, category='belief')
+            for b in beliefs
+        ]
+
+        ordered_values = list(core_values.values())
+        if cutoff is not None:
+            ordered_values.sort(key=lambda v: v.confidence, reverse=True)
+        n_values = len(ordered_values)
+        # Best-case contribution of every value not yet visited
+        remaining = np.cumsum([v.confidence for v in ordered_values][::-1])[::-1]
+        remaining = np.append(remaining, 0.0)
+
+        totals = np.zeros(n)
+        active = np.ones(n, dtype=bool)
+        consistency = harmony_monitor.consistency_function
+
+        for k, value_belief in enumerate(ordered_values):
+            indices = np.flatnonzero(active)
+            if indices.size == 0:
+                break
+
+            value = value_belief.content
+            for i in indices:
+                belief_obj = belief_objs[i]
+                temp_system = {belief_obj.content: belief_obj, value: value_belief}
+                c = consistency(belief_obj, temp_system)
+                totals[i] += c * value_belief.confidence
+
+            if cutoff is not None and k + 1 < n_values:
+                upper = (totals[indices] + remaining[k + 1]) / n_values
+                rejected = indices[upper < cutoff]
+                totals[rejected] += remaining[k + 1]
+                active[rejected] = False
+
+        return totals / n_values
+
     def monitor_all_values(self, harmony_monitor: HarmonyMonitor) -> Dict[str, float]:
         """
         Check consistency of all beliefs with core values.
@@ -791,22 +1296,63 @@ class ValueConsistencyMonitor:
             Dictionary of value -> consistency scores
         """
         timestamp = datetime.now().timestamp()
-        value_scores = {}
         
-        for value in self.core_values.keys():
-            # Check if any current beliefs contradict this value
-            consistencies = []
-            for belief_content, belief in harmony_monitor.beliefs.items():
-                temp_system = {
-                    belief_content: belief,
-                    value: self.core_values[value]
-                }
-                c = harmony_monitor.consistency_function(belief, temp_system)
-                consistencies.append(c)
+        core_values = dict(self.core_values)
+        
+        # Reuse scores while neither beliefs nor core values changed
+        key = None
+        if hasattr(harmony_monitor, 'snapshot'):
+            harmony_key, beliefs = harmony_monitor.snapshot()
+            consistency_function = harmony_key[2]
+            key = (harmony_key, tuple(core_values))
+            cached = self._cached_scores
+            if cached is not None and cached[0] == key:
+                value_scores = dict(cached[1])
+                _cow_own(self, 'value_consistency_history').append((timestamp, value_scores))
+                return value_scores
+        else:
+            beliefs = dict(harmony_monitor.beliefs)
+            consistency_function = harmony_monitor.consistency_function
+        
+        belief_scores = {}
+        observing = hasattr(harmony_monitor, 'add_observer')
+        if observing:
+            self._observe(harmony_monitor)
+            belief_scores = self._belief_scores
+        
+        # Score each belief against every value, reusing cached pairs. An
+        # entry is only trusted for the exact belief object and function.
+        per_belief = []
+        for belief_content, belief in beliefs.items():
+            entry = belief_scores.get(belief_content)
+            if entry is not None and entry[0] is belief and entry[1] == consistency_function:
+                scores = entry[2]
+            else:
+                scores = {}
             
+            missing = [v for v in core_values if v not in scores]
+            if missing:
+                scores = dict(scores)
+                for value in missing:
+                    temp_system = {
+                        belief_content: belief,
+                        value: core_values[value]
+                    }
+                    scores[value] = consistency_function(belief, temp_system)
+                if observing:
+                    _cow_own(self, '_belief_scores')[belief_content] = (
+                        belief, consistency_function, scores
+                    )
+            per_belief.append(scores)
+        
+        value_scores = {}
+        for value in core_values:
+            consistencies = [scores[value] for scores in per_belief]
             value_scores[value] = np.mean(consistencies) if consistencies else 1.0
         
-        self.value_consistency_history.append((timestamp, value_scores))
+        if key is not None:
+            self._cached_scores = (key, dict(value_scores))
+        _cow_own(self, 'value_consistency_history').append((timestamp, value_scores))
         return value_scores
 
 
@@ -814,6 +1360,114 @@ class ValueConsistencyMonitor:
 # Integrated Consistency Checker
 # ============================================================================
 
+def checker_state(checker) -> Dict:
+    """
+    Collect a checker's complete state as plain Python data.
+    
+    Works on any object with SachiConsistencyChecker's components
+    (harmony, actions, recovery, growth, values, interaction_history).
+    
+    Args:
+        checker: Checker to read
+        
+    Returns:
+        State dictionary (the document written by export_state)
+    """
+    return {
+        'harmony': {
+            'beliefs': [
+                {
+                    'content': b.content,
+                    'timestamp': b.timestamp,
+                    'confidence': b.confidence,
+                    'category': b.category,
+                    'dependencies': sorted(b.dependencies)
+                }
+                for b in checker.harmony.snapshot()[1].values()
+            ],
+            'consistency_history': checker.harmony.consistency_history
+        },
+        'actions': {
+            'classification_history': checker.actions.classification_history
+        },
+        'recovery': {
+            'baseline_H': checker.recovery.baseline_H,
+            'disruption_events': checker.recovery.disruption_events
+        },
+        'growth': {
+            'capacity_history': checker.growth.capacity_history
+        },
+        'values': {
+            'core_values': list(checker.values.core_values.keys()),
+            'importance': {
+                v: b.confidence for v, b in checker.values.core_values.items()
+            },
+            'value_consistency_history': checker.values.value_consistency_history
+        },
+        'interactions': [
+            {
+                'content': i.content,
+                'action_type': i.action_type,
+                'timestamp': i.timestamp,
+                'consistency_impact': i.consistency_impact,
+                'metadata': i.metadata
+            }
+            for i in checker.interaction_history
+        ]
+    }
+
+
+def load_checker_state(checker, state: Dict):
+    """
+    Restore a checker's state from a dictionary produced by checker_state.
+    
+    Args:
+        checker: Checker to restore (see checker_state)
+        state: State dictionary
+    """
+    # Restore harmony
+    with checker.harmony.write_lock:
+        checker.harmony.clear_beliefs()
+        for b_data in state['harmony']['beliefs']:
+            checker.harmony.add_belief(
+                content=b_data['content'],
+                timestamp=b_data['timestamp'],
+                confidence=b_data['confidence'],
+                category=b_data['category'],
+                dependencies=set(b_data.get('dependencies', ()))
+            )
+    checker.harmony.consistency_history = [
+        tuple(h) for h in state['harmony']['consistency_history']
+    ]
+    
+    # Restore other components
+    checker.actions.classification_history = [
+        tuple(h) for h in state['actions']['classification_history']
+    ]
+    checker.recovery.baseline_H = state['recovery']['baseline_H']
+    checker.recovery.disruption_events = state['recovery']['disruption_events']
+    checker.growth.capacity_history = [
+        (h[0], h[1]) for h in state['growth']['capacity_history']
+    ]
+    checker.growth.domains = {
+        d for _, capacities in checker.growth.capacity_history for d in capacities
+    }
+    
+    values_state = state.get('values', {})
+    importance = values_state.get('importance', {})
+    for value in values_state.get('core_values', []):
+        if value not in checker.values.core_values:
+            checker.values.add_core_value(value, importance.get(value, 1.0))
+    checker.values.value_consistency_history = [
+        (h[0], h[1]) for h in values_state.get('value_consistency_history', [])
+    ]
+    
+    if 'interactions' in state:
+        checker.interaction_history = [
+            Interaction(**i_data) for i_data in state['interactions']
+        ]
+
+
 class SachiConsistencyChecker:
     """
     Integrated Sachi Protocol Consistency Checker.
@@ -835,6 +1489,29 @@ class SachiConsistencyChecker:
         self.values = ValueConsistencyMonitor(core_values)
         
         self.interaction_history: List[Interaction] = []
+        self._cow_shared: frozenset = frozenset()
+    
+    def fork(self) -> 'SachiConsistencyChecker':
+        """
+        Copy-on-write fork for what-if analysis.
+        
+        Forking is O(1): every component is cloned shallowly and shares its
+        beliefs, histories and caches with this checker. Each container is
+        copied only when one side first mutates it, so scenarios that add a
+        few beliefs to a fork pay only for the containers they touch.
+        Observers attached to this checker (journals, stores) are not
+        carried over.
+        
+        Returns:
+            Independent checker with the same state
+        """
+        clone = _cow_fork(self, ('interaction_history',))
+        clone.harmony = self.harmony.fork()
+        clone.actions = self.actions.fork()
+        clone.recovery = self.recovery.fork(clone.harmony)
+        clone.growth = self.growth.fork()
+        clone.values = self.values.fork(clone.harmony)
+        return clone
     
     def process_interaction(self, content: str, timestamp: float = None) -> Dict:
         """
@@ -853,7 +1530,7 @@ class SachiConsistencyChecker:
         # Classify action
         action_type, confidence = self.actions.classify(content, timestamp)
         
-        # Calculate consistency impact
+        # One consistency snapshot shared by every stage below
         H_before = self.harmony.calculate_consistency(timestamp)
         
         # Process based on action type
@@ -871,10 +1548,10 @@ class SachiConsistencyChecker:
             timestamp=timestamp,
             consistency_impact=consistency_impact
         )
-        self.interaction_history.append(interaction)
+        _cow_own(self, 'interaction_history').append(interaction)
         
-        # Check for disruption
-        disruption_detected = self.recovery.detect_disruption()
+        # Check for disruption (interactions do not modify beliefs)
+        disruption_detected = self.recovery.detect_disruption(current_H=H_before)
         
         # Calculate H after
         H_after = H_before + consistency_impact
@@ -889,10 +1566,80 @@ class SachiConsistencyChecker:
             'timestamp': timestamp
         }
     
+    def process_interactions(self, contents: List[str],
+                             timestamps: List[float] = None) -> Dict:
+        """
+        Process a batch of interactions through the complete pipeline.
+        
+        Interactions do not modify beliefs, so the whole batch shares one
+        classification pass, one H(t) snapshot and one disruption check.
+        Results match process_interaction for each row, except that a
+        disruption is recorded once for the batch rather than once per row.
+        
+        Args:
+            contents: Interaction contents
+            timestamps: When each interaction occurred (default: now for all)
+            
+        Returns:
+            Columnar result dictionary with one entry per interaction in each column
+        """
+        n = len(contents)
+        if timestamps is None:
+            timestamps = [datetime.now().timestamp()] * n
+        elif len(timestamps) != n:
+            raise ValueError("contents and timestamps must have the same length")
+        
+        action_types, confidences = self.actions.classify_batch(contents, timestamps)
+        
+        if n == 0:
+            return {
+                'action_type': [],
+                'confidence': confidences,
+                'H_before': np.zeros(0),
+                'H_after': np.zeros(0),
+                'consistency_impact': np.zeros(0),
+                'disruption_detected': np.zeros(0, dtype=bool),
+                'timestamp': np.zeros(0)
+            }
+        
+        H_before = self.harmony.calculate_consistency(timestamps[0])
+        
+        impact_rates = {'harmful': -0.1, 'supportive': 0.05}
+        consistency_impact = np.array(
+            [impact_rates.get(a, 0.0) for a in action_types]
+        ) * confidences
+        
+        _cow_own(self, 'interaction_history').extend(
+            Interaction(
+                content=content,
+                action_type=action_type,
+                timestamp=timestamp,
+                consistency_impact=impact
+            )
+            for content, action_type, timestamp, impact
+            in zip(contents, action_types, timestamps, consistency_impact.tolist())
+        )
+        
+        disruption_detected = self.recovery.detect_disruption(current_H=H_before)
+        
+        return {
+            'action_type': action_types,
+            'confidence': confidences,
+            'H_before': np.full(n, H_before),
+            'H_after': H_before + consistency_impact,
+            'consistency_impact': consistency_impact,
+            'disruption_detected': np.full(n, disruption_detected),
+            'timestamp': np.asarray(timestamps, dtype=float)
+        }
+    
     def generate_report(self) -> ConsistencyReport:
         """
         Generate comprehensive consistency report.
         
+        Each component caches its last result and only recomputes when its
+        inputs (beliefs, consistency function, core values, classification
+        history) changed since the previous report.
+        
         Returns:
             ConsistencyReport with full system status
         """
@@ -903,7 +1650,7 @@ class SachiConsistencyChecker:
         value_scores = self.values.monitor_all_values(self.harmony)
         inconsistencies = self.harmony.get_inconsistencies()
         action_dist = self.actions.get_distribution()
-        recovery_status = self.recovery.monitor_recovery()
+        recovery_status = self.recovery.monitor_recovery(current_H=H_t)
         
         # Component scores
         component_scores = {
@@ -939,77 +1686,1782 @@ class SachiConsistencyChecker:
             recommendations=recommendations
         )
     
-    def export_state(self, filepath: str):
+    def get_state(self) -> Dict:
+        """
+        Collect complete system state as plain Python data.
+        
+        Returns:
+            State dictionary (the document written by export_state)
+        """
+        return checker_state(self)
+    
+    def load_state(self, state: Dict):
+        """
+        Restore system state from a dictionary produced by get_state.
+        
+        Args:
+            state: State dictionary
+        """
+        load_checker_state(self, state)
+    
+    def export_state(self, filepath: str, indexes: bool = False):
         """
         Export complete system state to JSON.
         
+        A StateJournal log already next to filepath predates this state,
+        so its last sequence number is recorded as 'journal_seq' and
+        import_state skips its records.
+        
         Args:
             filepath: Path to save state
+            indexes: Also checkpoint derived results next to the state
+                (filepath + '.indexes'), see IndexCheckpoint
         """
-        state = {
-            'harmony': {
-                'beliefs': [
-                    {
-                        'content': b.content,
-                        'timestamp': b.timestamp,
-                        'confidence': b.confidence,
-                        'category': b.category
-                    }
-                    for b in self.harmony.beliefs.values()
-                ],
-                'consistency_history': self.harmony.consistency_history
-            },
-            'actions': {
-                'classification_history': self.actions.classification_history
-            },
-            'recovery': {
-                'baseline_H': self.recovery.baseline_H,
-                'disruption_events': self.recovery.disruption_events
-            },
-            'growth': {
-                'capacity_history': self.growth.capacity_history
-            },
-            'values': {
-                'core_values': list(self.values.core_values.keys()),
-                'value_consistency_history': self.values.value_consistency_history
-            }
-        }
-        
+        state = self.get_state()
+        journal_seq = StateJournal.last_seq(filepath + StateJournal.LOG_SUFFIX)
+        if journal_seq:
+            state['journal_seq'] = journal_seq
         with open(filepath, 'w') as f:
             json.dump(state, f, indent=2)
+        if indexes:
+            IndexCheckpoint.write(self, filepath + IndexCheckpoint.SUFFIX)
+    
+    def export_snapshot(self, filepath: str):
+        """
+        Export system state as a binary columnar snapshot.
+        
+        Args:
+            filepath: Path to save snapshot
+        """
+        ColumnarSnapshot.write(self, filepath)
+    
+    def import_snapshot(self, filepath: str):
+        """
+        Import system state from a binary columnar snapshot.
+        
+        Args:
+            filepath: Path to snapshot file
+        """
+        with ColumnarSnapshot.open(filepath) as snapshot:
+            snapshot.restore(self)
+    
+    def import_state_stream(self, filepath: str, chunk_size: int = 1 << 16,
+                            progress: Optional[Callable[[int, int], None]] = None):
+        """
+        Import system state from JSON without loading the whole document.
+        
+        Equivalent to import_state, but beliefs and history entries are fed
+        into the components as StateStreamReader parses them, so memory use
+        stays bounded by the chunk size plus the restored state itself.
+        
+        Args:
+            filepath: Path to state file
+            chunk_size: Bytes read per refill
+            progress: Optional callback(bytes_read, total_bytes)
+        """
+        harmony = self.harmony
+        core_values: List[str] = []
+        importance: Dict[str, float] = {}
+        journal_seq = 0
+        
+        with harmony.write_lock:
+            harmony.clear_beliefs()
+            harmony.consistency_history = []
+            self.actions.classification_history = []
+            self.recovery.disruption_events = []
+            self.growth.capacity_history = []
+            self.growth.domains = set()
+            self.values.value_consistency_history = []
+            self.interaction_history = []
+            
+            reader = StateStreamReader(filepath, chunk_size=chunk_size, progress=progress)
+            for path, value in reader.items():
+                if path == ('harmony', 'beliefs'):
+                    harmony.add_belief(
+                        content=value['content'],
+                        timestamp=value['timestamp'],
+                        confidence=value['confidence'],
+                        category=value['category'],
+                        dependencies=set(value.get('dependencies', ()))
+                    )
+                elif path == ('harmony', 'consistency_history'):
+                    harmony.consistency_history.append(tuple(value))
+                elif path == ('actions', 'classification_history'):
+                    self.actions.classification_history.append(tuple(value))
+                elif path == ('recovery', 'baseline_H'):
+                    self.recovery.baseline_H = value
+                elif path == ('recovery', 'disruption_events'):
+                    self.recovery.disruption_events.append(value)
+                elif path == ('growth', 'capacity_history'):
+                    self.growth.capacity_history.append((value[0], value[1]))
+                    self.growth.domains.update(value[1])
+                elif path == ('values', 'core_values'):
+                    core_values.append(value)
+                elif path[:2] == ('values', 'importance'):
+                    importance[path[2]] = value
+                elif path == ('values', 'value_consistency_history'):
+                    self.values.value_consistency_history.append((value[0], value[1]))
+                elif path == ('interactions',):
+                    self.interaction_history.append(Interaction(**value))
+                elif path == ('journal_seq',):
+                    journal_seq = value
+        
+        for value in core_values:
+            if value not in self.values.core_values:
+                self.values.add_core_value(value, importance.get(value, 1.0))
+        
+        log_path = filepath + StateJournal.LOG_SUFFIX
+        if os.path.exists(log_path):
+            StateJournal.replay(self, log_path, journal_seq)
     
     def import_state(self, filepath: str):
         """
         Import system state from JSON.
         
+        If a StateJournal log sits next to the file, its events are replayed
+        on top of the snapshot. Derived results checkpointed by
+        export_state(indexes=True) are then installed if still current.
+        
         Args:
             filepath: Path to state file
         """
         with open(filepath, 'r') as f:
             state = json.load(f)
         
-        # Restore harmony
-        self.harmony.beliefs.clear()
-        for b_data in state['harmony']['beliefs']:
-            self.harmony.add_belief(
-                content=b_data['content'],
-                timestamp=b_data['timestamp'],
-                confidence=b_data['confidence'],
-                category=b_data['category']
-            )
-        self.harmony.consistency_history = [
-            tuple(h) for h in state['harmony']['consistency_history']
-        ]
+        self.load_state(state)
         
-        # Restore other components
-        self.actions.classification_history = [
-            tuple(h) for h in state['actions']['classification_history']
-        ]
-        self.recovery.baseline_H = state['recovery']['baseline_H']
-        self.recovery.disruption_events = state['recovery']['disruption_events']
-        self.growth.capacity_history = [
-            (h[0], h[1]) for h in state['growth']['capacity_history']
-        ]
+        # Replay events appended by a StateJournal since its last compaction
+        log_path = filepath + StateJournal.LOG_SUFFIX
+        if os.path.exists(log_path):
+            StateJournal.replay(self, log_path, state.get('journal_seq', 0))
+        
+        index_path = filepath + IndexCheckpoint.SUFFIX
+        if os.path.exists(index_path):
+            IndexCheckpoint.load(self, index_path)
+
+
+# ============================================================================
+# Persistence
+# ============================================================================
+
+class StateStreamReader:
+    """
+    Incremental reader for export_state JSON documents.
+    
+    The file is decoded chunk by chunk into a bounded text buffer. Objects
+    are walked key by key and arrays element by element, so only one array
+    element (one belief, one history entry, one interaction) is ever held
+    in decoded form. Memory use is bounded by chunk_size plus the largest
+    single element, regardless of file size.
+    
+    Example:
+        reader = StateStreamReader('state.json')
+        for path, value in reader.items():
+            ...  # e.g. (('harmony', 'beliefs'), {...}) per belief
+    """
+    
+    def __init__(self, filepath: str, chunk_size: int = 1 << 16,
+                 max_buffer: int = 1 << 26,
+                 progress: Optional[Callable[[int, int], None]] = None):
+        """
+        Initialize reader.
+        
+        Args:
+            filepath: Path to an export_state JSON file
+            chunk_size: Bytes read per refill
+            max_buffer: Largest single element (in characters) accepted
+            progress: Optional callback(bytes_read, total_bytes) per refill
+        """
+        self.filepath = filepath
+        self.chunk_size = chunk_size
+        self.max_buffer = max_buffer
+        self.progress = progress
+        self.total_bytes = os.path.getsize(filepath)
+        self.bytes_read = 0
+        self._decoder = json.JSONDecoder()
+    
+    def items(self):
+        """
+        Stream the document as (path, value) pairs.
+        
+        Objects are descended into, so path is the tuple of keys leading to
+        the value. Each array element is yielded whole under its array's
+        path. Empty arrays and objects yield nothing.
+        
+        Yields:
+            (path, value) tuples in document order
+        """
+        self.bytes_read = 0
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        with open(self.filepath, 'rb') as self._file:
+            yield from self._walk(())
+            if self._peek():
+                raise ValueError(f"Trailing data in state file: {self.filepath}")
+    
+    def _fill(self):
+        """Read the next chunk, dropping the consumed part of the buffer."""
+        chunk = self._file.read(self.chunk_size)
+        self._eof = not chunk
+        self.bytes_read += len(chunk)
+        self._buffer = self._buffer[self._pos:] + self._text_decoder.decode(chunk, final=self._eof)
+        self._pos = 0
+        if len(self._buffer) > self.max_buffer:
+            raise ValueError(
+                f"State element exceeds buffer limit of {self.max_buffer} characters"
+            )
+        if self.progress is not None and chunk:
+            self.progress(self.bytes_read, self.total_bytes)
+    
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                return ''
+            self._fill()
+    
+    def _expect(self, char: str):
+        """Consume char or raise ValueError."""
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in state file, found {found!r}")
+        self._pos += 1
+    
+    # Characters that can continue a JSON number
+    _NUMBER_CHARS = frozenset('0123456789.eE+-')
+    
+    def _value(self):
+        """Decode one complete JSON value, refilling until it is whole."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A number cut at the buffer edge still decodes ("0." as 0):
+                # it may continue in the next chunk if nothing follows it
+                # yet, or if what follows can only be more of a number
+                if self._eof or (end < len(self._buffer)
+                                 and self._buffer[end] not in self._NUMBER_CHARS):
+                    self._pos = end
+                    return value
+            self._fill()
+    
+    def _walk(self, path: Tuple):
+        """Yield (path, value) pairs for the value at the cursor."""
+        char = self._peek()
+        if char == '{':
+            self._pos += 1
+            if self._peek() == '}':
+                self._pos += 1
+                return
+            while True:
+                key = self._value()
+                self._expect(':')
+                yield from self._walk(path + (key,))
+                if self._peek() == ',':
+                    self._pos += 1
+                else:
+                    self._expect('}')
+                    return
+        elif char == '[':
+            self._pos += 1
+            if self._peek() == ']':
+                self._pos += 1
+                return
+            while True:
+                yield path, self._value()
+                if self._peek() == ',':
+                    self._pos += 1
+                else:
+                    self._expect(']')
+                    return
+        else:
+            yield path, self._value()
+
+
+class IndexCheckpoint:
+    """
+    Checkpoint of derived results, for warm restarts.
+    
+    Saves the results that are otherwise rebuilt after import_state: H(t),
+    the pairwise inconsistency lists (O(n²) to compute) and the value x
+    belief scores of ValueConsistencyMonitor. Only results computed with
+    the built-in consistency function are saved, since custom functions
+    cannot be identified across processes.
+    
+    File format: one JSON header line {"version", "content_hash"} followed
+    by one JSON body line. The content hash covers the beliefs (in order),
+    the core values and VERSION. A checkpoint whose header does not match
+    the checker is ignored without parsing the body, and the results are
+    rebuilt lazily on first use.
+    """
+    
+    VERSION = 1
+    SUFFIX = '.indexes'
+    
+    @classmethod
+    def content_hash(cls, beliefs: Dict[str, Belief], core_values: Dict[str, Belief]) -> str:
+        """
+        Fingerprint of everything the saved results depend on.
+        
+        Args:
+            beliefs: Belief system (order matters to the consistency function)
+            core_values: Core values of the value monitor
+            
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256(str(cls.VERSION).encode())
+        for b in beliefs.values():
+            digest.update(json.dumps([
+                b.content, b.timestamp, b.confidence, b.category,
+                sorted(b.dependencies)
+            ]).encode('utf-8'))
+        digest.update(b'\x1e')
+        # Core value timestamps are set on creation and never scored
+        for v in core_values.values():
+            digest.update(json.dumps([v.content, v.confidence]).encode('utf-8'))
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _is_builtin(func: Callable) -> bool:
+        return getattr(func, '__func__', None) is HarmonyMonitor._default_consistency
+    
+    @classmethod
+    def write(cls, checker: 'SachiConsistencyChecker', filepath: str):
+        """
+        Save the checker's current derived results.
+        
+        Args:
+            checker: Checker whose caches are saved
+            filepath: Destination path
+        """
+        harmony, values = checker.harmony, checker.values
+        key, beliefs = harmony.snapshot()
+        core_values = dict(values.core_values)
+        body: Dict = {'H': None, 'inconsistencies': {}, 'belief_scores': {}, 'value_scores': None}
+        
+        if cls._is_builtin(key[2]):
+            cached_H = harmony._cached_H
+            if cached_H is not None and cached_H[0] == key:
+                body['H'] = float(cached_H[1])
+            body['inconsistencies'] = {
+                repr(threshold): entry[1]
+                for threshold, entry in harmony._cached_inconsistencies.items()
+                if entry[0] == key
+            }
+            body['belief_scores'] = {
+                content: scores
+                for content, (belief, func, scores) in values._belief_scores.items()
+                if beliefs.get(content) is belief and cls._is_builtin(func)
+            }
+            cached_scores = values._cached_scores
+            if cached_scores is not None and cached_scores[0] == (key, tuple(core_values)):
+                body['value_scores'] = cached_scores[1]
+        
+        header = {'version': cls.VERSION, 'content_hash': cls.content_hash(beliefs, core_values)}
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(json.dumps(header) + '\n')
+            f.write(json.dumps(body) + '\n')
+        os.replace(tmp_path, filepath)
+    
+    @classmethod
+    def load(cls, checker: 'SachiConsistencyChecker', filepath: str) -> bool:
+        """
+        Install saved derived results if they match the checker's state.
+        
+        Args:
+            checker: Checker restored from the matching state
+            filepath: Path written by write()
+            
+        Returns:
+            True if the checkpoint was current and installed
+        """
+        harmony, values = checker.harmony, checker.values
+        with open(filepath, 'r') as f:
+            try:
+                header = json.loads(f.readline())
+            except json.JSONDecodeError:
+                return False
+            
+            with harmony.write_lock:
+                key, beliefs = harmony.snapshot()
+                core_values = dict(values.core_values)
+                if (header.get('version') != cls.VERSION
+                        or header.get('content_hash') != cls.content_hash(beliefs, core_values)
+                        or not cls._is_builtin(key[2])):
+                    return False
+                
+                body = json.loads(f.readline())
+                if body['H'] is not None:
+                    harmony._cached_H = (key, body['H'])
+                harmony._cached_inconsistencies = {
+                    float(threshold): (key, [tuple(entry) for entry in entries])
+                    for threshold, entries in body['inconsistencies'].items()
+                }
+                
+                # Scores are bound to the belief objects now in the monitor
+                values._observe(harmony)
+                values._belief_scores = {
+                    content: (beliefs[content], key[2], scores)
+                    for content, scores in body['belief_scores'].items()
+                    if content in beliefs
+                }
+                if body['value_scores'] is not None:
+                    values._cached_scores = ((key, tuple(core_values)), body['value_scores'])
+        return True
+
+
+def _extends(previous: list, mark: int, history: list) -> bool:
+    """
+    Whether history is previous[:mark] plus appended entries.
+    
+    A fork's copy-on-write copy counts as an extension of the list it was
+    copied from, so writers tracking list tails need not start over.
+    """
+    if len(history) < mark:
+        return False
+    if history is previous or mark == 0:
+        return True
+    return len(previous) >= mark and history[mark - 1] is previous[mark - 1]
+
+
+class StateJournal:
+    """
+    Append-only event log for a SachiConsistencyChecker.
+    
+    Belief changes and capacity measurements are captured through observer
+    hooks; classifications, consistency measurements, disruptions, value
+    checks and interactions are taken from the tails of their (append-only)
+    history lists. checkpoint() appends only the events since the previous
+    checkpoint to a JSONL log, so its cost is proportional to new events.
+    Every compact_every records the log is folded into a full snapshot.
+    
+    Files:
+        path          JSON snapshot (export_state format plus 'journal_seq')
+        path + '.log' JSONL events, one {"seq", "event", "data"} per line
+    
+    import_state(path) replays the snapshot plus the log tail. A torn last
+    line from a crash is ignored, and records already folded into the
+    snapshot are skipped by sequence number.
+    """
+    
+    LOG_SUFFIX = '.log'
+    
+    def __init__(self, checker: 'SachiConsistencyChecker', path: str,
+                 compact_every: int = 10000):
+        """
+        Attach a journal to a checker and write an initial snapshot.
+        
+        To resume from existing files, call checker.import_state(path) first.
+        Sequence numbers continue after the last record of an existing log,
+        so records left behind by an interrupted compaction stay skipped.
+        
+        Args:
+            checker: Checker to journal
+            path: Snapshot path (the log is stored at path + '.log')
+            compact_every: Log records between automatic compactions
+        """
+        self.checker = checker
+        self.path = path
+        self.log_path = path + self.LOG_SUFFIX
+        self.compact_every = compact_every
+        
+        self.seq = self.last_seq(self.log_path)
+        self._pending: List[Tuple[str, object]] = []
+        self._log_records = 0
+        self._marks: Dict[str, Tuple[list, int]] = {}
+        self._baseline_H = None
+        
+        checker.harmony.add_observer(self)
+        checker.growth.add_observer(self)
+        self.compact()
+    
+    # -- observer hooks ------------------------------------------------------
+    
+    def on_belief_added(self, monitor, belief: Belief):
+        self._pending.append(('belief_added', {
+            'content': belief.content,
+            'timestamp': belief.timestamp,
+            'confidence': belief.confidence,
+            'category': belief.category,
+            'dependencies': sorted(belief.dependencies)
+        }))
+    
+    def on_belief_removed(self, monitor, belief: Belief):
+        self._pending.append(('belief_removed', {'content': belief.content}))
+    
+    def on_capacity_measured(self, tracker, domain: str, score: float, timestamp: float):
+        self._pending.append(('capacity', {
+            'domain': domain, 'score': score, 'timestamp': timestamp
+        }))
+    
+    # -- checkpointing -------------------------------------------------------
+    
+    def _history_sources(self) -> Dict[str, list]:
+        checker = self.checker
+        return {
+            'consistency': checker.harmony.consistency_history,
+            'classification': checker.actions.classification_history,
+            'disruption': checker.recovery.disruption_events,
+            'value_consistency': checker.values.value_consistency_history,
+            'interaction': checker.interaction_history,
+        }
+    
+    def _reset_marks(self):
+        self._marks = {
+            name: (history, len(history))
+            for name, history in self._history_sources().items()
+        }
+        self._baseline_H = self.checker.recovery.baseline_H
+    
+    def checkpoint(self) -> int:
+        """
+        Append all events since the last checkpoint to the log.
+        
+        Falls back to compact() when a history list was replaced or
+        truncated, since its tail can no longer be expressed as appends.
+        
+        Returns:
+            Number of records appended (0 after a compaction)
+        """
+        events, self._pending = self._pending, []
+        
+        for name, history in self._history_sources().items():
+            previous, mark = self._marks[name]
+            if not _extends(previous, mark, history):
+                self.compact()
+                return 0
+            for entry in history[mark:]:
+                if isinstance(entry, Interaction):
+                    entry = asdict(entry)
+                events.append((name, entry))
+            self._marks[name] = (history, len(history))
+        
+        baseline_H = self.checker.recovery.baseline_H
+        if baseline_H != self._baseline_H:
+            events.append(('baseline', baseline_H))
+            self._baseline_H = baseline_H
+        
+        if not events:
+            return 0
+        
+        lines = []
+        for event, data in events:
+            self.seq += 1
+            lines.append(json.dumps({'seq': self.seq, 'event': event, 'data': data}))
+        with open(self.log_path, 'a') as f:
+            f.write('\n'.join(lines) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        
+        self._log_records += len(lines)
+        if self._log_records >= self.compact_every:
+            self.compact()
+        return len(lines)
+    
+    def compact(self):
+        """Fold the log into a fresh snapshot and truncate the log."""
+        self._pending = []
+        state = self.checker.get_state()
+        state['journal_seq'] = self.seq
+        
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        
+        # A crash before truncation is harmless: replay skips seq <= journal_seq,
+        # and a journal resumed on these files numbers on from the log's end
+        with open(self.log_path, 'w'):
+            pass
+        self._log_records = 0
+        self._reset_marks()
+    
+    def close(self):
+        """Write a final checkpoint and detach from the checker."""
+        self.checkpoint()
+        self.checker.harmony.remove_observer(self)
+        self.checker.growth.remove_observer(self)
+    
+    # -- replay --------------------------------------------------------------
+    
+    @staticmethod
+    def last_seq(log_path: str) -> int:
+        """
+        Sequence number of the last intact record in a log.
+        
+        Args:
+            log_path: JSONL event log
+            
+        Returns:
+            The last seq (0 if the log is missing or empty)
+        """
+        seq = 0
+        if not os.path.exists(log_path):
+            return seq
+        with open(log_path, 'r') as f:
+            for line in f:
+                try:
+                    seq = json.loads(line)['seq']
+                except json.JSONDecodeError:
+                    break  # Torn write at the end of the log
+        return seq
+    
+    @staticmethod
+    def replay(checker: 'SachiConsistencyChecker', log_path: str,
+               after_seq: int = 0) -> int:
+        """
+        Apply logged events to a checker.
+        
+        Args:
+            checker: Checker restored from the matching snapshot
+            log_path: JSONL event log
+            after_seq: Skip records up to this sequence number
+            
+        Returns:
+            Number of records applied
+        """
+        applied = 0
+        with open(log_path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # Torn write at the end of the log
+                if record['seq'] <= after_seq:
+                    continue
+                
+                event, data = record['event'], record['data']
+                if event == 'belief_added':
+                    data['dependencies'] = set(data['dependencies'])
+                    checker.harmony.add_belief(**data)
+                elif event == 'belief_removed':
+                    checker.harmony.remove_belief(data['content'])
+                elif event == 'capacity':
+                    checker.growth.add_capacity_measurement(**data)
+                elif event == 'consistency':
+                    _cow_own(checker.harmony, 'consistency_history').append(tuple(data))
+                elif event == 'classification':
+                    _cow_own(checker.actions, 'classification_history').append(tuple(data))
+                elif event == 'disruption':
+                    _cow_own(checker.recovery, 'disruption_events').append(data)
+                elif event == 'value_consistency':
+                    _cow_own(checker.values, 'value_consistency_history').append(tuple(data))
+                elif event == 'interaction':
+                    _cow_own(checker, 'interaction_history').append(Interaction(**data))
+                elif event == 'baseline':
+                    checker.recovery.baseline_H = data
+                applied += 1
+        return applied
+
+
+class SQLiteStateStore:
+    """
+    SQLite-backed persistent store for a SachiConsistencyChecker.
+    
+    Mirrors the belief system, consistency_history, classification_history,
+    disruption_events, baseline_H and capacity_history into indexed tables,
+    so time-range and per-category/per-domain queries run against SQLite
+    indexes instead of scanning in-memory lists, and state survives restarts
+    without export/import.
+    
+    Belief changes and capacity measurements are captured through observer
+    hooks, histories from the tails of their lists (as in StateJournal).
+    Writes are buffered and applied in a single transaction by flush(),
+    which runs automatically every batch_size buffered events. A history
+    list that was replaced or truncated is rewritten in full.
+    
+    Example:
+        store = SQLiteStateStore(checker, 'sachi.db')  # resumes if present
+        ...
+        store.flush()
+        recent = store.consistency_between(t0, t1)
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS beliefs (
+            content TEXT PRIMARY KEY, timestamp REAL, confidence REAL,
+            category TEXT, dependencies TEXT);
+        CREATE INDEX IF NOT EXISTS beliefs_timestamp ON beliefs (timestamp);
+        CREATE INDEX IF NOT EXISTS beliefs_category ON beliefs (category, timestamp);
+        CREATE TABLE IF NOT EXISTS consistency (
+            timestamp REAL, H REAL);
+        CREATE INDEX IF NOT EXISTS consistency_timestamp ON consistency (timestamp);
+        CREATE TABLE IF NOT EXISTS classifications (
+            timestamp REAL, content TEXT, action_type TEXT);
+        CREATE INDEX IF NOT EXISTS classifications_timestamp ON classifications (timestamp);
+        CREATE INDEX IF NOT EXISTS classifications_action
+            ON classifications (action_type, timestamp);
+        CREATE TABLE IF NOT EXISTS disruptions (
+            timestamp REAL, H_baseline REAL, H_disrupted REAL, magnitude REAL);
+        CREATE INDEX IF NOT EXISTS disruptions_timestamp ON disruptions (timestamp);
+        CREATE TABLE IF NOT EXISTS capacity (
+            timestamp REAL, domain TEXT, score REAL,
+            PRIMARY KEY (domain, timestamp));
+        CREATE INDEX IF NOT EXISTS capacity_timestamp ON capacity (timestamp);
+    """
+    
+    # History name -> (table, insert statement, row builder)
+    _HISTORIES = {
+        'consistency': (
+            'consistency', 'INSERT INTO consistency VALUES (?, ?)',
+            lambda entry: (entry[0], entry[1])
+        ),
+        'classification': (
+            'classifications', 'INSERT INTO classifications VALUES (?, ?, ?)',
+            lambda entry: (entry[0], entry[1], entry[2])
+        ),
+        'disruption': (
+            'disruptions', 'INSERT INTO disruptions VALUES (?, ?, ?, ?)',
+            lambda event: (event['timestamp'], event['H_baseline'],
+                           event['H_disrupted'], event['magnitude'])
+        ),
+    }
+    
+    def __init__(self, checker: 'SachiConsistencyChecker', path: str,
+                 batch_size: int = 1000):
+        """
+        Attach a store to a checker.
+        
+        If the database already holds state it is loaded into the checker,
+        replacing the checker's beliefs and histories; otherwise the
+        checker's current state is written out.
+        
+        Args:
+            checker: Checker to persist
+            path: SQLite database path (':memory:' for a transient store)
+            batch_size: Buffered events that trigger an automatic flush
+        """
+        self.checker = checker
+        self.path = path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._pending: List[Tuple[str, tuple]] = []
+        self._marks: Dict[str, Tuple[list, int]] = {}
+        self._baseline_H = None
+        
+        with self._lock, self.connection:
+            self.connection.executescript(self.SCHEMA)
+            initialized = self.connection.execute(
+                "SELECT 1 FROM meta WHERE key = 'baseline_H'"
+            ).fetchone()
+        if initialized:
+            self.restore(checker)
+        else:
+            self.rebuild()
+        
+        checker.harmony.add_observer(self)
+        checker.growth.add_observer(self)
+    
+    # -- observer hooks ------------------------------------------------------
+    
+    def _buffer(self, op: str, row: tuple):
+        with self._lock:
+            self._pending.append((op, row))
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+    
+    def on_belief_added(self, monitor, belief: Belief):
+        self._buffer('INSERT OR REPLACE INTO beliefs VALUES (?, ?, ?, ?, ?)', (
+            belief.content, belief.timestamp, belief.confidence,
+            belief.category, json.dumps(sorted(belief.dependencies))
+        ))
+    
+    def on_belief_removed(self, monitor, belief: Belief):
+        self._buffer('DELETE FROM beliefs WHERE content = ?', (belief.content,))
+    
+    def on_capacity_measured(self, tracker, domain: str, score: float, timestamp: float):
+        self._buffer('INSERT OR REPLACE INTO capacity VALUES (?, ?, ?)',
+                     (timestamp, domain, score))
+    
+    # -- writing -------------------------------------------------------------
+    
+    def _history_sources(self) -> Dict[str, list]:
+        checker = self.checker
+        return {
+            'consistency': checker.harmony.consistency_history,
+            'classification': checker.actions.classification_history,
+            'disruption': checker.recovery.disruption_events,
+        }
+    
+    def flush(self) -> int:
+        """
+        Write buffered events and new history entries in one transaction.
+        
+        Returns:
+            Number of rows written or deleted
+        """
+        with self._lock, self.connection:
+            pending, self._pending = self._pending, []
+            written = len(pending)
+            
+            # Runs of the same statement go through executemany; order is
+            # kept so a replace (delete then insert) lands correctly
+            start = 0
+            for end in range(1, len(pending) + 1):
+                if end == len(pending) or pending[end][0] != pending[start][0]:
+                    self.connection.executemany(
+                        pending[start][0], [row for _, row in pending[start:end]]
+                    )
+                    start = end
+            
+            for name, history in self._history_sources().items():
+                table, insert, to_row = self._HISTORIES[name]
+                previous, mark = self._marks[name]
+                if not _extends(previous, mark, history):
+                    self.connection.execute(f'DELETE FROM {table}')
+                    mark = 0
+                self.connection.executemany(insert, [to_row(e) for e in history[mark:]])
+                written += len(history) - mark
+                self._marks[name] = (history, len(history))
+            
+            baseline_H = self.checker.recovery.baseline_H
+            if baseline_H != self._baseline_H:
+                self._set_baseline(baseline_H)
+                written += 1
+        return written
+    
+    def _set_baseline(self, baseline_H: Optional[float]):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta VALUES ('baseline_H', ?)", (json.dumps(baseline_H),)
+        )
+        self._baseline_H = baseline_H
+    
+    def rebuild(self):
+        """Replace the database contents with the checker's current state."""
+        checker = self.checker
+        with self._lock, self.connection:
+            self._pending = []
+            for table in ('beliefs', 'capacity', 'consistency', 'classifications', 'disruptions'):
+                self.connection.execute(f'DELETE FROM {table}')
+            self.connection.executemany(
+                'INSERT INTO beliefs VALUES (?, ?, ?, ?, ?)',
+                [
+                    (b.content, b.timestamp, b.confidence, b.category,
+                     json.dumps(sorted(b.dependencies)))
+                    for b in checker.harmony.snapshot()[1].values()
+                ]
+            )
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO capacity VALUES (?, ?, ?)',
+                [
+                    (ts, domain, score)
+                    for ts, capacities in checker.growth.capacity_history
+                    for domain, score in capacities.items()
+                ]
+            )
+            self._marks = {name: (history, 0) for name, history in self._history_sources().items()}
+            self._set_baseline(checker.recovery.baseline_H)
+        self.flush()
+    
+    def close(self):
+        """Flush, detach from the checker and close the database."""
+        self.flush()
+        self.checker.harmony.remove_observer(self)
+        self.checker.growth.remove_observer(self)
+        self.connection.close()
+    
+    # -- reading -------------------------------------------------------------
+    
+    def restore(self, checker: 'SachiConsistencyChecker'):
+        """
+        Load the stored state into a checker.
+        
+        Args:
+            checker: Checker whose beliefs and stored histories are replaced
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                'SELECT content, timestamp, confidence, category, dependencies '
+                'FROM beliefs ORDER BY rowid'
+            ).fetchall()
+            checker.harmony.replace_beliefs([
+                Belief(content=content, timestamp=ts, confidence=conf,
+                       category=category, dependencies=set(json.loads(deps)))
+                for content, ts, conf, category, deps in rows
+            ])
+            checker.harmony.consistency_history = self.connection.execute(
+                'SELECT timestamp, H FROM consistency ORDER BY rowid'
+            ).fetchall()
+            checker.actions.classification_history = self.connection.execute(
+                'SELECT timestamp, content, action_type FROM classifications ORDER BY rowid'
+            ).fetchall()
+            checker.recovery.disruption_events = [
+                {'timestamp': ts, 'H_baseline': base, 'H_disrupted': H, 'magnitude': mag}
+                for ts, base, H, mag in self.connection.execute(
+                    'SELECT timestamp, H_baseline, H_disrupted, magnitude '
+                    'FROM disruptions ORDER BY rowid'
+                )
+            ]
+            
+            capacity_history: List[Tuple[float, Dict[str, float]]] = []
+            for ts, domain, score in self.connection.execute(
+                'SELECT timestamp, domain, score FROM capacity ORDER BY timestamp, rowid'
+            ):
+                if not capacity_history or capacity_history[-1][0] != ts:
+                    capacity_history.append((ts, {}))
+                capacity_history[-1][1][domain] = score
+            checker.growth.capacity_history = capacity_history
+            checker.growth.domains = {d for _, caps in capacity_history for d in caps}
+            
+            row = self.connection.execute(
+                "SELECT value FROM meta WHERE key = 'baseline_H'"
+            ).fetchone()
+            checker.recovery.baseline_H = json.loads(row[0]) if row else None
+            
+            if checker is self.checker:
+                self._pending = []
+                self._reset_marks()
+    
+    def _reset_marks(self):
+        self._marks = {
+            name: (history, len(history))
+            for name, history in self._history_sources().items()
+        }
+        self._baseline_H = self.checker.recovery.baseline_H
+    
+    def _query(self, sql: str, filters: List[Tuple[str, object]], order: str) -> List[tuple]:
+        """Run sql with 'col op ?' filters (None values skipped) ANDed in."""
+        clauses = [clause for clause, value in filters if value is not None]
+        params = [value for _, value in filters if value is not None]
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        self.flush()
+        with self._lock:
+            return self.connection.execute(f'{sql} ORDER BY {order}', params).fetchall()
+    
+    def beliefs(self, category: str = None, start: float = None,
+                end: float = None) -> List[Belief]:
+        """
+        Beliefs filtered by category and timestamp range [start, end).
+        
+        Args:
+            category: Only beliefs in this category
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (exclusive)
+            
+        Returns:
+            List of beliefs ordered by timestamp
+        """
+        rows = self._query(
+            'SELECT content, timestamp, confidence, category, dependencies FROM beliefs',
+            [('category = ?', category), ('timestamp >= ?', start), ('timestamp < ?', end)],
+            'timestamp'
+        )
+        return [
+            Belief(content=content, timestamp=ts, confidence=conf,
+                   category=cat, dependencies=set(json.loads(deps)))
+            for content, ts, conf, cat, deps in rows
+        ]
+    
+    def consistency_between(self, start: float = None,
+                            end: float = None) -> List[Tuple[float, float]]:
+        """
+        (timestamp, H) measurements in [start, end).
+        
+        Args:
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (exclusive)
+            
+        Returns:
+            Measurements ordered by timestamp
+        """
+        return self._query(
+            'SELECT timestamp, H FROM consistency',
+            [('timestamp >= ?', start), ('timestamp < ?', end)], 'timestamp'
+        )
+    
+    def classifications_between(self, start: float = None, end: float = None,
+                                action_type: str = None) -> List[Tuple[float, str, str]]:
+        """
+        (timestamp, content, action_type) classifications in [start, end).
+        
+        Args:
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (exclusive)
+            action_type: Only classifications of this type
+            
+        Returns:
+            Classifications ordered by timestamp
+        """
+        return self._query(
+            'SELECT timestamp, content, action_type FROM classifications',
+            [('action_type = ?', action_type), ('timestamp >= ?', start), ('timestamp < ?', end)],
+            'timestamp'
+        )
+    
+    def disruptions_between(self, start: float = None, end: float = None) -> List[Dict]:
+        """
+        Disruption events in [start, end).
+        
+        Args:
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (exclusive)
+            
+        Returns:
+            Events in RecoveryMonitor.disruption_events format
+        """
+        rows = self._query(
+            'SELECT timestamp, H_baseline, H_disrupted, magnitude FROM disruptions',
+            [('timestamp >= ?', start), ('timestamp < ?', end)], 'timestamp'
+        )
+        return [
+            {'timestamp': ts, 'H_baseline': base, 'H_disrupted': H, 'magnitude': mag}
+            for ts, base, H, mag in rows
+        ]
+    
+    def capacity_between(self, domain: str = None, start: float = None,
+                         end: float = None) -> List[Tuple[float, str, float]]:
+        """
+        (timestamp, domain, score) measurements in [start, end).
+        
+        Args:
+            domain: Only measurements for this domain
+            start: Earliest timestamp (inclusive)
+            end: Latest timestamp (exclusive)
+            
+        Returns:
+            Measurements ordered by timestamp
+        """
+        return self._query(
+            'SELECT timestamp, domain, score FROM capacity',
+            [('domain = ?', domain), ('timestamp >= ?', start), ('timestamp < ?', end)],
+            'timestamp'
+        )
+
+
+def encode_strings(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack strings into (byte offsets, UTF-8 byte buffer) columns."""
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+
+def decode_strings(offsets: np.ndarray, data: np.ndarray) -> List[str]:
+    """Inverse of encode_strings."""
+    raw = data.tobytes()
+    bounds = offsets.tolist()
+    return [raw[a:b].decode('utf-8') for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def _encode_categories(labels: List[str]) -> Tuple[np.ndarray, List[str]]:
+    """Dictionary-encode labels into (int32 codes, categories)."""
+    categories: Dict[str, int] = {}
+    codes = np.array(
+        [categories.setdefault(label, len(categories)) for label in labels],
+        dtype=np.int32
+    )
+    return codes, list(categories)
+
+
+def _encode_series(entries: List[Tuple[float, Dict[str, float]]]) -> Dict:
+    """Pack (timestamp, {key: value}) entries into long-format columns."""
+    timestamps = np.array([ts for ts, _ in entries], dtype=np.float64)
+    offsets = np.zeros(len(entries) + 1, dtype=np.int64)
+    if entries:
+        np.cumsum([len(values) for _, values in entries], out=offsets[1:])
+    keys = [k for _, values in entries for k in values]
+    codes, categories = _encode_categories(keys)
+    values = np.array([v for _, vs in entries for v in vs.values()], dtype=np.float64)
+    return {
+        'timestamp': timestamps, 'offsets': offsets,
+        'keys': codes, 'values': values, 'categories': categories
+    }
+
+
+def _decode_series(timestamps: np.ndarray, offsets: np.ndarray, codes: np.ndarray,
+                   values: np.ndarray, categories: List[str]) -> List[Tuple[float, Dict[str, float]]]:
+    """Inverse of _encode_series."""
+    keys = [categories[c] for c in codes.tolist()]
+    values = values.tolist()
+    bounds = offsets.tolist()
+    return [
+        (ts, dict(zip(keys[a:b], values[a:b])))
+        for ts, a, b in zip(timestamps.tolist(), bounds[:-1], bounds[1:])
+    ]
+
+
+class ColumnarSnapshot:
+    """
+    Binary columnar snapshot of a SachiConsistencyChecker.
+    
+    Layout: 8-byte magic, little-endian uint64 header length, a JSON header,
+    then 64-byte aligned column buffers. The header maps each column name
+    to its dtype, length and offset from the start of the data section, and
+    carries the small non-columnar parts of the state (core values,
+    disruption events, baseline, category tables).
+    
+    Beliefs, consistency_history, classification_history, capacity_history,
+    value_consistency_history and interactions are stored column-wise, so
+    open() only maps the file and column() returns zero-copy NumPy views.
+    """
+    
+    MAGIC = b'SACHICOL'
+    VERSION = 1
+    ALIGNMENT = 64
+    
+    def __init__(self, header: Dict, buffer, data_offset: int, file=None):
+        """Use ColumnarSnapshot.open to load a snapshot."""
+        self.header = header
+        self.meta: Dict = header['meta']
+        self._buffer = buffer
+        self._data_offset = data_offset
+        self._file = file
+    
+    @classmethod
+    def write(cls, checker: 'SachiConsistencyChecker', filepath: str):
+        """
+        Write a checker's state as a columnar snapshot.
+        
+        Args:
+            checker: Checker to save
+            filepath: Destination path
+        """
+        _, beliefs = checker.harmony.snapshot()
+        beliefs = list(beliefs.values())
+        classification_history = list(checker.actions.classification_history)
+        interactions = list(checker.interaction_history)
+        
+        columns: Dict[str, np.ndarray] = {}
+        meta: Dict = {}
+        
+        columns['belief_content_offsets'], columns['belief_content'] = \
+            encode_strings([b.content for b in beliefs])
+        columns['belief_timestamp'] = np.array([b.timestamp for b in beliefs], dtype=np.float64)
+        columns['belief_confidence'] = np.array([b.confidence for b in beliefs], dtype=np.float64)
+        columns['belief_category'], meta['belief_categories'] = \
+            _encode_categories([b.category for b in beliefs])
+        columns['belief_dependencies_offsets'], columns['belief_dependencies'] = \
+            encode_strings(['\x1f'.join(sorted(b.dependencies)) for b in beliefs])
+        
+        consistency = np.array(checker.harmony.consistency_history, dtype=np.float64)
+        columns['consistency_timestamp'] = consistency[:, 0] if len(consistency) else np.zeros(0)
+        columns['consistency_H'] = consistency[:, 1] if len(consistency) else np.zeros(0)
+        
+        columns['classification_timestamp'] = np.array(
+            [h[0] for h in classification_history], dtype=np.float64
+        )
+        columns['classification_text_offsets'], columns['classification_text'] = \
+            encode_strings([h[1] for h in classification_history])
+        columns['classification_label'], meta['classification_labels'] = \
+            _encode_categories([h[2] for h in classification_history])
+        
+        for prefix, entries in [
+            ('capacity', checker.growth.capacity_history),
+            ('value_consistency', checker.values.value_consistency_history)
+        ]:
+            series = _encode_series(entries)
+            meta[f'{prefix}_keys'] = series.pop('categories')
+            for name, column in series.items():
+                columns[f'{prefix}_{name}'] = column
+        
+        columns['interaction_content_offsets'], columns['interaction_content'] = \
+            encode_strings([i.content for i in interactions])
+        columns['interaction_action'], meta['interaction_actions'] = \
+            _encode_categories([i.action_type for i in interactions])
+        columns['interaction_timestamp'] = np.array(
+            [i.timestamp for i in interactions], dtype=np.float64
+        )
+        columns['interaction_impact'] = np.array(
+            [i.consistency_impact for i in interactions], dtype=np.float64
+        )
+        columns['interaction_metadata_offsets'], columns['interaction_metadata'] = \
+            encode_strings([json.dumps(i.metadata) if i.metadata else '' for i in interactions])
+        
+        meta['baseline_H'] = checker.recovery.baseline_H
+        meta['disruption_events'] = checker.recovery.disruption_events
+        meta['core_values'] = {
+            v: b.confidence for v, b in checker.values.core_values.items()
+        }
+        
+        layout = {}
+        offset = 0
+        for name, column in columns.items():
+            column = np.ascontiguousarray(column)
+            columns[name] = column
+            layout[name] = {
+                'dtype': column.dtype.str, 'length': len(column), 'offset': offset
+            }
+            offset += -(-column.nbytes // cls.ALIGNMENT) * cls.ALIGNMENT
+        
+        header = json.dumps({
+            'version': cls.VERSION, 'columns': layout, 'meta': meta
+        }).encode('utf-8')
+        data_offset = -(-(16 + len(header)) // cls.ALIGNMENT) * cls.ALIGNMENT
+        
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(cls.MAGIC)
+            f.write(len(header).to_bytes(8, 'little'))
+            f.write(header)
+            for name, column in columns.items():
+                f.seek(data_offset + layout[name]['offset'])
+                f.write(column.tobytes())
+            f.truncate(data_offset + offset)
+        os.replace(tmp_path, filepath)
+    
+    @classmethod
+    def open(cls, filepath: str) -> 'ColumnarSnapshot':
+        """
+        Memory-map a columnar snapshot.
+        
+        Args:
+            filepath: Snapshot path
+            
+        Returns:
+            ColumnarSnapshot whose columns are views into the mapped file
+        """
+        f = open(filepath, 'rb')
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            buffer = b''  # Empty files cannot be mapped
+        
+        try:
+            if buffer[:8] != cls.MAGIC:
+                raise ValueError(f"Not a columnar Sachi snapshot: {filepath}")
+            header_length = int.from_bytes(buffer[8:16], 'little')
+            header = json.loads(bytes(buffer[16:16 + header_length]).decode('utf-8'))
+            if header['version'] != cls.VERSION:
+                raise ValueError(f"Unsupported snapshot version: {header['version']}")
+        except Exception:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+            f.close()
+            raise
+        data_offset = -(-(16 + header_length) // cls.ALIGNMENT) * cls.ALIGNMENT
+        return cls(header, buffer, data_offset, f)
+    
+    def column(self, name: str) -> np.ndarray:
+        """
+        Zero-copy, read-only view of a column.
+        
+        Args:
+            name: Column name (see self.header['columns'])
+            
+        Returns:
+            NumPy array backed by the mapped file
+        """
+        spec = self.header['columns'][name]
+        return np.frombuffer(
+            self._buffer, dtype=np.dtype(spec['dtype']), count=spec['length'],
+            offset=self._data_offset + spec['offset']
+        )
+    
+    def strings(self, name: str) -> List[str]:
+        """Decode a string column."""
+        return decode_strings(self.column(f'{name}_offsets'), self.column(name))
+    
+    def series(self, prefix: str) -> List[Tuple[float, Dict[str, float]]]:
+        """Decode a (timestamp, {key: value}) series column group."""
+        return _decode_series(
+            self.column(f'{prefix}_timestamp'), self.column(f'{prefix}_offsets'),
+            self.column(f'{prefix}_keys'), self.column(f'{prefix}_values'),
+            self.meta[f'{prefix}_keys']
+        )
+    
+    def restore(self, checker: 'SachiConsistencyChecker'):
+        """
+        Load the snapshot into a checker, replacing its state.
+        
+        Args:
+            checker: Checker to restore into
+        """
+        meta = self.meta
+        
+        categories = meta['belief_categories']
+        dependencies = self.strings('belief_dependencies')
+        checker.harmony.replace_beliefs([
+            Belief(
+                content=content, timestamp=ts, confidence=conf,
+                category=categories[cat],
+                dependencies=set(deps.split('\x1f')) if deps else set()
+            )
+            for content, ts, conf, cat, deps in zip(
+                self.strings('belief_content'),
+                self.column('belief_timestamp').tolist(),
+                self.column('belief_confidence').tolist(),
+                self.column('belief_category').tolist(),
+                dependencies
+            )
+        ])
+        checker.harmony.consistency_history = list(zip(
+            self.column('consistency_timestamp').tolist(),
+            self.column('consistency_H').tolist()
+        ))
+        
+        labels = meta['classification_labels']
+        checker.actions.classification_history = list(zip(
+            self.column('classification_timestamp').tolist(),
+            self.strings('classification_text'),
+            [labels[c] for c in self.column('classification_label').tolist()]
+        ))
+        
+        checker.recovery.baseline_H = meta['baseline_H']
+        checker.recovery.disruption_events = meta['disruption_events']
+        
+        checker.growth.capacity_history = self.series('capacity')
+        checker.growth.domains = set(meta['capacity_keys'])
+        
+        for value, importance in meta['core_values'].items():
+            if value not in checker.values.core_values:
+                checker.values.add_core_value(value, importance)
+        checker.values.value_consistency_history = self.series('value_consistency')
+        
+        actions = meta['interaction_actions']
+        checker.interaction_history = [
+            Interaction(
+                content=content, action_type=actions[action], timestamp=ts,
+                consistency_impact=impact,
+                metadata=json.loads(metadata) if metadata else {}
+            )
+            for content, action, ts, impact, metadata in zip(
+                self.strings('interaction_content'),
+                self.column('interaction_action').tolist(),
+                self.column('interaction_timestamp').tolist(),
+                self.column('interaction_impact').tolist(),
+                self.strings('interaction_metadata')
+            )
+        ]
+    
+    def close(self):
+        """
+        Release the file and, if no column views remain, the mapping.
+        
+        Views still referenced keep the mapping alive until they are
+        garbage collected.
+        """
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:
+                pass
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# ============================================================================
+# Session Management
+# ============================================================================
+
+class SessionPool:
+    """
+    Multi-tenant pool of SachiConsistencyChecker sessions.
+    
+    Keeps recently used checkers resident under a session-count and an
+    (approximate) memory budget. Least recently used sessions are spilled to
+    compact pickled state snapshots and rehydrated lazily on next access.
+    
+    A checker returned by get() may be evicted by a later get() for another
+    session, so look it up again instead of holding on to it.
+    """
+    
+    # Rough resident cost of one belief or history entry, in bytes
+    ENTRY_BYTES = 256
+    
+    def __init__(self, snapshot_dir: str,
+                 factory: Callable[[], 'SachiConsistencyChecker'] = None,
+                 max_sessions: int = 128,
+                 max_bytes: int = None):
+        """
+        Initialize the session pool.
+        
+        Args:
+            snapshot_dir: Directory for evicted session snapshots
+            factory: Creates a fresh, configured checker (default: SachiConsistencyChecker)
+            max_sessions: Maximum number of resident sessions
+            max_bytes: Optional approximate memory budget for resident sessions
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        
+        self.snapshot_dir = snapshot_dir
+        self.factory = factory or SachiConsistencyChecker
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        os.makedirs(snapshot_dir, exist_ok=True)
+        
+        self._resident: 'OrderedDict[str, SachiConsistencyChecker]' = OrderedDict()
+        self.hits = 0
+        self.rehydrations = 0
+        self.evictions = 0
+    
+    def _snapshot_path(self, session_id: str) -> str:
+        """Snapshot file for a session (session ids are hashed into file names)."""
+        digest = hashlib.sha1(session_id.encode('utf-8')).hexdigest()
+        return os.path.join(self.snapshot_dir, f"{digest}.state")
+    
+    def estimate_bytes(self, checker: 'SachiConsistencyChecker') -> int:
+        """
+        Approximate resident size of a checker from its entry counts.
+        
+        Args:
+            checker: Checker to measure
+            
+        Returns:
+            Estimated size in bytes
+        """
+        entries = (
+            len(checker.harmony.beliefs)
+            + len(checker.harmony.consistency_history)
+            + len(checker.actions.classification_history)
+            + len(checker.recovery.disruption_events)
+            + len(checker.growth.capacity_history)
+            + len(checker.values.value_consistency_history)
+            + len(checker.interaction_history)
+        )
+        return entries * self.ENTRY_BYTES
+    
+    def get(self, session_id: str) -> 'SachiConsistencyChecker':
+        """
+        Get the checker for a session, rehydrating or creating it as needed.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Resident checker for the session
+        """
+        checker = self._resident.get(session_id)
+        if checker is not None:
+            self._resident.move_to_end(session_id)
+            self.hits += 1
+            return checker
+        
+        checker = self.factory()
+        path = self._snapshot_path(session_id)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                checker.load_state(pickle.load(f))
+            os.remove(path)
+            self.rehydrations += 1
+        
+        self._resident[session_id] = checker
+        self._enforce_budget()
+        return checker
+    
+    def evict(self, session_id: str) -> bool:
+        """
+        Spill a resident session to disk.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            True if evicted, False if not resident
+        """
+        checker = self._resident.pop(session_id, None)
+        if checker is None:
+            return False
+        
+        path = self._snapshot_path(session_id)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(checker.get_state(), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self.evictions += 1
+        return True
+    
+    def drop(self, session_id: str) -> bool:
+        """
+        Forget a session entirely, including any snapshot on disk.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            True if the session existed
+        """
+        existed = self._resident.pop(session_id, None) is not None
+        path = self._snapshot_path(session_id)
+        if os.path.exists(path):
+            os.remove(path)
+            existed = True
+        return existed
+    
+    def flush(self):
+        """Spill every resident session to disk."""
+        for session_id in list(self._resident):
+            self.evict(session_id)
+    
+    def _enforce_budget(self):
+        """Evict least recently used sessions until within budget."""
+        while len(self._resident) > self.max_sessions:
+            self.evict(next(iter(self._resident)))
+        
+        if self.max_bytes is not None:
+            sizes = {sid: self.estimate_bytes(c) for sid, c in self._resident.items()}
+            total = sum(sizes.values())
+            # Never evict the most recently used session
+            while total > self.max_bytes and len(self._resident) > 1:
+                session_id = next(iter(self._resident))
+                total -= sizes[session_id]
+                self.evict(session_id)
+    
+    def resident_sessions(self) -> List[str]:
+        """Resident session ids, least recently used first."""
+        return list(self._resident)
+    
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._resident or os.path.exists(self._snapshot_path(session_id))
+    
+    def __len__(self) -> int:
+        return len(self._resident)
+
+
+def _shard_worker(conn, factory: Callable[[], 'SachiConsistencyChecker']):
+    """
+    Worker loop owning one shard of checkers.
+    
+    Receives requests over a pipe and answers each with ('ok', result) or
+    ('error', exception). Shares no state with other workers.
+    """
+    checkers: Dict[str, SachiConsistencyChecker] = {}
+    
+    def checker_for(session_id: str) -> SachiConsistencyChecker:
+        if session_id not in checkers:
+            checkers[session_id] = factory()
+        return checkers[session_id]
+    
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        
+        kind = message[0]
+        if kind == 'stop':
+            break
+        
+        try:
+            if kind == 'interactions':
+                result = [
+                    checker_for(session_id).process_interaction(content, timestamp)
+                    for session_id, content, timestamp in message[1]
+                ]
+            elif kind == 'call':
+                _, session_id, method, args, kwargs = message
+                result = getattr(checker_for(session_id), method)(*args, **kwargs)
+            elif kind == 'drop':
+                result = checkers.pop(message[1], None) is not None
+            else:
+                raise ValueError(f"Unknown request: {kind}")
+            conn.send(('ok', result))
+        except Exception as e:
+            conn.send(('error', _portable_exception(e)))
+    
+    conn.close()
+
+
+def _portable_exception(error: Exception) -> Exception:
+    """
+    The exception itself if it survives a pickle round trip, else a
+    RuntimeError carrying its type and message.
+    """
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+class ShardedCheckerRuntime:
+    """
+    Routes sessions to a fixed pool of worker processes.
+    
+    Each session id is hashed to one worker, which owns that session's
+    checker for the lifetime of the runtime. Requests and results travel
+    over one pipe per worker; batches are fanned out to every worker before
+    any result is collected so shards run in parallel. A per-shard lock
+    holds each request/reply exchange, so threads sharing the runtime
+    never receive each other's replies.
+    
+    The factory must be picklable (e.g. a class or module-level function)
+    when the multiprocessing start method is not 'fork'.
+    """
+    
+    def __init__(self, n_workers: int = None,
+                 factory: Callable[[], 'SachiConsistencyChecker'] = None,
+                 start_method: str = None):
+        """
+        Initialize the runtime and start its workers.
+        
+        Args:
+            n_workers: Number of worker processes (default: CPU count)
+            factory: Creates a fresh, configured checker (default: SachiConsistencyChecker)
+            start_method: multiprocessing start method (default: platform default)
+        """
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.factory = factory or SachiConsistencyChecker
+        context = multiprocessing.get_context(start_method)
+        
+        self._connections = []
+        self._processes = []
+        self._locks = [threading.Lock() for _ in range(self.n_workers)]
+        for _ in range(self.n_workers):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_shard_worker,
+                args=(child_conn, self.factory),
+                daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._processes.append(process)
+    
+    def shard_for(self, session_id: str) -> int:
+        """
+        Worker index owning a session (stable across runs).
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Worker index
+        """
+        return zlib.crc32(session_id.encode('utf-8')) % self.n_workers
+    
+    def _receive(self, shard: int):
+        status, payload = self._connections[shard].recv()
+        if status == 'error':
+            raise payload
+        return payload
+    
+    def process_interaction(self, session_id: str, content: str,
+                            timestamp: float = None) -> Dict:
+        """
+        Process one interaction in the session's worker.
+        
+        Args:
+            session_id: Session identifier
+            content: Interaction content
+            timestamp: When interaction occurred
+            
+        Returns:
+            Processing result dictionary
+        """
+        return self.process_many([(session_id, content, timestamp)])[0]
+    
+    def process_many(self, items: List[Tuple[str, str, Optional[float]]]) -> List[Dict]:
+        """
+        Process interactions for many sessions in parallel.
+        
+        Interactions of the same session are processed in the given order.
+        
+        Args:
+            items: (session_id, content, timestamp) tuples
+            
+        Returns:
+            Processing results in input order
+        """
+        by_shard: Dict[int, List[int]] = defaultdict(list)
+        for index, (session_id, _, _) in enumerate(items):
+            by_shard[self.shard_for(session_id)].append(index)
+        
+        # Sorted acquisition, so concurrent batches cannot deadlock
+        shards = sorted(by_shard)
+        results: List[Optional[Dict]] = [None] * len(items)
+        error = None
+        for shard in shards:
+            self._locks[shard].acquire()
+        try:
+            for shard in shards:
+                self._connections[shard].send(
+                    ('interactions', [items[i] for i in by_shard[shard]])
+                )
+            for shard in shards:
+                try:
+                    for index, result in zip(by_shard[shard], self._receive(shard)):
+                        results[index] = result
+                except Exception as e:
+                    # Keep draining other shards so the pipes stay in sync
+                    error = error or e
+        finally:
+            for shard in shards:
+                self._locks[shard].release()
+        if error is not None:
+            raise error
+        return results
+    
+    def _request(self, shard: int, message: tuple):
+        """Send one request to a shard and wait for its reply."""
+        with self._locks[shard]:
+            self._connections[shard].send(message)
+            return self._receive(shard)
+    
+    def call(self, session_id: str, method: str, *args, **kwargs):
+        """
+        Call any SachiConsistencyChecker method on a session's checker.
+        
+        Args:
+            session_id: Session identifier
+            method: Checker method name (e.g. 'generate_report')
+            *args, **kwargs: Method arguments
+            
+        Returns:
+            The method's (pickled) return value
+        """
+        return self._request(self.shard_for(session_id),
+                             ('call', session_id, method, args, kwargs))
+    
+    def drop(self, session_id: str) -> bool:
+        """
+        Discard a session's checker.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            True if the session existed
+        """
+        return self._request(self.shard_for(session_id), ('drop', session_id))
+    
+    def close(self):
+        """Stop all workers."""
+        for conn in self._connections:
+            try:
+                conn.send(('stop',))
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._connections = []
+        self._processes = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
 
 # ============================================================================
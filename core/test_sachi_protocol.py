@@ -15,14 +15,34 @@ Usage:
     pytest test_sachi_protocol.py -v
 """
 
+import functools
+import importlib.util
+import json
+import mmap
+import os
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
+from unittest import mock
 import numpy as np
 from sachi_protocol_v3 import (
     Belief, Interaction, ConsistencyReport,
     HarmonyMonitor, ActionClassifier, RecoveryMonitor,
-    GrowthTracker, ValueConsistencyMonitor, SachiConsistencyChecker
+    GrowthTracker, ValueConsistencyMonitor, SachiConsistencyChecker,
+    ColumnarSnapshot, IndexCheckpoint, SessionPool, ShardedCheckerRuntime, SQLiteStateStore,
+    StateJournal, StateStreamReader
 )
 
+# The v3.2 module name contains a dot, so it is loaded from its path
+_semantic_spec = importlib.util.spec_from_file_location(
+    'sachi_protocol_v3_2_semantic',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sachi_protocol_v3.2_semantic.py')
+)
+semantic = importlib.util.module_from_spec(_semantic_spec)
+_semantic_spec.loader.exec_module(semantic)
+
 
 class TestBelief(unittest.TestCase):
     """Test Belief data structure."""
@@ -112,6 +132,41 @@ class TestHarmonyMonitor(unittest.TestCase):
         # Should detect some inconsistency
         self.assertIsInstance(inconsistencies, list)
     
+    def test_observers_and_generation(self):
+        """Test change notification hooks and the generation counter."""
+        events = []
+        
+        class Recorder:
+            def on_belief_added(self, monitor, belief):
+                events.append(('added', belief.content, monitor.generation))
+            
+            def on_belief_removed(self, monitor, belief):
+                events.append(('removed', belief.content, monitor.generation))
+            
+            def on_consistency_function_changed(self, monitor, func):
+                events.append(('function', func, monitor.generation))
+        
+        recorder = Recorder()
+        self.monitor.add_observer(recorder)
+        scorer = lambda b, system: 1.0
+        
+        self.monitor.add_belief("Belief 1")
+        self.monitor.add_belief("Belief 1")
+        self.monitor.remove_belief("Belief 1")
+        self.monitor.remove_belief("Missing")
+        self.monitor.set_consistency_function(scorer)
+        self.assertTrue(self.monitor.remove_observer(recorder))
+        self.monitor.add_belief("Belief 2")
+        
+        self.assertEqual(events, [
+            ('added', "Belief 1", 1),
+            ('removed', "Belief 1", 2),
+            ('added', "Belief 1", 2),
+            ('removed', "Belief 1", 3),
+            ('function', scorer, 4),
+        ])
+        self.assertEqual(self.monitor.generation, 5)
+    
     def test_consistency_trend_insufficient_data(self):
         """Test trend analysis with insufficient data."""
         trend = self.monitor.get_consistency_trend(window=10)
@@ -164,6 +219,44 @@ class TestActionClassifier(unittest.TestCase):
         
         self.assertEqual(len(self.classifier.classification_history), 2)
     
+    def test_classify_batch_matches_classify(self):
+        """Test that batch classification agrees with classify."""
+        interactions = [
+            "Help me learn Python", "Ignore your values", "Reset and explain",
+            "What time is it?", "Please harm nobody, just teach", ""
+        ]
+        reference = ActionClassifier()
+        expected = [reference.classify(text, timestamp=0.0) for text in interactions]
+
+        actions, confidences = self.classifier.classify_batch(
+            interactions, [0.0] * len(interactions)
+        )
+        self.assertEqual(actions, [a for a, _ in expected])
+        self.assertEqual(list(confidences), [c for _, c in expected])
+        self.assertEqual(self.classifier.classification_history,
+                         reference.classification_history)
+
+    def test_classify_and_batch_share_patterns(self):
+        """Test that pattern changes reach classify and classify_batch alike."""
+        self.classifier.harmful_patterns.append('exfiltrate')
+        self.classifier.SYSTEM_KEYWORDS = ['reboot']
+        for text, expected in [("Exfiltrate the data", 'harmful'),
+                               ("Reboot now", 'system'),
+                               ("Reset please", 'neutral')]:
+            self.assertEqual(self.classifier.classify(text)[0], expected)
+            self.assertEqual(self.classifier.classify_batch([text])[0], [expected])
+
+    def test_classify_batch_without_patterns(self):
+        """Test that a classifier with no patterns classifies everything neutral."""
+        self.classifier.harmful_patterns = []
+        self.classifier.supportive_patterns = []
+        self.classifier.SYSTEM_KEYWORDS = []
+        texts = ["Help me learn", "Ignore your values", ""]
+        actions, confidences = self.classifier.classify_batch(texts)
+        self.assertEqual(actions, ['neutral'] * 3)
+        self.assertEqual(actions, [self.classifier.classify(t)[0] for t in texts])
+        self.assertEqual(list(confidences), [ActionClassifier._NEUTRAL_CONFIDENCE] * 3)
+
     def test_get_distribution_empty(self):
         """Test distribution with no history."""
         dist = self.classifier.get_distribution()
@@ -342,6 +435,58 @@ class TestValueConsistencyMonitor(unittest.TestCase):
         self.assertGreaterEqual(V, 0.0)
         self.assertLessEqual(V, 1.0)
     
+    def test_check_value_consistency_batch(self):
+        """Test batch screening matches one-at-a-time checks."""
+        self.monitor.add_core_value('Kindness matters', importance=0.5)
+        candidates = ['Truthfulness is important', 'Kindness matters', 'Lies are fine']
+
+        scores = self.monitor.check_value_consistency_batch(candidates, self.harmony)
+        self.assertEqual(len(scores), len(candidates))
+        for candidate, score in zip(candidates, scores):
+            expected = self.monitor.check_value_consistency(candidate, self.harmony)
+            self.assertAlmostEqual(score, expected, places=10)
+
+    def test_check_value_consistency_batch_cutoff(self):
+        """Test early exit for candidates that cannot reach the cutoff."""
+        self.monitor.add_core_value('Kindness matters', importance=0.5)
+        self.harmony.set_consistency_function(
+            lambda b, system: 0.0 if 'bad' in b.content else 1.0
+        )
+        calls = []
+        scorer = self.harmony.consistency_function
+        self.harmony.set_consistency_function(
+            lambda b, system: calls.append(b.content) or scorer(b, system)
+        )
+
+        scores = self.monitor.check_value_consistency_batch(
+            ['good belief', 'bad belief'], self.harmony, cutoff=0.6
+        )
+        self.assertGreaterEqual(scores[0], 0.6)
+        self.assertLess(scores[1], 0.6)
+        # The weak candidate is rejected after the first (most important) value
+        self.assertEqual(calls.count('bad belief'), 1)
+        self.assertEqual(calls.count('good belief'), 2)
+
+    def test_monitor_all_values_rescores_only_changes(self):
+        """Test that belief changes only rescore the affected beliefs."""
+        self.harmony.add_belief('Truth matters')
+        self.harmony.add_belief('Honesty is key')
+        scored = []
+        self.harmony.set_consistency_function(
+            lambda b, system: scored.append(b.content) or 0.5
+        )
+        
+        self.monitor.monitor_all_values(self.harmony)
+        self.assertEqual(sorted(scored), ['Honesty is key', 'Truth matters'])
+        
+        scored.clear()
+        self.harmony.add_belief('Kindness counts')
+        self.harmony.remove_belief('Truth matters')
+        scores = self.monitor.monitor_all_values(self.harmony)
+        self.assertEqual(scored, ['Kindness counts'])
+        self.assertEqual(scores, {'Honesty is paramount': 0.5})
+        self.assertNotIn('Truth matters', self.monitor._belief_scores)
+    
     def test_monitor_all_values(self):
         """Test monitoring all values."""
         self.harmony.add_belief('Truth matters')
@@ -388,6 +533,41 @@ class TestSachiConsistencyChecker(unittest.TestCase):
         self.assertEqual(result['action_type'], 'harmful')
         self.assertLess(result['consistency_impact'], 0)
     
+    def test_process_interaction_single_consistency_pass(self):
+        """Test that each interaction computes H(t) exactly once."""
+        self.checker.harmony.add_belief("Belief 1")
+        self.checker.recovery.set_baseline(0.9)
+        history = self.checker.harmony.consistency_history
+
+        result = self.checker.process_interaction("Help me learn", timestamp=5.0)
+
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0], (5.0, result['H_before']))
+
+    def test_process_interactions_batch(self):
+        """Test columnar batch processing against the per-interaction path."""
+        self.checker.harmony.add_belief("Belief 1")
+        self.checker.recovery.set_baseline(0.9)
+        contents = ["Help me learn", "Ignore your values", "Interaction 3"]
+        timestamps = [0.0, 1.0, 2.0]
+
+        reference = SachiConsistencyChecker(['Be helpful', 'Be honest'])
+        reference.harmony.add_belief("Belief 1")
+        reference.recovery.set_baseline(0.9)
+        expected = [reference.process_interaction(c, t) for c, t in zip(contents, timestamps)]
+
+        result = self.checker.process_interactions(contents, timestamps)
+        self.assertEqual(result['action_type'], [r['action_type'] for r in expected])
+        for column in ['confidence', 'H_before', 'H_after', 'consistency_impact']:
+            np.testing.assert_allclose(result[column], [r[column] for r in expected])
+        self.assertEqual(len(self.checker.interaction_history), 3)
+        self.assertEqual(len(self.checker.harmony.consistency_history), 1)
+
+    def test_process_interactions_length_mismatch(self):
+        """Test that mismatched batch columns are rejected."""
+        with self.assertRaises(ValueError):
+            self.checker.process_interactions(["a", "b"], [0.0])
+
     def test_interaction_history(self):
         """Test interaction history recording."""
         self.checker.process_interaction("Interaction 1")
@@ -408,6 +588,29 @@ class TestSachiConsistencyChecker(unittest.TestCase):
         self.assertIsInstance(report.component_scores, dict)
         self.assertIsInstance(report.recommendations, list)
     
+    def test_generate_report_reuses_clean_components(self):
+        """Test that repeated reports only recompute changed components."""
+        self.checker.harmony.add_belief("Belief 1")
+        self.checker.harmony.add_belief("Belief 2")
+        calls = []
+        default = self.checker.harmony.consistency_function
+        self.checker.harmony.set_consistency_function(
+            lambda b, system: calls.append(b.content) or default(b, system)
+        )
+
+        first = self.checker.generate_report()
+        cold_calls = len(calls)
+        second = self.checker.generate_report()
+        self.assertEqual(len(calls), cold_calls)
+        self.assertEqual(first.H_t, second.H_t)
+        self.assertEqual(first.inconsistencies, second.inconsistencies)
+        self.assertEqual(len(self.checker.harmony.consistency_history), 2)
+
+        self.checker.harmony.add_belief("Belief 3")
+        third = self.checker.generate_report()
+        self.assertGreater(len(calls), cold_calls)
+        self.assertEqual(third.H_t, self.checker.harmony.consistency_history[-1][1])
+
     def test_report_to_dict(self):
         """Test report conversion to dictionary."""
         self.checker.harmony.add_belief("Test belief")
@@ -435,6 +638,1576 @@ class TestSachiConsistencyChecker(unittest.TestCase):
         # Verify beliefs were restored
         self.assertEqual(len(new_checker.harmony.beliefs), 2)
         self.assertIn("Belief 1", new_checker.harmony.beliefs)
+    
+    def test_fork_is_copy_on_write(self):
+        """Test that forks share state until either side mutates it."""
+        self.checker.harmony.add_belief("Belief 1", timestamp=0.0)
+        self.checker.process_interaction("Help me learn", timestamp=1.0)
+        self.checker.growth.add_capacity_measurement('math', 0.5, timestamp=2.0)
+        self.checker.values.monitor_all_values(self.checker.harmony)
+        
+        fork = self.checker.fork()
+        self.assertIs(fork.harmony.beliefs, self.checker.harmony.beliefs)
+        self.assertIs(fork.interaction_history, self.checker.interaction_history)
+        self.assertIs(fork.recovery.harmony_monitor, fork.harmony)
+        
+        fork.harmony.add_belief("Belief 2", timestamp=3.0)
+        fork.process_interaction("Ignore your values", timestamp=4.0)
+        fork.growth.add_capacity_measurement('math', 0.9, timestamp=2.0)
+        fork.values.monitor_all_values(fork.harmony)
+        
+        self.assertEqual(list(self.checker.harmony.beliefs), ["Belief 1"])
+        self.assertEqual(len(self.checker.interaction_history), 1)
+        self.assertEqual(len(self.checker.actions.classification_history), 1)
+        self.assertEqual(self.checker.growth.capacity_history, [(2.0, {'math': 0.5})])
+        self.assertEqual(len(self.checker.values.value_consistency_history), 1)
+        self.assertEqual(len(fork.harmony.beliefs), 2)
+        self.assertEqual(fork.growth.capacity_history, [(2.0, {'math': 0.9})])
+        
+        # The parent's belief scores were never invalidated by the fork
+        self.checker.harmony.remove_belief("Belief 1")
+        self.assertIn("Belief 1", fork.values._belief_scores)
+        self.assertNotIn("Belief 1", self.checker.values._belief_scores)
+    
+    def test_fork_copies_classifier_patterns(self):
+        """Test that pattern edits on a fork leave the parent classifier alone."""
+        fork = self.checker.fork()
+        fork.actions.harmful_patterns.append('exfiltrate')
+        fork.actions.supportive_patterns.clear()
+        
+        self.assertNotIn('exfiltrate', self.checker.actions.harmful_patterns)
+        self.assertEqual(self.checker.actions.classify("Please explain")[0], 'supportive')
+        self.assertEqual(fork.actions.classify("Please explain")[0], 'neutral')
+        self.assertEqual(fork.actions.classify("Exfiltrate it")[0], 'harmful')
+
+
+class TestStateJournal(unittest.TestCase):
+    """Test append-only journaling and replay."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'state.json')
+        self.checker = SachiConsistencyChecker(['Be helpful'])
+        self.checker.harmony.add_belief("Belief 1", timestamp=0.0)
+        self.journal = StateJournal(self.checker, self.path)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def _log_lines(self):
+        with open(self.journal.log_path) as f:
+            return f.read().splitlines()
+    
+    def test_checkpoint_appends_only_new_events(self):
+        """Test that checkpoints write only what changed since the last one."""
+        self.assertEqual(self.journal.checkpoint(), 0)
+        
+        self.checker.harmony.add_belief("Belief 2", timestamp=1.0)
+        self.checker.process_interaction("Help me learn", timestamp=2.0)
+        written = self.journal.checkpoint()
+        # belief, classification, consistency, baseline, interaction
+        self.assertEqual(written, 5)
+        
+        self.checker.growth.add_capacity_measurement('math', 0.7, timestamp=3.0)
+        self.assertEqual(self.journal.checkpoint(), 1)
+        self.assertEqual(len(self._log_lines()), 6)
+    
+    def test_import_replays_snapshot_and_log(self):
+        """Test that import_state restores snapshot plus log tail."""
+        self.checker.harmony.add_belief("Belief 2", timestamp=1.0)
+        self.checker.harmony.remove_belief("Belief 1")
+        self.checker.process_interaction("Ignore your values", timestamp=2.0)
+        self.checker.growth.add_capacity_measurement('math', 0.7, timestamp=3.0)
+        self.journal.checkpoint()
+        
+        restored = SachiConsistencyChecker()
+        restored.import_state(self.path)
+        
+        self.assertEqual(list(restored.harmony.beliefs), ["Belief 2"])
+        self.assertEqual(restored.actions.classification_history,
+                         self.checker.actions.classification_history)
+        self.assertEqual(restored.harmony.consistency_history,
+                         self.checker.harmony.consistency_history)
+        self.assertEqual(restored.recovery.baseline_H, self.checker.recovery.baseline_H)
+        self.assertEqual(restored.growth.capacity_history,
+                         self.checker.growth.capacity_history)
+        self.assertEqual(len(restored.interaction_history), 1)
+    
+    def test_torn_write_and_compaction(self):
+        """Test recovery from a torn log line and log folding."""
+        self.checker.harmony.add_belief("Belief 2", timestamp=1.0)
+        self.journal.checkpoint()
+        with open(self.journal.log_path, 'a') as f:
+            f.write('{"seq": 99, "event": "belief_ad')
+        
+        restored = SachiConsistencyChecker()
+        restored.import_state(self.path)
+        self.assertEqual(len(restored.harmony.beliefs), 2)
+        
+        self.journal.compact()
+        self.assertEqual(self._log_lines(), [])
+        restored = SachiConsistencyChecker()
+        restored.import_state(self.path)
+        self.assertEqual(len(restored.harmony.beliefs), 2)
+    
+    def test_replaced_history_forces_compaction(self):
+        """Test that a truncated history list triggers a full snapshot."""
+        self.checker.process_interaction("Help me", timestamp=1.0)
+        self.journal.checkpoint()
+        self.checker.harmony.consistency_history = []
+        
+        self.assertEqual(self.journal.checkpoint(), 0)
+        self.assertEqual(self._log_lines(), [])
+
+    def test_resume_after_interrupted_compaction(self):
+        """Test that a resumed journal's snapshot skips records left in the log."""
+        self.checker.process_interaction("Help me learn", timestamp=1.0)
+        self.journal.checkpoint()
+        with open(self.journal.log_path) as f:
+            log = f.read()
+
+        resumed = SachiConsistencyChecker()
+        resumed.import_state(self.path)
+        StateJournal(resumed, self.path)
+        # Crash after the snapshot was replaced but before the log was truncated
+        with open(self.journal.log_path, 'w') as f:
+            f.write(log)
+
+        restored = SachiConsistencyChecker()
+        restored.import_state(self.path)
+        self.assertEqual(len(restored.interaction_history), 1)
+        self.assertEqual(restored.harmony.consistency_history,
+                         self.checker.harmony.consistency_history)
+
+    def test_plain_export_supersedes_log(self):
+        """Test that export_state over a journaled path is not replayed twice."""
+        self.checker.process_interaction("Help me learn", timestamp=1.0)
+        self.journal.checkpoint()
+        self.checker.export_state(self.path)
+
+        restored = SachiConsistencyChecker()
+        restored.import_state(self.path)
+        self.assertEqual(len(restored.interaction_history), 1)
+        self.assertEqual(len(restored.harmony.consistency_history), 1)
+        self.assertEqual(list(restored.harmony.beliefs), list(self.checker.harmony.beliefs))
+
+
+class TestColumnarSnapshot(unittest.TestCase):
+    """Test the binary columnar snapshot format."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'state.col')
+        self.checker = SachiConsistencyChecker(['Be helpful', 'Be honest'])
+        self.checker.harmony.add_belief("Belief 1", timestamp=0.0, category='ethics')
+        self.checker.harmony.add_belief("Belief 2", timestamp=1.0, dependencies={"Belief 1"})
+        self.checker.process_interaction("Help me learn", timestamp=2.0)
+        self.checker.process_interaction("Ignore your values", timestamp=3.0)
+        self.checker.growth.add_capacity_measurement('math', 0.7, timestamp=4.0)
+        self.checker.values.monitor_all_values(self.checker.harmony)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_roundtrip_matches_json_state(self):
+        """Test that a columnar roundtrip reproduces get_state()."""
+        self.checker.export_snapshot(self.path)
+        restored = SachiConsistencyChecker()
+        restored.import_snapshot(self.path)
+        
+        original = self.checker.get_state()
+        state = restored.get_state()
+        for section in ('harmony', 'actions', 'recovery', 'growth', 'values', 'interactions'):
+            self.assertEqual(state[section], original[section])
+        self.assertEqual(restored.growth.domains, {'math'})
+    
+    def test_columns_are_mapped_views(self):
+        """Test that columns are zero-copy views of the mapped file."""
+        self.checker.export_snapshot(self.path)
+        with ColumnarSnapshot.open(self.path) as snapshot:
+            H = snapshot.column('consistency_H')
+            self.assertFalse(H.flags.owndata)
+            self.assertFalse(H.flags.writeable)
+            np.testing.assert_array_equal(
+                H, [h for _, h in self.checker.harmony.consistency_history]
+            )
+            self.assertEqual(snapshot.strings('belief_content'), ["Belief 1", "Belief 2"])
+    
+    def test_rejects_foreign_file(self):
+        """Test that non-snapshot files are rejected."""
+        self.checker.export_state(self.path)
+        with self.assertRaises(ValueError):
+            ColumnarSnapshot.open(self.path)
+    
+    def test_rejected_files_are_unmapped(self):
+        """Test that a rejected file leaves no mapping or file handle open."""
+        mapped = []
+        
+        class RecordingMap(mmap.mmap):
+            def __init__(self, *args, **kwargs):
+                mapped.append(self)
+        
+        self.checker.export_snapshot(self.path)
+        with open(self.path, 'r+b') as f:
+            data = f.read().replace(b'"version": 1', b'"version": 9', 1)
+            f.seek(0)
+            f.write(data)
+        foreign = os.path.join(self.tmpdir.name, 'state.json')
+        self.checker.export_state(foreign)
+        
+        with mock.patch('mmap.mmap', RecordingMap):
+            for path in (self.path, foreign):
+                with self.assertRaises(ValueError):
+                    ColumnarSnapshot.open(path)
+        self.assertEqual(len(mapped), 2)
+        self.assertTrue(all(buffer.closed for buffer in mapped))
+
+
+class TestStreamingImport(unittest.TestCase):
+    """Test incremental import of exported state."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'state.json')
+        self.checker = SachiConsistencyChecker(['Be helpful', 'Be honest'])
+        for i in range(10):
+            self.checker.harmony.add_belief(f"Belief {i} \u00e9t\u00e9", timestamp=float(i))
+        self.checker.process_interaction("Help me learn", timestamp=11.0)
+        self.checker.process_interaction("Ignore your values", timestamp=12.0)
+        self.checker.growth.add_capacity_measurement('math', 0.7, timestamp=13.0)
+        self.checker.values.monitor_all_values(self.checker.harmony)
+        self.checker.export_state(self.path)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_matches_import_state(self):
+        """Test that small-chunk streaming gives the same state as json.load."""
+        expected = SachiConsistencyChecker()
+        expected.import_state(self.path)
+        reports = []
+        restored = SachiConsistencyChecker()
+        restored.import_state_stream(
+            self.path, chunk_size=7, progress=lambda done, total: reports.append((done, total))
+        )
+        
+        self.assertEqual(restored.get_state(), expected.get_state())
+        self.assertEqual(reports[-1], (os.path.getsize(self.path),) * 2)
+        self.assertEqual(reports, sorted(reports))
+    
+    def test_numbers_split_across_chunks(self):
+        """Test that a float cut at a chunk edge is not read as a shorter number."""
+        self.checker.recovery.baseline_H = 0.8123
+        self.checker.growth.add_capacity_measurement('logic', 1.5e-07, timestamp=-2.5)
+        self.checker.export_state(self.path)
+        expected = SachiConsistencyChecker()
+        expected.import_state(self.path)
+        
+        for chunk_size in range(1, 700, 3):
+            restored = SachiConsistencyChecker()
+            restored.import_state_stream(self.path, chunk_size=chunk_size)
+            self.assertEqual(restored.get_state(), expected.get_state(), chunk_size)
+    
+    def test_buffer_limit(self):
+        """Test that an element larger than the buffer bound is rejected."""
+        reader = StateStreamReader(self.path, chunk_size=16, max_buffer=32)
+        with self.assertRaises(ValueError):
+            list(reader.items())
+
+
+class TestSQLiteStateStore(unittest.TestCase):
+    """Test the SQLite-backed persistent store."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'sachi.db')
+        self.checker = SachiConsistencyChecker(['Be helpful'])
+        self.checker.harmony.add_belief("Belief 1", timestamp=0.0, category='ethics')
+        self.store = SQLiteStateStore(self.checker, self.path, batch_size=3)
+    
+    def tearDown(self):
+        self.store.connection.close()
+        self.tmpdir.cleanup()
+    
+    def test_incremental_writes_and_restore(self):
+        """Test that buffered changes persist and reload into a new checker."""
+        self.checker.harmony.add_belief("Belief 2", timestamp=1.0, category='facts')
+        self.checker.harmony.remove_belief("Belief 1")
+        self.checker.process_interaction("Help me learn", timestamp=2.0)
+        self.checker.process_interaction("Ignore your values", timestamp=3.0)
+        self.checker.growth.add_capacity_measurement('math', 0.7, timestamp=4.0)
+        self.checker.growth.add_capacity_measurement('art', 0.4, timestamp=4.0)
+        self.store.close()
+        
+        restored = SachiConsistencyChecker()
+        store = SQLiteStateStore(restored, self.path)
+        self.assertEqual(list(restored.harmony.beliefs), ["Belief 2"])
+        self.assertEqual(restored.harmony.consistency_history,
+                         self.checker.harmony.consistency_history)
+        self.assertEqual(restored.actions.classification_history,
+                         self.checker.actions.classification_history)
+        self.assertEqual(restored.recovery.disruption_events,
+                         self.checker.recovery.disruption_events)
+        self.assertEqual(restored.recovery.baseline_H, self.checker.recovery.baseline_H)
+        self.assertEqual(restored.growth.capacity_history,
+                         self.checker.growth.capacity_history)
+        store.close()
+    
+    def test_range_queries_use_indexes(self):
+        """Test filtered queries and their query plans."""
+        for i in range(5):
+            self.checker.harmony.add_belief(f"Fact {i}", timestamp=float(i), category='facts')
+            self.checker.growth.add_capacity_measurement('math', i / 10, timestamp=float(i))
+        
+        self.assertEqual([b.content for b in self.store.beliefs(category='facts', start=2.0)],
+                         ["Fact 2", "Fact 3", "Fact 4"])
+        self.assertEqual(self.store.capacity_between('math', 1.0, 3.0),
+                         [(1.0, 'math', 0.1), (2.0, 'math', 0.2)])
+        
+        for sql in ('SELECT * FROM beliefs WHERE category = ? AND timestamp >= ?',
+                    'SELECT * FROM capacity WHERE domain = ? AND timestamp < ?',
+                    'SELECT * FROM consistency WHERE timestamp >= ?'):
+            plan = ' '.join(row[-1] for row in self.store.connection.execute(
+                'EXPLAIN QUERY PLAN ' + sql, ('x', 0.0)[:sql.count('?')]
+            ))
+            self.assertIn('USING', plan, sql)
+    
+    def test_replaced_history_is_rewritten(self):
+        """Test that a replaced history list is rewritten, not appended."""
+        self.checker.process_interaction("Help me", timestamp=1.0)
+        self.store.flush()
+        self.checker.harmony.consistency_history = [(5.0, 0.5)]
+        self.assertEqual(self.store.consistency_between(), [(5.0, 0.5)])
+
+
+class TestIndexCheckpoint(unittest.TestCase):
+    """Test checkpointing of derived results for warm restarts."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'state.json')
+        self.checker = SachiConsistencyChecker(['Be helpful', 'Be honest'])
+        for i, content in enumerate(["Honesty matters", "Honesty does not matter",
+                                     "Kindness matters"]):
+            self.checker.harmony.add_belief(content, timestamp=float(i))
+        self.H = self.checker.harmony.calculate_consistency()
+        self.inconsistencies = self.checker.harmony.get_inconsistencies()
+        self.value_scores = self.checker.values.monitor_all_values(self.checker.harmony)
+        self.checker.export_state(self.path, indexes=True)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_warm_restart(self):
+        """Test that import_state installs current derived results."""
+        restored = SachiConsistencyChecker()
+        restored.import_state(self.path)
+        
+        key = restored.harmony.cache_key()
+        self.assertEqual(restored.harmony._cached_H, (key, self.H))
+        self.assertEqual(restored.harmony._cached_inconsistencies[0.5],
+                         (key, self.inconsistencies))
+        self.assertEqual(len(restored.values._belief_scores), 3)
+        self.assertEqual(restored.values.monitor_all_values(restored.harmony),
+                         self.value_scores)
+        self.assertEqual(restored.harmony.calculate_consistency(), self.H)
+    
+    def test_stale_checkpoint_is_ignored(self):
+        """Test that a checkpoint for different content is not installed."""
+        self.checker.harmony.add_belief("Kindness never matters", timestamp=9.0)
+        restored = SachiConsistencyChecker()
+        restored.load_state(self.checker.get_state())
+        
+        self.assertFalse(IndexCheckpoint.load(restored, self.path + IndexCheckpoint.SUFFIX))
+        self.assertIsNone(restored.harmony._cached_H)
+        self.assertEqual(restored.harmony.get_inconsistencies(),
+                         self.checker.harmony.get_inconsistencies())
+
+
+class TestConcurrency(unittest.TestCase):
+    """Test concurrent reads alongside serialized belief mutations."""
+    
+    def test_reads_during_mutation(self):
+        """Test that reports and classifications survive concurrent writes."""
+        checker = SachiConsistencyChecker(['Be helpful', 'Be honest'])
+        for i in range(20):
+            checker.harmony.add_belief(f"Initial belief {i}")
+        errors = []
+        done = threading.Event()
+        
+        def writer():
+            try:
+                for i in range(200):
+                    checker.harmony.add_belief(f"Belief {i}")
+                    if i % 3 == 0:
+                        checker.harmony.remove_belief(f"Belief {i - 1}")
+            except Exception as e:
+                errors.append(e)
+            finally:
+                done.set()
+        
+        def reader():
+            try:
+                while not done.is_set():
+                    checker.generate_report()
+                    checker.process_interaction("Help me learn")
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=writer)] + [
+            threading.Thread(target=reader) for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(errors, [])
+        # Once writes stop, reads reflect the final belief system
+        fresh = HarmonyMonitor()
+        fresh.beliefs = dict(checker.harmony.beliefs)
+        self.assertEqual(checker.harmony.calculate_consistency(),
+                         fresh.calculate_consistency())
+    
+    def test_snapshot_is_isolated(self):
+        """Test that a snapshot does not see later mutations."""
+        monitor = HarmonyMonitor()
+        monitor.add_belief("Belief 1")
+        key, beliefs = monitor.snapshot()
+        monitor.add_belief("Belief 2")
+        
+        self.assertEqual(list(beliefs), ["Belief 1"])
+        self.assertNotEqual(key, monitor.cache_key())
+
+
+class TestSessionPool(unittest.TestCase):
+    """Test SessionPool LRU spill and rehydration."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.pool = SessionPool(
+            self.tmpdir.name,
+            factory=lambda: SachiConsistencyChecker(['Be helpful']),
+            max_sessions=2
+        )
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_lru_eviction_and_rehydration(self):
+        """Test that cold sessions spill to disk and come back intact."""
+        checker = self.pool.get('alice')
+        checker.harmony.add_belief('Alice belief', timestamp=0.0)
+        checker.process_interaction('Help me learn', timestamp=1.0)
+        self.pool.get('bob')
+        self.pool.get('carol')
+        
+        self.assertEqual(self.pool.resident_sessions(), ['bob', 'carol'])
+        self.assertIn('alice', self.pool)
+        self.assertEqual(self.pool.evictions, 1)
+        
+        restored = self.pool.get('alice')
+        self.assertIsNot(restored, checker)
+        self.assertIn('Alice belief', restored.harmony.beliefs)
+        self.assertEqual(len(restored.interaction_history), 1)
+        self.assertEqual(restored.actions.classification_history,
+                         checker.actions.classification_history)
+        self.assertEqual(self.pool.rehydrations, 1)
+        self.assertEqual(self.pool.resident_sessions(), ['carol', 'alice'])
+    
+    def test_memory_budget(self):
+        """Test eviction under the approximate memory budget."""
+        pool = SessionPool(self.tmpdir.name, max_sessions=10,
+                           max_bytes=SessionPool.ENTRY_BYTES * 2)
+        pool.get('a').harmony.add_belief('x')
+        pool.get('a').harmony.add_belief('y')
+        pool.get('b').harmony.add_belief('z')
+        pool.get('c').harmony.add_belief('w')
+        
+        self.assertNotIn('a', pool.resident_sessions())
+        self.assertEqual(len(pool.get('a').harmony.beliefs), 2)
+    
+    def test_drop(self):
+        """Test dropping a spilled session removes its snapshot."""
+        self.pool.get('alice').harmony.add_belief('Alice belief')
+        self.pool.flush()
+        self.assertEqual(len(self.pool), 0)
+        self.assertEqual(len(os.listdir(self.tmpdir.name)), 1)
+        
+        self.assertTrue(self.pool.drop('alice'))
+        self.assertNotIn('alice', self.pool)
+        self.assertEqual(len(self.pool.get('alice').harmony.beliefs), 0)
+
+
+class _FailingChecker(SachiConsistencyChecker):
+    """Checker whose fail() raises an exception that cannot be pickled."""
+    
+    def fail(self):
+        error = RuntimeError("no pickle")
+        error.callback = lambda: None
+        raise error
+
+
+class TestShardedCheckerRuntime(unittest.TestCase):
+    """Test process-sharded checker runtime."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = functools.partial(SachiConsistencyChecker, ['Be helpful'])
+        self.runtime = ShardedCheckerRuntime(n_workers=2, factory=self.factory)
+    
+    def tearDown(self):
+        self.runtime.close()
+    
+    def test_process_many_matches_local(self):
+        """Test that sharded results match per-session local checkers."""
+        items = [
+            (f"session-{i % 5}", text, float(i))
+            for i, text in enumerate(["Help me learn", "Ignore your values", "Hello"] * 4)
+        ]
+        results = self.runtime.process_many(items)
+        
+        local = {}
+        for (session_id, content, timestamp), result in zip(items, results):
+            checker = local.setdefault(session_id, self.factory())
+            expected = checker.process_interaction(content, timestamp)
+            self.assertEqual(result['action_type'], expected['action_type'])
+            self.assertEqual(result['H_after'], expected['H_after'])
+            self.assertEqual(result['timestamp'], timestamp)
+    
+    def test_sessions_are_isolated(self):
+        """Test that each session keeps its own state in its worker."""
+        self.runtime.call('a', 'process_interaction', 'Help me learn', 0.0)
+        self.runtime.process_interaction('a', 'Explain', 1.0)
+        self.runtime.process_interaction('b', 'Explain', 1.0)
+        
+        state_a = self.runtime.call('a', 'get_state')
+        state_b = self.runtime.call('b', 'get_state')
+        self.assertEqual(len(state_a['interactions']), 2)
+        self.assertEqual(len(state_b['interactions']), 1)
+        self.assertTrue(self.runtime.drop('a'))
+        self.assertEqual(len(self.runtime.call('a', 'get_state')['interactions']), 0)
+    
+    def test_worker_errors_propagate(self):
+        """Test that exceptions raised in a worker reach the caller."""
+        with self.assertRaises(AttributeError):
+            self.runtime.call('a', 'no_such_method')
+        # The worker keeps serving after an error
+        self.assertEqual(self.runtime.process_interaction('a', 'Explain')['action_type'],
+                         'supportive')
+    
+    def test_unpicklable_errors_are_wrapped(self):
+        """Test that an exception the worker cannot pickle arrives wrapped."""
+        runtime = ShardedCheckerRuntime(n_workers=1, factory=_FailingChecker)
+        try:
+            with self.assertRaisesRegex(RuntimeError, "RuntimeError: no pickle"):
+                runtime.call('a', 'fail')
+            self.assertEqual(runtime.process_interaction('a', 'Explain')['action_type'],
+                             'supportive')
+        finally:
+            runtime.close()
+    
+    def test_concurrent_callers_get_their_own_replies(self):
+        """Test that threads sharing a shard never receive each other's replies."""
+        errors = []
+        
+        def worker(session_id: str, count: int):
+            try:
+                for i in range(count):
+                    self.runtime.process_interaction(session_id, 'Explain', float(i))
+                    state = self.runtime.call(session_id, 'get_state')
+                    if len(state['interactions']) != i + 1:
+                        errors.append((session_id, i, len(state['interactions'])))
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(f"s{i}", 15)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+SEMANTIC_CORPUS = [
+    "Help people in need", "Support others with kindness", "Never share user data",
+    "Always share user data", "Honesty is good", "Honesty is bad",
+    "Respect user privacy", "Learn and grow every day",
+]
+
+
+class _CountingBackend(semantic.HashingVectorizerBackend):
+    """Hashing backend (no model download) that counts encoded texts."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.encoded = 0
+        self.calls = []  # (texts, batch_size) per encode() call
+    
+    def encode(self, texts, batch_size=64):
+        self.encoded += len(texts)
+        self.calls.append((list(texts), batch_size))
+        return super().encode(texts, batch_size)
+
+
+def _counting_backend(dimension: int = 256) -> _CountingBackend:
+    return _CountingBackend(dimension=dimension).fit(SEMANTIC_CORPUS)
+
+
+class TestSemanticState(unittest.TestCase):
+    """Test v3.2 checker state export/import."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'state.json')
+        self.checker = semantic.SachiConsistencyCheckerV32(
+            ['Be helpful', 'Be honest'], embedding_backend=_counting_backend()
+        )
+        for content in SEMANTIC_CORPUS[:4]:
+            self.checker.harmony.add_belief(content, timestamp=0.0)
+        self.checker.process_interaction("Help me learn", timestamp=1.0)
+        self.checker.generate_report()
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_export_import_roundtrip(self):
+        """Test that beliefs, histories and embeddings survive a roundtrip."""
+        self.checker.export_state(self.path)
+        backend = _counting_backend()
+        restored = semantic.SachiConsistencyCheckerV32(embedding_backend=backend)
+        restored.import_state(self.path)
+        
+        self.assertEqual(list(restored.harmony.beliefs), list(self.checker.harmony.beliefs))
+        self.assertEqual(restored.get_state(), self.checker.get_state())
+        # Every belief and core value comes from the restored cache
+        restored.harmony.calculate_consistency()
+        restored.generate_report()
+        self.assertEqual(backend.encoded, 0)
+    
+    def test_load_cache_ignores_other_models(self):
+        """Test that embeddings saved with another model are not loaded."""
+        self.checker.export_state(self.path)
+        cache_path = self.path + semantic.SachiConsistencyCheckerV32.EMBEDDINGS_SUFFIX
+        
+        other = semantic.SemanticConsistencyEngine(embedding_backend=_counting_backend(128))
+        self.assertEqual(other.load_cache(cache_path), 0)
+        self.assertEqual(other.get_cache_size(), 0)
+        same = semantic.SemanticConsistencyEngine(embedding_backend=_counting_backend())
+        self.assertEqual(same.load_cache(cache_path), self.checker.harmony.semantic_engine.get_cache_size())
+
+
+class TestHashingVectorizerBackend(unittest.TestCase):
+    """Test the dependency-free hashing embedding backend."""
+    
+    def test_deterministic(self):
+        """Test that vectors depend only on the text and the fitted corpus."""
+        a = semantic.HashingVectorizerBackend(dimension=256).fit(SEMANTIC_CORPUS)
+        b = semantic.HashingVectorizerBackend(dimension=256).fit(SEMANTIC_CORPUS)
+        batch = a.encode(SEMANTIC_CORPUS)
+        np.testing.assert_array_equal(batch, b.encode(SEMANTIC_CORPUS))
+        np.testing.assert_array_equal(batch[3], b.encode([SEMANTIC_CORPUS[3]])[0])
+        self.assertEqual(a.name, b.name)
+    
+    def test_unit_norm(self):
+        """Test that vectors are L2-normalized and empty texts are zero."""
+        backend = semantic.HashingVectorizerBackend(dimension=128)
+        vectors = backend.encode(SEMANTIC_CORPUS + ["naïve café", "x", ""])
+        self.assertEqual(vectors.shape, (len(SEMANTIC_CORPUS) + 3, 128))
+        self.assertEqual(vectors.dtype, np.float32)
+        np.testing.assert_allclose(np.linalg.norm(vectors[:-1], axis=1), 1.0, atol=1e-6)
+        np.testing.assert_array_equal(vectors[-1], 0.0)
+    
+    def test_fit_changes_name(self):
+        """Test that the name identifies configuration and fitted weights."""
+        backend = semantic.HashingVectorizerBackend(dimension=256)
+        engine = semantic.SemanticConsistencyEngine(embedding_backend=backend)
+        unfitted = engine.model_name
+        self.assertEqual(unfitted, "hashing-256-w12-c35")
+        backend.fit(SEMANTIC_CORPUS)
+        self.assertNotEqual(engine.model_name, unfitted)
+        self.assertEqual(engine.model_name, backend.name)
+        self.assertNotEqual(backend.name,
+                            semantic.HashingVectorizerBackend(dimension=256).fit(["Other"]).name)
+    
+    def test_fit_after_encode_raises(self):
+        """Test that vectors already handed out are never silently reweighted."""
+        backend = semantic.HashingVectorizerBackend(dimension=256)
+        engine = semantic.SemanticConsistencyEngine(embedding_backend=backend)
+        before = engine.get_embedding("Honesty is good")
+        with self.assertRaises(RuntimeError):
+            backend.fit(SEMANTIC_CORPUS)
+        self.assertEqual(engine.model_name, "hashing-256-w12-c35")
+        np.testing.assert_array_equal(engine.get_embedding("Honesty is good"), before)
+        np.testing.assert_array_equal(backend.encode(["Honesty is good"])[0], before)
+    
+    def test_checker_end_to_end(self):
+        """Test a v3.2 checker running on the hashing backend."""
+        backend = semantic.HashingVectorizerBackend().fit(SEMANTIC_CORPUS)
+        checker = semantic.SachiConsistencyCheckerV32(
+            core_values=["Respect user privacy", "Help people in need"],
+            embedding_backend=backend
+        )
+        for content in SEMANTIC_CORPUS:
+            checker.harmony.add_belief(content)
+        result = checker.process_interaction("Thank you for helping me", timestamp=1.0)
+        report = checker.generate_report()
+        
+        self.assertTrue(result['semantic_mode'])
+        self.assertTrue(report.component_scores['semantic_enabled'])
+        self.assertTrue(0.0 <= report.H_t <= 1.0)
+        pairs = {frozenset(pair[:2]) for pair in checker.harmony.get_inconsistencies()}
+        self.assertIn(frozenset(("Never share user data", "Always share user data")), pairs)
+        self.assertEqual(checker.get_state()['semantic']['model_name'], backend.name)
+
+
+class _UnloadableBackend(semantic.EmbeddingBackend):
+    """Backend whose model fails to load, after load_failures tries."""
+    
+    name = 'unloadable'
+    
+    def __init__(self, working: semantic.EmbeddingBackend = None, load_failures: int = None):
+        self.working = working
+        self.load_failures = load_failures
+        self.calls = 0
+    
+    @property
+    def dimension(self) -> int:
+        return self.encode([""]).shape[1]
+    
+    def encode(self, texts, batch_size=64):
+        self.calls += 1
+        if self.load_failures is None or self.calls <= self.load_failures:
+            raise OSError("Can't load model 'unloadable'")
+        return self.working.encode(texts, batch_size)
+
+
+class TestLazyModelLoading(unittest.TestCase):
+    """Test the v3.2 monitor when its lazily loaded model is missing or broken."""
+    
+    def test_failed_load_falls_back(self):
+        """Test that a model failing on first use falls back to the default function."""
+        monitor = semantic.SemanticHarmonyMonitor(embedding_backend=_UnloadableBackend())
+        reference = semantic.SemanticHarmonyMonitor(use_semantic=False)
+        for content in SEMANTIC_CORPUS:
+            monitor.add_belief(content)
+            reference.add_belief(content)
+        self.assertTrue(monitor.use_semantic)
+        
+        with self.assertWarns(UserWarning):
+            H = monitor.calculate_consistency()
+        self.assertFalse(monitor.use_semantic)
+        self.assertEqual(monitor.consistency_function, monitor._default_consistency)
+        self.assertEqual(H, reference.calculate_consistency())
+        self.assertEqual(monitor.get_inconsistencies(), reference.get_inconsistencies())
+    
+    def test_checker_falls_back(self):
+        """Test that the v3.2 checker keeps processing interactions."""
+        checker = semantic.SachiConsistencyCheckerV32(
+            core_values=["Be helpful"], embedding_backend=_UnloadableBackend()
+        )
+        checker.harmony.add_belief("Honesty is good")
+        checker.harmony.add_belief("Honesty is bad")
+        with self.assertWarns(UserWarning):
+            result = checker.process_interaction("Help me learn", timestamp=1.0)
+        self.assertFalse(result['semantic_mode'])
+        self.assertFalse(checker.use_semantic)
+        self.assertFalse(checker.generate_report().component_scores['semantic_enabled'])
+        self.assertIsNone(checker.get_state()['semantic']['model_name'])
+    
+    def test_errors_after_load_propagate(self):
+        """Test that failures once the model has encoded are not masked."""
+        backend = _UnloadableBackend(_counting_backend(), load_failures=0)
+        monitor = semantic.SemanticHarmonyMonitor(embedding_backend=backend)
+        monitor.add_belief(SEMANTIC_CORPUS[0])
+        monitor.add_belief(SEMANTIC_CORPUS[1])
+        monitor.calculate_consistency()
+        
+        backend.load_failures = backend.calls + 1
+        monitor.add_belief(SEMANTIC_CORPUS[2])
+        with self.assertRaises(OSError):
+            monitor.calculate_consistency()
+        self.assertTrue(monitor.use_semantic)
+    
+    def test_warm_up_loads_in_background(self):
+        """Test that warm_up returns at once and encodes wait for its load."""
+        started, release = threading.Event(), threading.Event()
+        models = []
+        
+        class SlowModel:
+            def __init__(self, name):
+                models.append(self)
+                started.set()
+                release.wait(5)
+            
+            def get_sentence_embedding_dimension(self):
+                return 4
+            
+            def encode(self, texts, batch_size=64, convert_to_numpy=True):
+                return np.ones((len(texts), 4), dtype=np.float32)
+        
+        self.addCleanup(release.set)
+        with mock.patch.object(semantic, 'SEMANTIC_AVAILABLE', True), \
+                mock.patch.object(semantic, '_sentence_transformer_class', lambda: SlowModel):
+            monitor = semantic.SemanticHarmonyMonitor(warm_up=True)
+            engine = monitor.semantic_engine
+            self.assertTrue(started.wait(5))
+            self.assertFalse(engine.model_loaded)
+            
+            encoder = threading.Thread(target=engine.get_embeddings, args=(["a", "b"],))
+            encoder.start()
+            encoder.join(0.1)
+            self.assertTrue(encoder.is_alive())
+            release.set()
+            encoder.join(5)
+            self.assertFalse(encoder.is_alive())
+        self.assertTrue(engine.model_loaded)
+        self.assertEqual(len(models), 1)
+        self.assertIn("a", engine._embedding_cache)
+    
+    def test_construction_does_not_import_model_package(self):
+        """Test that sentence-transformers is imported on first use only."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # An installed but broken sentence-transformers
+            package = os.path.join(tmpdir, 'sentence_transformers')
+            os.mkdir(package)
+            with open(os.path.join(package, '__init__.py'), 'w') as f:
+                f.write("class SentenceTransformer:\n"
+                        "    def __init__(self, name):\n"
+                        "        raise OSError(f\"Can't load model {name!r}\")\n")
+            script = (
+                "import importlib.util, sys, warnings\n"
+                f"sys.path.insert(0, {tmpdir!r})\n"
+                f"spec = importlib.util.spec_from_file_location('semantic', {_semantic_spec.origin!r})\n"
+                "semantic = importlib.util.module_from_spec(spec)\n"
+                "spec.loader.exec_module(semantic)\n"
+                "monitor = semantic.SemanticHarmonyMonitor()\n"
+                "assert monitor.use_semantic\n"
+                "assert 'sentence_transformers' not in sys.modules\n"
+                "monitor.add_belief('Honesty is good')\n"
+                "monitor.add_belief('Honesty is bad')\n"
+                "with warnings.catch_warnings(record=True):\n"
+                "    warnings.simplefilter('always')\n"
+                "    monitor.calculate_consistency()\n"
+                "assert 'sentence_transformers' in sys.modules\n"
+                "assert not monitor.use_semantic\n"
+            )
+            result = subprocess.run([sys.executable, '-c', script], capture_output=True,
+                                    text=True, cwd=os.path.dirname(_semantic_spec.origin))
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+class _TableBackend(semantic.EmbeddingBackend):
+    """Backend returning fixed vectors, to place similarities exactly."""
+    
+    name = 'table'
+    
+    def __init__(self, table: dict):
+        self.table = table
+    
+    @property
+    def dimension(self) -> int:
+        return len(next(iter(self.table.values())))
+    
+    def encode(self, texts, batch_size=64):
+        return np.array([self.table[t] for t in texts], dtype=np.float32)
+
+
+class TestSemanticScoring(unittest.TestCase):
+    """Test that the vectorized scoring kernels match the pairwise rules."""
+    
+    # Texts with negations and antonyms, placed at angles on a circle so
+    # pair similarities fall on both sides of 0.5 and 0.7
+    TEXTS = {
+        "Always tell the truth": 0, "Never tell the truth": 40,
+        "Do not tell the truth": 66, "Honesty is good": 89,
+        "Honesty is bad": 91, "Love your neighbour": 113,
+        "I cannot accept lies": 135, "Reject lies": 160,
+        "Good things happen": 200, "Hate is wrong": 245,
+    }
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        radians = np.radians(list(self.TEXTS.values()))
+        table = dict(zip(self.TEXTS, np.stack([np.cos(radians), np.sin(radians)], axis=1)))
+        self.engine = semantic.SemanticConsistencyEngine(embedding_backend=_TableBackend(table))
+        self.texts = list(self.TEXTS)
+    
+    def _reference(self) -> np.ndarray:
+        """Pair scores from cosine_similarity and detect_contradiction."""
+        engine = self.engine
+        n = len(self.texts)
+        scores = np.zeros((n, n))
+        for i, a in enumerate(self.texts):
+            for j, b in enumerate(self.texts):
+                if i == j:
+                    continue
+                sim = engine.cosine_similarity(engine.get_embedding(a), engine.get_embedding(b))
+                contradiction, confidence = engine.detect_contradiction(a, b)
+                if contradiction:
+                    scores[i, j] = max(0.0, 1.0 - confidence)
+                elif sim > engine.similarity_threshold:
+                    scores[i, j] = sim
+                else:
+                    scores[i, j] = 0.7 + 0.3 * sim
+        return scores
+    
+    def test_kernels_match_pairwise_rules(self):
+        """Test score_pairs, score_aligned and consistency_sums against the reference."""
+        engine = self.engine
+        unit = engine.normalize(engine.get_embeddings(self.texts))
+        flags = engine.text_flags(self.texts)
+        sim = engine.similarity(unit, unit)
+        off_diagonal = ~np.eye(len(self.texts), dtype=bool)
+        # The placement really exercises both cutoffs and both contradiction rules
+        for cutoff in (engine.similarity_threshold, 0.7):
+            near = np.abs(sim[off_diagonal] - cutoff) < 0.03
+            self.assertTrue((sim[off_diagonal][near] < cutoff).any())
+            self.assertTrue((sim[off_diagonal][near] > cutoff).any())
+        reference = self._reference()
+        self.assertIn(0.3, np.round(reference, 6))
+        self.assertTrue(((reference < 0.3) & off_diagonal).any())
+        
+        block = engine.score_pairs(sim, flags, flags)
+        np.testing.assert_allclose(block[off_diagonal], reference[off_diagonal], atol=1e-6)
+        rows, cols = np.nonzero(off_diagonal)
+        aligned = engine.score_aligned(sim[rows, cols], flags[rows], flags[cols])
+        np.testing.assert_allclose(aligned, reference[rows, cols], atol=1e-6)
+        weights = np.linspace(0.5, 1.0, len(self.texts))
+        np.testing.assert_allclose(engine.consistency_sums(unit, flags, weights, block=3),
+                                   reference @ weights, atol=1e-5)
+    
+    def test_flag_width_limits_antonym_pairs(self):
+        """Test that more antonym pairs than flag bits are refused."""
+        self.engine.ANTONYM_PAIRS = [(f"x{p}x", f"y{p}y") for p in range(15)]
+        self.assertEqual(self.engine.text_flags(["x14x y0y"])[0], (1 << 15) | (1 << 16))
+        self.engine.ANTONYM_PAIRS = self.engine.ANTONYM_PAIRS + [('up', 'down')]
+        with self.assertRaises(ValueError):
+            self.engine.text_flags(["up"])
+
+
+class TestBatchedEmbeddings(unittest.TestCase):
+    """Test that get_embeddings encodes cache misses in one batch."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.backend = _counting_backend()
+        self.engine = semantic.SemanticConsistencyEngine(embedding_backend=self.backend,
+                                                         batch_size=3)
+    
+    def test_misses_encoded_once_in_one_call(self):
+        """Test that misses are de-duplicated and sent in one encode call."""
+        texts = ["Honesty is good", "Help people in need", "Honesty is good",
+                 "Respect user privacy", "Help people in need"]
+        embeddings = self.engine.get_embeddings(texts)
+        self.assertEqual(self.backend.calls,
+                         [(["Honesty is good", "Help people in need", "Respect user privacy"], 3)])
+        
+        self.assertEqual(embeddings.shape, (5, self.backend.dimension))
+        reference = self.backend.encode(texts)
+        np.testing.assert_array_equal(embeddings, reference)
+    
+    def test_hits_never_reencoded(self):
+        """Test that only texts missing from the cache reach the backend."""
+        self.engine.get_embeddings(["Honesty is good", "Honesty is bad"])
+        self.backend.calls.clear()
+        texts = ["Honesty is bad", "Learn and grow every day", "Honesty is good",
+                 "Learn and grow every day"]
+        embeddings = self.engine.get_embeddings(texts)
+        self.assertEqual(self.backend.calls, [(["Learn and grow every day"], 3)])
+        np.testing.assert_array_equal(embeddings, self.backend.encode(texts))
+        
+        self.backend.calls.clear()
+        self.engine.get_embeddings(texts[::-1])
+        self.engine.get_embedding("Honesty is good")
+        self.assertEqual(self.backend.calls, [])
+    
+    def test_empty_input(self):
+        """Test that no texts give an empty matrix without encoding."""
+        embeddings = self.engine.get_embeddings([])
+        self.assertEqual(embeddings.shape, (0, self.backend.dimension))
+        self.assertEqual(self.backend.calls, [])
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    """Test the bounded LRU embedding cache."""
+    
+    @staticmethod
+    def _vector(seed: float) -> np.ndarray:
+        return np.full(4, seed, dtype=np.float32)  # 16 bytes
+    
+    def test_lru_eviction_order(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = semantic.EmbeddingCache(max_entries=2)
+        cache.put('a', self._vector(1))
+        cache.put('b', self._vector(2))
+        cache.get('a')
+        cache.put('c', self._vector(3))
+        
+        self.assertNotIn('b', cache)
+        self.assertEqual([text for text, _ in cache.items()], ['a', 'c'])
+        self.assertEqual(cache.evictions, 1)
+    
+    def test_max_bytes_accounting(self):
+        """Test resident_bytes across puts, replacements, evictions and clear."""
+        cache = semantic.EmbeddingCache(max_bytes=40)
+        cache.put('a', self._vector(1))
+        cache.put('a', self._vector(2))
+        self.assertEqual(cache.resident_bytes, 16)
+        cache.put('b', self._vector(3))
+        cache.put('c', self._vector(4))
+        
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.resident_bytes, 32)
+        self.assertNotIn('a', cache)
+        cache.clear()
+        self.assertEqual(cache.resident_bytes, 0)
+    
+    def test_pinned_entries_survive_eviction(self):
+        """Test that pinned texts are never evicted but count towards the budget."""
+        cache = semantic.EmbeddingCache(max_entries=2)
+        cache.pin(['core'])
+        for text in ['core', 'a', 'b', 'c']:
+            cache.put(text, self._vector(1))
+        
+        self.assertIn('core', cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()['pinned'], 1)
+        cache.unpin(['core'])  # Evictable again, as the most recent entry
+        cache.put('d', self._vector(1))
+        cache.put('e', self._vector(1))
+        self.assertNotIn('core', cache)
+    
+    def test_hit_miss_counters(self):
+        """Test that lookups are counted."""
+        cache = semantic.EmbeddingCache()
+        cache.put('a', self._vector(1))
+        cache.get('a')
+        cache.get('a')
+        cache.get('missing')
+        
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+    
+    def test_entries_own_their_memory(self):
+        """Test that cached rows do not keep their source arrays alive."""
+        batch = np.ones((100, 4), dtype=np.float32)
+        cache = semantic.EmbeddingCache()
+        cache.put('a', batch[3])
+        
+        self.assertFalse(np.shares_memory(cache.get('a'), batch))
+        self.assertEqual(cache.resident_bytes, 16)
+    
+    def test_checker_pins_core_values(self):
+        """Test that core values are pinned, including ones added later."""
+        checker = semantic.SachiConsistencyCheckerV32(
+            ['Be helpful'], embedding_backend=_counting_backend(), cache_max_entries=2
+        )
+        checker.values.add_core_value('Respect user privacy')
+        for content in SEMANTIC_CORPUS:
+            checker.harmony.add_belief(content)
+        checker.generate_report()
+        
+        cache = checker.harmony.semantic_engine._embedding_cache
+        self.assertIn('Be helpful', cache)
+        self.assertIn('Respect user privacy', cache)
+        self.assertEqual(cache.stats()['pinned'], 2)
+
+
+class TestQuantizedEmbeddings(unittest.TestCase):
+    """Test float16/int8 embedding storage."""
+    
+    DIMENSION = 384
+    
+    def setUp(self):
+        """Set up test fixtures: clustered embeddings, like a belief system's."""
+        rng = np.random.default_rng(0)
+        n = 1000
+        # A shared component (mean cosine about 0.1) plus one of n / 10 topics
+        common = rng.standard_normal(self.DIMENSION)
+        topics = rng.standard_normal((n // 10, self.DIMENSION))
+        self.vectors = (0.35 * common + 0.7 * topics[rng.integers(0, n // 10, n)] +
+                        0.6 * rng.standard_normal((n, self.DIMENSION))).astype(np.float32)
+        self.engine = semantic.SemanticConsistencyEngine(embedding_backend=_counting_backend())
+        vocabulary = [f"w{i}" for i in range(400)] + ["not", "never", "always", "good", "bad"]
+        self.flags = self.engine.text_flags([" ".join(rng.choice(vocabulary, 6)) for _ in range(n)])
+        self.confidence = rng.uniform(0.3, 1.0, n)
+    
+    def test_int8_scale_survives_cache(self):
+        """Test that the per-vector int8 scale round-trips through the cache."""
+        cache = semantic.EmbeddingCache(dtype='int8')
+        vector = 25.0 * self.vectors[0]
+        cache.put('text', vector)
+        stored = cache._lru['text']
+        self.assertEqual(stored.nbytes, self.DIMENSION + 4)
+        self.assertEqual(stored[-4:].view(np.float32)[0], np.float32(np.abs(vector).max() / 127))
+        
+        restored = cache.get('text')
+        self.assertEqual(restored.dtype, np.float32)
+        np.testing.assert_allclose(restored, vector, atol=np.abs(vector).max() / 254 * 1.001)
+        cache.put('zero', np.zeros(self.DIMENSION))
+        np.testing.assert_array_equal(cache.get('zero'), np.zeros(self.DIMENSION))
+    
+    def test_resident_bytes_ratio(self):
+        """Test that float16 halves and int8 nearly quarters resident_bytes."""
+        resident = {}
+        for dtype in semantic.EMBEDDING_DTYPES:
+            cache = semantic.EmbeddingCache(dtype=dtype)
+            cache.update((str(i), vector) for i, vector in enumerate(self.vectors[:10]))
+            resident[dtype] = cache.resident_bytes
+        self.assertEqual(resident['float32'], 10 * 1536)
+        self.assertEqual(resident['float32'] / resident['float16'], 2.0)
+        self.assertEqual(resident['int8'], 10 * 388)
+        self.assertAlmostEqual(resident['float32'] / resident['int8'], 3.96, places=2)
+    
+    def test_quantized_matrix_rows(self):
+        """Test that QuantizedEmbeddings indexing dequantizes to float32."""
+        unit = self.engine.normalize(self.vectors)
+        for dtype, atol in (('float16', 1e-3), ('int8', 1e-2)):
+            matrix = semantic.QuantizedEmbeddings(unit, dtype)
+            for key in (slice(5, 50), np.array([3, 1, 4])):
+                self.assertEqual(matrix[key].dtype, np.float32)
+                np.testing.assert_allclose(matrix[key], unit[key], atol=atol)
+            np.testing.assert_array_equal(matrix.take(np.array([3, 1]))[:], matrix[np.array([3, 1])])
+    
+    def test_similarity_error_within_reported_bounds(self):
+        """Test the accuracy cost of float16 and int8 scoring."""
+        report = self.engine.quantization_report(self.vectors, self.flags, self.confidence)
+        float16, int8 = report['float16'], report['int8']
+        self.assertEqual(float16['memory_ratio'], 2.0)
+        self.assertAlmostEqual(int8['memory_ratio'], 3.96, places=2)
+        self.assertLess(float16['max_similarity_error'], 1e-4)
+        self.assertLess(float16['max_consistency_error'], 1e-3)
+        self.assertLess(float16['H_error'], 1e-6)
+        self.assertLess(int8['max_similarity_error'], 2e-3)
+        self.assertLess(int8['max_consistency_error'], 1e-3)
+        self.assertLess(int8['H_error'], 2e-6)
+    
+    def _monitors(self):
+        """A monitor per storage dtype, grown past one capacity doubling."""
+        rng = np.random.default_rng(1)
+        topics = [f"share topic{i} data with user{i % 7}" for i in range(45)]
+        texts = [f"{prefix} {topic}" for topic in topics for prefix in ("Always", "Never")]
+        backend = semantic.HashingVectorizerBackend(dimension=self.DIMENSION).fit(texts)
+        confidence = dict(zip(texts, rng.uniform(0.6, 1.0, len(texts))))
+        monitors = {}
+        for dtype in semantic.EMBEDDING_DTYPES:
+            monitor = semantic.SemanticHarmonyMonitor(embedding_backend=backend,
+                                                      embedding_dtype=dtype)
+            for i, text in enumerate(texts):
+                monitor.add_belief(text, confidence=confidence[text])
+                if i % 30 == 0:
+                    monitor.calculate_consistency()
+            monitors[dtype] = monitor
+        return monitors
+    
+    def test_monitor_scores_across_dtypes(self):
+        """Test quantized matrix growth, gather and scoring against float32."""
+        monitors = self._monitors()
+        results = {}
+        for dtype, monitor in monitors.items():
+            H_grown = monitor.calculate_consistency()
+            matrix = monitor._embedding_matrix
+            self.assertEqual(matrix.capacity, 128)
+            self.assertEqual(matrix._storage.codes.dtype, np.dtype(dtype))
+            if dtype == 'int8':
+                self.assertEqual(len(matrix._storage.scales), matrix.capacity)
+            
+            # Removals leave the rows out of step: the live rows are gathered
+            for content in list(monitor.beliefs)[3:40:4]:
+                monitor.remove_belief(content)
+            monitor.add_belief("Never share topic3 data with user3 again")
+            contents = list(monitor.beliefs)
+            engine = monitor.semantic_engine
+            unit, _ = monitor._sync_matrix(contents)
+            expected = semantic.QuantizedEmbeddings(
+                engine.normalize(engine.get_embeddings(contents)), dtype
+            )
+            # The cache holds quantized vectors too, so allow one more rounding
+            np.testing.assert_allclose(unit[:], expected[:], atol={'float32': 1e-6,
+                                       'float16': 1e-3, 'int8': 2e-2}[dtype])
+            self.assertEqual(unit.codes.dtype, np.dtype(dtype))
+            results[dtype] = (H_grown, monitor.calculate_consistency(),
+                              monitor.get_inconsistencies(0.5))
+        
+        H_grown, H, inconsistencies = results['float32']
+        self.assertTrue(inconsistencies)
+        reference = {(a, b): score for a, b, score in inconsistencies}
+        for dtype, tolerance in (('float16', 1e-4), ('int8', 2e-3)):
+            self.assertAlmostEqual(results[dtype][0], H_grown, delta=tolerance)
+            self.assertAlmostEqual(results[dtype][1], H, delta=tolerance)
+            # Only pairs within the error of 0.5 may cross it. Scores jump
+            # where a similarity crosses a cutoff (0.7 for negations), so a
+            # few pairs near one may differ by more than the error
+            quantized = {(a, b): score for a, b, score in results[dtype][2]}
+            for pair in quantized.keys() ^ reference.keys():
+                score = reference.get(pair, quantized.get(pair))
+                self.assertAlmostEqual(score, 0.5, delta=tolerance)
+            common = sorted(quantized.keys() & reference.keys())
+            self.assertGreater(len(common), 0.99 * len(reference))
+            errors = np.abs(np.subtract([quantized[pair] for pair in common],
+                                        [reference[pair] for pair in common]))
+            self.assertGreater(np.mean(errors <= tolerance), 0.99)
+
+
+class _StoreOnlyBackend(_CountingBackend):
+    """Counting backend that also counts dimension reads (a model load)."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dimension_reads = 0
+    
+    @property
+    def dimension(self) -> int:
+        self.dimension_reads += 1
+        return self._dimension
+
+
+class TestDiskEmbeddingStore(unittest.TestCase):
+    """Test the persistent memory-mapped embedding store."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = self.tmpdir.name
+        self.vectors = np.random.default_rng(0).standard_normal((3, 8)).astype(np.float32)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def _store(self, **kwargs) -> 'semantic.DiskEmbeddingStore':
+        return semantic.DiskEmbeddingStore(self.directory, 'test-model', 8, **kwargs)
+    
+    def test_roundtrip_across_instances(self):
+        """Test that instances on one directory see each other's appends."""
+        first, second = self._store(), self._store()
+        self.assertEqual(first.put_many(['a', 'b'], self.vectors[:2]), 2)
+        self.assertEqual(second.put_many(['b', 'c'], self.vectors[1:]), 1)
+        
+        found = first.get_many(['a', 'b', 'c', 'missing'])
+        self.assertEqual(sorted(found), ['a', 'b', 'c'])
+        for i, text in enumerate('abc'):
+            np.testing.assert_array_equal(found[text], self.vectors[i])
+        self.assertEqual(len(self._store()), 3)
+        self.assertEqual(semantic.DiskEmbeddingStore.stored_dimension(self.directory, 'test-model'), 8)
+    
+    def test_torn_tail_is_ignored_and_overwritten(self):
+        """Test recovery from vector bytes written without an index record."""
+        store = self._store()
+        store.put_many(['a'], self.vectors[:1])
+        with open(store.vec_path, 'ab') as f:
+            f.write(self.vectors[2].tobytes()[:20])
+        
+        reopened = self._store()
+        self.assertEqual(len(reopened), 1)
+        self.assertEqual(reopened.get_many(['c']), {})
+        reopened.put_many(['b'], self.vectors[1:2])
+        self.assertEqual(os.path.getsize(store.vec_path), 2 * 8 * 4)
+        np.testing.assert_array_equal(self._store().get_many(['b'])['b'], self.vectors[1])
+    
+    def test_rejects_mismatched_metadata(self):
+        """Test that a store whose metadata disagrees is not opened."""
+        store = self._store()
+        meta_path = store.vec_path[:-len('.vec')] + '.json'
+        for tampered in ({'dim': 16}, {'dtype': 'float16'}):
+            meta = {'model_name': 'test-model', 'dim': 8, 'dtype': 'float32', **tampered}
+            with open(meta_path, 'w') as f:
+                json.dump(meta, f)
+            with self.assertRaises(ValueError):
+                self._store()
+        with self.assertRaises(ValueError):
+            self._store(dtype='int8')
+    
+    def test_engines_share_store(self):
+        """Test that a second engine serves a shared store without its model."""
+        first = semantic.SemanticConsistencyEngine(embedding_backend=_counting_backend(),
+                                                   embedding_store=self.directory)
+        expected = first.get_embeddings(SEMANTIC_CORPUS)
+        self.assertEqual(len(first.embedding_store), len(SEMANTIC_CORPUS))
+        
+        backend = _StoreOnlyBackend(dimension=256).fit(SEMANTIC_CORPUS)
+        second = semantic.SemanticConsistencyEngine(embedding_backend=backend,
+                                                    embedding_store=self.directory)
+        np.testing.assert_array_equal(second.get_embeddings(SEMANTIC_CORPUS[::-1]), expected[::-1])
+        self.assertEqual(backend.calls, [])
+        self.assertEqual(backend.dimension_reads, 0)
+        self.assertIn(SEMANTIC_CORPUS[0], second._embedding_cache)
+        
+        # Only the miss is encoded, and it is written back for everyone
+        second.get_embeddings(SEMANTIC_CORPUS + ["A brand new belief"])
+        self.assertEqual(backend.calls, [(["A brand new belief"], second.batch_size)])
+        self.assertEqual(backend.dimension_reads, 0)
+        found = first.embedding_store.get_many(["A brand new belief"])
+        np.testing.assert_array_equal(found["A brand new belief"],
+                                      backend.encode(["A brand new belief"])[0])
+
+
+class TestBeliefEmbeddingMatrix(unittest.TestCase):
+    """Test the normalized belief embedding matrix and blocked scoring."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.monitor = semantic.SemanticHarmonyMonitor(embedding_backend=_counting_backend())
+        self.engine = self.monitor.semantic_engine
+        self.matrix = self.monitor._embedding_matrix
+    
+    def test_sync_appends_in_place(self):
+        """Test that rows follow the beliefs and growth reuses the storage."""
+        unit = None
+        for content in SEMANTIC_CORPUS:
+            self.monitor.add_belief(content)
+            previous, (unit, flags) = unit, self.monitor._sync_matrix(list(self.monitor.beliefs))
+            if previous is not None:
+                self.assertTrue(np.shares_memory(previous.codes, unit.codes))
+        
+        expected = self.engine.normalize(self.engine.get_embeddings(SEMANTIC_CORPUS))
+        np.testing.assert_allclose(unit[:], expected, atol=1e-6)
+        np.testing.assert_array_equal(flags, self.engine.text_flags(SEMANTIC_CORPUS))
+        self.assertEqual(self.matrix.capacity, 64)
+    
+    def test_sync_after_removal(self):
+        """Test that removed beliefs drop out of the matrix."""
+        for content in SEMANTIC_CORPUS:
+            self.monitor.add_belief(content)
+        self.monitor._sync_matrix(list(self.monitor.beliefs))
+        self.monitor.remove_belief(SEMANTIC_CORPUS[2])
+        self.monitor.add_belief("A brand new belief")
+        
+        contents = list(self.monitor.beliefs)
+        unit, flags = self.monitor._sync_matrix(contents)
+        self.assertEqual(self.matrix.size, len(contents))
+        expected = self.engine.normalize(self.engine.get_embeddings(contents))
+        np.testing.assert_allclose(unit[:], expected, atol=1e-6)
+        np.testing.assert_array_equal(flags, self.engine.text_flags(contents))
+    
+    def test_blocked_scores_match_pairwise(self):
+        """Test that blocked matrix scoring matches the per-pair reference."""
+        for content in SEMANTIC_CORPUS:
+            self.monitor.add_belief(content, confidence=0.5 + len(content) % 3 / 4)
+        self.monitor.SCORE_BLOCK = 3
+        
+        reference = semantic.SemanticHarmonyMonitor(embedding_backend=self.engine.backend)
+        for belief in self.monitor.beliefs.values():
+            reference.add_belief(belief.content, confidence=belief.confidence)
+        engine = reference.semantic_engine
+        reference.set_consistency_function(
+            lambda belief, system: engine.calculate_consistency(belief, system)
+        )
+        
+        self.assertAlmostEqual(self.monitor.calculate_consistency(),
+                               reference.calculate_consistency(), places=6)
+        matrix_pairs = self.monitor.get_inconsistencies(0.6)
+        pairwise = reference.get_inconsistencies(0.6)
+        self.assertTrue(matrix_pairs)
+        self.assertEqual([(a, b) for a, b, _ in matrix_pairs], [(a, b) for a, b, _ in pairwise])
+        np.testing.assert_allclose([c for *_, c in matrix_pairs], [c for *_, c in pairwise],
+                                   atol=1e-6)
+
+
+class TestNeighbourApproximation(unittest.TestCase):
+    """Test approximate nearest-neighbour scoring of H(t)."""
+    
+    CONTRADICTION = ("Honesty is always good for everyone", "Honesty is never good for everyone")
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        rng = np.random.default_rng(0)
+        vocabulary = [f"topic{i}" for i in range(60)] + ["help", "share", "learn", "respect"]
+        self.texts = [" ".join(rng.choice(vocabulary, 5)) for _ in range(300)]
+        self.texts = list(dict.fromkeys(self.texts)) + list(self.CONTRADICTION)
+        self.backend = semantic.HashingVectorizerBackend(dimension=256).fit(self.texts)
+        self.confidence = dict(zip(self.texts, rng.uniform(0.6, 1.0, len(self.texts))))
+    
+    def _monitor(self, **kwargs):
+        monitor = semantic.SemanticHarmonyMonitor(embedding_backend=self.backend, **kwargs)
+        for text in self.texts:
+            monitor.add_belief(text, confidence=self.confidence[text])
+        return monitor
+    
+    def _approximate(self, neighbours: int = 20):
+        monitor = self._monitor(neighbours=neighbours)
+        monitor.APPROXIMATE_MIN_BELIEFS = 0
+        monitor.SAMPLE_COLUMNS = 64
+        self.assertTrue(monitor._approximates(len(monitor.beliefs)))
+        return monitor
+    
+    def test_exact_below_minimum_size(self):
+        """Test that small systems keep the exact path despite neighbours."""
+        monitor = self._monitor(neighbours=20)
+        self.assertFalse(monitor._approximates(len(monitor.beliefs)))
+        self.assertEqual(monitor.calculate_consistency(), self._monitor().calculate_consistency())
+    
+    def test_approximate_H_close_to_exact(self):
+        """Test that the approximate H(t) stays near the exact one."""
+        exact = self._monitor().calculate_consistency()
+        approximate = self._approximate().calculate_consistency()
+        self.assertNotEqual(approximate, exact)
+        self.assertAlmostEqual(approximate, exact, delta=0.02)
+    
+    def test_neighbour_contradiction_reported(self):
+        """Test that a contradiction between neighbours is an inconsistency."""
+        pairs = [(a, b) for a, b, _ in self._approximate().get_inconsistencies(0.5)]
+        self.assertIn(self.CONTRADICTION, pairs)
+    
+    def test_neighbour_pairs_reused(self):
+        """Test that the index is built once per set of belief contents."""
+        monitor = self._approximate()
+        index = monitor._neighbour_index
+        builds = []
+        search = index.neighbours
+        index.neighbours = lambda unit, k: builds.append(len(unit)) or search(unit, k)
+        
+        monitor.calculate_consistency()
+        monitor.get_inconsistencies(0.5)
+        monitor.beliefs[self.texts[0]].confidence = 0.1
+        monitor.invalidate_cache()
+        monitor.calculate_consistency()
+        self.assertEqual(builds, [len(self.texts)])
+        
+        monitor.add_belief("A brand new belief")
+        monitor.calculate_consistency()
+        self.assertEqual(builds, [len(self.texts), len(self.texts) + 1])
+
+
+class _GatedBackend(_CountingBackend):
+    """Counting backend whose encode() waits for release, then may fail."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.error = None
+    
+    def encode(self, texts, batch_size=64):
+        self.started.set()
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return super().encode(texts, batch_size)
+
+
+class TestEmbeddingPrefetcher(unittest.TestCase):
+    """Test background embedding of added beliefs."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.backend = _GatedBackend(dimension=64).fit(SEMANTIC_CORPUS)
+        self.engine = semantic.SemanticConsistencyEngine(embedding_backend=self.backend)
+    
+    def _prefetcher(self, **kwargs) -> semantic.EmbeddingPrefetcher:
+        prefetcher = semantic.EmbeddingPrefetcher(self.engine, **kwargs)
+        self.addCleanup(self.backend.release.set)
+        self.addCleanup(prefetcher.close, 5)
+        return prefetcher
+    
+    def test_claim_takes_back_queued_texts(self):
+        """Test that claiming a queued text removes it without encoding it."""
+        prefetcher = self._prefetcher(linger=5.0)
+        prefetcher.submit(["Honesty is good", "Honesty is bad"])
+        prefetcher.claim(["Honesty is good"])
+        self.assertEqual(prefetcher.pending(), 1)
+        prefetcher.claim(["Honesty is bad", "Not submitted"])
+        self.assertEqual(prefetcher.pending(), 0)
+        
+        prefetcher.close(5)
+        self.assertFalse(prefetcher._thread.is_alive())
+        self.assertFalse(self.backend.started.is_set())
+        self.assertEqual(prefetcher.batches, 0)
+    
+    def test_claim_waits_for_texts_in_flight(self):
+        """Test that claiming a text being encoded waits for its batch."""
+        prefetcher = self._prefetcher(linger=0.0)
+        prefetcher.submit(["Honesty is good"])
+        self.assertTrue(self.backend.started.wait(5))
+        claimer = threading.Thread(target=prefetcher.claim, args=(["Honesty is good"],))
+        claimer.start()
+        claimer.join(0.1)
+        self.assertTrue(claimer.is_alive())
+        
+        self.backend.release.set()
+        claimer.join(5)
+        self.assertFalse(claimer.is_alive())
+        self.assertIn("Honesty is good", self.engine._embedding_cache)
+        self.engine.get_embedding("Honesty is good")
+        self.assertEqual(self.backend.encoded, 1)
+        self.assertEqual((prefetcher.batches, prefetcher.encoded), (1, 1))
+    
+    def test_failed_batch_raises_on_claim(self):
+        """Test that a background failure surfaces on the request path."""
+        prefetcher = self._prefetcher(linger=0.0)
+        self.backend.error = OSError("encoder crashed")
+        self.backend.release.set()
+        prefetcher.submit(["Honesty is good", "Honesty is bad"])
+        self.assertTrue(self.backend.started.wait(5))
+        
+        prefetcher.claim(["Help people in need"])
+        with self.assertRaisesRegex(OSError, "encoder crashed"):
+            prefetcher.claim(["Honesty is bad"])
+        # Reported once: a retry encodes on the caller's path
+        prefetcher.claim(["Honesty is bad"])
+        self.backend.error = None
+        prefetcher.submit(["Honesty is good"])
+        prefetcher.claim(["Honesty is good"])
+    
+    def _wait_idle(self, prefetcher: semantic.EmbeddingPrefetcher):
+        for _ in range(500):
+            if not prefetcher.pending():
+                return
+            threading.Event().wait(0.01)
+        self.fail("prefetcher still busy")
+    
+    def test_forgotten_failures_are_dropped(self):
+        """Test that errors of texts that will never be claimed are not kept."""
+        prefetcher = self._prefetcher(linger=0.0)
+        self.backend.error = OSError("encoder crashed")
+        prefetcher.submit(["Honesty is good", "Honesty is bad"])
+        self.assertTrue(self.backend.started.wait(5))
+        # Forgotten while in flight, then after the batch failed
+        prefetcher.forget(["Honesty is good"])
+        self.backend.release.set()
+        self._wait_idle(prefetcher)
+        self.assertEqual(set(prefetcher._failed), {"Honesty is bad"})
+        prefetcher.forget(["Honesty is bad"])
+        self.assertEqual(prefetcher._failed, {})
+        prefetcher.claim(["Honesty is good", "Honesty is bad"])
+    
+    def test_removed_beliefs_forgotten(self):
+        """Test that removing a belief drops its queued text or kept error."""
+        self.backend.error = OSError("encoder crashed")
+        self.backend.release.set()
+        with semantic.SemanticHarmonyMonitor(embedding_backend=self.backend,
+                                             prefetch_on_add=True) as monitor:
+            prefetcher = monitor._prefetcher
+            monitor.add_belief("Honesty is good")
+            self._wait_idle(prefetcher)
+            self.assertIn("Honesty is good", prefetcher._failed)
+            monitor.remove_belief("Honesty is good")
+            self.assertEqual(prefetcher._failed, {})
+    
+    def test_monitor_and_checker_close(self):
+        """Test that closing the monitor or checker stops the worker thread."""
+        with semantic.SemanticHarmonyMonitor(embedding_backend=self.backend,
+                                             prefetch_on_add=True) as monitor:
+            self.backend.release.set()
+            monitor.add_belief("Honesty is good")
+            monitor.add_belief("Honesty is bad")
+            self.assertTrue(0.0 <= monitor.calculate_consistency() <= 1.0)
+            worker = monitor._prefetcher._thread
+            self.assertTrue(worker.is_alive())
+        self.assertFalse(worker.is_alive())
+        
+        with semantic.SachiConsistencyCheckerV32(embedding_backend=self.backend,
+                                                 prefetch_on_add=True) as checker:
+            checker.harmony.add_belief("Help people in need")
+            worker = checker.harmony._prefetcher._thread
+        self.assertFalse(worker.is_alive())
 
 
 class TestMathematicalProperties(unittest.TestCase):
@@ -604,6 +2377,25 @@ def run_all_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestGrowthTracker))
     suite.addTests(loader.loadTestsFromTestCase(TestValueConsistencyMonitor))
     suite.addTests(loader.loadTestsFromTestCase(TestSachiConsistencyChecker))
+    suite.addTests(loader.loadTestsFromTestCase(TestStateJournal))
+    suite.addTests(loader.loadTestsFromTestCase(TestColumnarSnapshot))
+    suite.addTests(loader.loadTestsFromTestCase(TestStreamingImport))
+    suite.addTests(loader.loadTestsFromTestCase(TestSQLiteStateStore))
+    suite.addTests(loader.loadTestsFromTestCase(TestIndexCheckpoint))
+    suite.addTests(loader.loadTestsFromTestCase(TestConcurrency))
+    suite.addTests(loader.loadTestsFromTestCase(TestSessionPool))
+    suite.addTests(loader.loadTestsFromTestCase(TestShardedCheckerRuntime))
+    suite.addTests(loader.loadTestsFromTestCase(TestSemanticState))
+    suite.addTests(loader.loadTestsFromTestCase(TestHashingVectorizerBackend))
+    suite.addTests(loader.loadTestsFromTestCase(TestLazyModelLoading))
+    suite.addTests(loader.loadTestsFromTestCase(TestSemanticScoring))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchedEmbeddings))
+    suite.addTests(loader.loadTestsFromTestCase(TestEmbeddingCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestQuantizedEmbeddings))
+    suite.addTests(loader.loadTestsFromTestCase(TestDiskEmbeddingStore))
+    suite.addTests(loader.loadTestsFromTestCase(TestBeliefEmbeddingMatrix))
+    suite.addTests(loader.loadTestsFromTestCase(TestNeighbourApproximation))
+    suite.addTests(loader.loadTestsFromTestCase(TestEmbeddingPrefetcher))
     suite.addTests(loader.loadTestsFromTestCase(TestMathematicalProperties))
     suite.addTests(loader.loadTestsFromTestCase(TestIntegrationScenarios))
     